@@ -3,13 +3,30 @@ import requests
 import re
 import time
 import json
+import os
+import hashlib
+import random
+import unicodedata
+import bisect
 import argparse
 import sys
+import heapq
+import math
+import threading
+import sqlite3
+from enum import IntFlag
 from googletrans import Translator
 from collections import Counter, defaultdict
-
-# Initialize translator
-translator = Translator()
+from xml.parsers import expat
+from functools import lru_cache
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, wait
+import multiprocessing
+import numpy as np
+try:
+    import resource  # Unix only, used to report peak memory
+except ImportError:
+    resource = None
 
 # ANSI color codes for terminal output
 class Colors:
@@ -22,20 +39,27 @@ class Colors:
     BOLD = '\033[1m'        # Bold text
     RESET = '\033[0m'       # Reset to default
 
-def safe_api_call(url, headers=None, max_retries=3):
-    """Make a safe API call with rate limiting, retry logic, and call counting"""
+class ApiBudgetExhausted(Exception):
+    """Raised by safe_api_call once MAX_TOTAL_API_CALLS calls have been made this run"""
+
+def safe_api_call(url, headers=None, max_retries=3, stream=False):
+    """Make a safe API call with rate limiting, retry logic, and call counting (stream=True leaves the body unread)"""
     global api_call_count
     
     # Check if we've reached the maximum API call limit
     if api_call_count >= MAX_TOTAL_API_CALLS:
         colored_print(f"🛑 Reached maximum API call limit ({MAX_TOTAL_API_CALLS}). Stopping to be respectful to BGG servers.", Colors.YELLOW)
-        raise Exception(f"API call limit reached ({MAX_TOTAL_API_CALLS})")
+        raise ApiBudgetExhausted(f"API call limit reached ({MAX_TOTAL_API_CALLS})")
     
     if headers is None:
         headers = {"User-Agent": "Mozilla/5.0 (BGG Marvel Champions Analyzer - Respectful Bot)"}
     
     for attempt in range(max_retries):
         try:
+            # In work queue workers the call is first claimed from the budget shared by all workers
+            if api_call_gate is not None:
+                api_call_gate()
+            
             # Increment API call counter
             api_call_count += 1
             
@@ -43,7 +67,7 @@ def safe_api_call(url, headers=None, max_retries=3):
                 colored_print(f"📊 API calls made: {api_call_count}/{MAX_TOTAL_API_CALLS}", Colors.CYAN)
             
             # Make the API call
-            response = requests.get(url, headers=headers)
+            response = requests.get(url, headers=headers, stream=stream)
             response.raise_for_status()
             
             # Apply base delay
@@ -68,15 +92,39 @@ def colored_print(text, color=Colors.RESET):
     """Print text with color"""
     print(f"{color}{text}{Colors.RESET}")
 
-def status_colored_print(original, translated, status_info):
+class HeroStatus(IntFlag):
+    """How a hero entry was found and matched; merged across plays and users with |"""
+    OFFICIAL = 1
+    TRANSLATED = 2
+    UNMATCHED = 4
+    FUZZY_MATCHED = 8
+    ALTERED_HERO = 16
+    FROM_COMMENTS = 32
+    NO_PLAYERS = 64
+    EMPTY_PLAYERS = 128
+    EMPTY_COLOR = 256
+
+def format_status(status):
+    """Status flags as the 'OFFICIAL|TRANSLATED' style string shown in reports"""
+    return '|'.join(sorted(flag.name for flag in HeroStatus if flag & status))
+
+def status_play_counts(hero_results):
+    """Plays per status flag over hero results, summed with one vectorized pass per flag"""
+    if not hero_results:
+        return {flag: 0 for flag in HeroStatus}
+    statuses = np.fromiter((hero['status'] for hero in hero_results), dtype=np.int64, count=len(hero_results))
+    play_counts = np.fromiter((hero['play_count'] for hero in hero_results), dtype=np.int64, count=len(hero_results))
+    return {flag: int(play_counts[(statuses & flag) != 0].sum()) for flag in HeroStatus}
+
+def status_colored_print(original, translated, status):
     """Print translation/matching info with appropriate colors"""
-    if "TRANSLATED" in status_info and "OFFICIAL" in status_info:
+    if HeroStatus.TRANSLATED in status and HeroStatus.OFFICIAL in status:
         colored_print(f"  ✅ Translated & Matched: '{original}' → '{translated}'", Colors.GREEN)
-    elif "TRANSLATED" in status_info:
+    elif HeroStatus.TRANSLATED in status:
         colored_print(f"  🔄 Translated: '{original}' → '{translated}'", Colors.YELLOW)
-    elif "OFFICIAL" in status_info and "FUZZY_MATCHED" in status_info:
+    elif HeroStatus.OFFICIAL in status and HeroStatus.FUZZY_MATCHED in status:
         colored_print(f"  🎯 Fuzzy Matched: '{original}' → '{translated}'", Colors.BLUE)
-    elif "OFFICIAL" in status_info:
+    elif HeroStatus.OFFICIAL in status:
         colored_print(f"  ✅ Official Match: '{original}'", Colors.GREEN)
     else:
         colored_print(f"  ❌ Unmatched: '{original}' → '{translated}'", Colors.RED)
@@ -89,12 +137,114 @@ MAX_TOTAL_API_CALLS = 100  # Maximum total API calls per run (safety limit)
 MAX_RETRIES = 3    # Maximum retries for failed API calls
 BACKOFF_MULTIPLIER = 2.0  # Exponential backoff multiplier for retries
 BATCH_PROGRESS_INTERVAL = 50  # Show progress every N plays for large datasets (more frequent)
+CLEAN_CACHE_SIZE = 4096  # Distinct raw color strings memoized by clean_hero_name
+FUZZY_NGRAM_SIZE = 3  # Character n-gram size for the fuzzy name index
+FUZZY_MIN_SCORE = 0.5  # Minimum edit-distance similarity for a fuzzy match
+FUZZY_MAX_CANDIDATES = 50  # Candidates taken from the n-gram index before scoring
+COMMENT_MAX_CHARS = 10000  # Longest prefix of a play comment that is parsed for heroes
+COMMENT_MAX_CANDIDATE_CHARS = 40  # Longer comment spans can't be hero names and are skipped
+RECENT_PLAY_PAGES = 5  # Pages of recent plays fetched for the multi-user analysis (--pages)
+STREAM_CHUNK_SIZE = 64 * 1024  # Bytes read at a time from a streamed plays page (--stream)
+PIPELINE_BATCH_SIZE = 100  # Plays buffered before they go to the aggregator as per-user batches (--stream)
+CHECKPOINT_INTERVAL = 5  # Pages fetched between crawl checkpoint writes (--resume)
+CRAWL_HOURLY_BUDGET = 60  # API calls per rolling hour for the crawl subcommand (--hourly-budget)
+CRAWL_FEED_INTERVAL = 900  # Seconds between polls of the global recent-plays feed in the crawl
+CRAWL_NEW_USER_PLAYS = 10.0  # Expected new plays assumed for a user the crawl hasn't synced yet
+CRAWL_MIN_EXPECTED_PLAYS = 1.0  # Users expected to have fewer new plays wait for a later round
+CRAWL_RATE_SMOOTHING = 0.5  # Weight of the latest sync in a user's plays-per-day estimate
+CRAWL_IDLE_SLEEP = 60  # Seconds the crawl waits when no user is due
+FETCH_WORKERS = 1  # Worker processes fetching recent plays pages through the SQLite work queue (--workers)
+WORK_QUEUE_LEASE = 120  # Seconds a worker holds a task (renewed after each page) before it is re-queued for another worker
+WORK_QUEUE_POLL_INTERVAL = 0.5  # Seconds an idle worker waits while other workers still hold leases
+KEEP_PLAY_XML = False  # Keep each play's raw XML on its record for diagnostics (on with --debug)
+DIAGNOSTIC_SAMPLE_SIZE = 3  # Skipped-play examples kept per category (reservoir sample)
+
+# Configuration for on-disk caches
+CACHE_DIR = '.bggscrape_cache'  # Directory for caches that persist across runs
+RESOLUTION_CACHE_FILE = 'resolution_cache.json'  # Raw color string -> resolved hero
+TRANSLATION_CACHE_FILE = 'translation_cache.json'  # Source text -> Google Translate output
+TRANSLATION_CACHE_VERSION = 1  # Bump when the translation cache format changes
+USER_PARTIALS_FILE = 'user_partials.json'  # User id -> hash of their analyzed plays and the extraction result
+USER_PARTIALS_VERSION = 1  # Bump when the stored per-user result format changes
+CRAWL_CHECKPOINT_FILE = 'crawl_checkpoint.json'  # Progress of an unfinished recent-plays crawl (--resume)
+CRAWL_CHECKPOINT_VERSION = 1  # Bump when the checkpoint format changes
+CRAWL_STATE_FILE = 'crawl_state.json'  # Crawl subcommand: per-user sync times, play rates and the API calls of the last hour
+CRAWL_PLAYS_DIR = 'crawl_plays'  # Crawl subcommand: one file of synced plays per user
+CRAWL_STATE_VERSION = 1  # Bump when the crawl state format changes
+WORK_QUEUE_FILE = 'work_queue.sqlite'  # SQLite (WAL) queue of fetch tasks shared by the --workers processes of a run
+RESOLUTION_CACHE_ENABLED = True  # Disable with --no-cache (covers all on-disk caches)
+TRANSLATION_DELAY = 0.1  # Pause after each Google Translate request
+TRANSLATION_BATCH_SIZE = 20  # Names joined into one Google Translate request when prefetching
+TRANSLATION_WORKERS = 4  # Concurrent Google Translate requests when prefetching
+TRANSLATION_TIMEOUT = 10.0  # Seconds allowed for one Google Translate request
+TRANSLATION_BREAKER_THRESHOLD = 3  # Consecutive translation failures before pausing translation
+TRANSLATION_BREAKER_COOLDOWN = 300.0  # Seconds before translation is retried after the breaker opens
+RESOLVER_RULE_VERSION = 4  # Bump when cleaning/translation/matching rules change
+RESOLUTION_ORDER = ['exact', 'alias', 'lexicon', 'fuzzy', 'remote']  # Resolution cascade tiers, cheapest first (--resolution-order)
+RESOLUTION_FUZZY_MIN_SCORE = 0.85  # The fuzzy tier only accepts near-certain matches
+RESOLUTION_WORKERS = 1  # Threads resolving distinct color values (only helps when resolution waits on the network)
+EXTRACTION_JOBS = 1  # Worker processes extracting users' plays in the multi-user analysis (--jobs)
+HERO_LEXICON_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'hero_lexicon.json')  # Localized hero names
 
 # Configuration for debug output
 TERMINAL_DEBUG = True  # Set to True to enable detailed XML dumps and verbose output
 
 # Global counter for API calls (for monitoring and limiting)
 api_call_count = 0
+api_call_gate = None  # Set in work queue workers to claim each API call from the shared budget
+
+# Initialize translator
+translator = Translator(timeout=TRANSLATION_TIMEOUT)
+
+class CircuitBreaker:
+    """
+    Stops calling a failing service after repeated errors and retries after a cooldown.
+
+    Closed: every call is allowed. Open (failure_threshold failures in a row): no
+    calls until the cooldown has passed. Half-open: exactly one probe call is let
+    through and every other caller is turned away until the probe's outcome is
+    recorded; success closes the breaker, failure opens it for another cooldown.
+    """
+    
+    def __init__(self, name, failure_threshold, cooldown):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.failures = 0
+        self.opened_at = None
+        self.probing = False  # Half-open with the probe call in flight
+        self._lock = threading.Lock()
+    
+    def allow(self):
+        """Return True if a call may be attempted now"""
+        with self._lock:
+            if self.probing:
+                return False
+            if self.opened_at is None:
+                return True
+            if time.monotonic() - self.opened_at >= self.cooldown:
+                self.probing = True
+                return True
+            return False
+    
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self.probing = False
+    
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.probing:
+                self.probing = False
+                self.opened_at = time.monotonic()
+                colored_print(f"⚡ {self.name} is still failing - pausing it for another {self.cooldown:.0f}s", Colors.YELLOW)
+            elif self.failures >= self.failure_threshold and self.opened_at is None:
+                self.opened_at = time.monotonic()
+                colored_print(f"⚡ {self.name} failed {self.failures} times in a row - pausing it for {self.cooldown:.0f}s", Colors.YELLOW)
+
+translation_breaker = CircuitBreaker('Google Translate', TRANSLATION_BREAKER_THRESHOLD, TRANSLATION_BREAKER_COOLDOWN)
 
 # Load official hero names from the GitHub repository
 def load_official_hero_names():
@@ -149,42 +299,206 @@ def load_official_villain_names():
         print(f"Error loading official villain names: {e}")
         return [], {}
 
-def is_villain_name(name):
-    """Check if a name matches known villains"""
-    if not name:
-        return False
-    
-    normalized = name.lower().strip()
-    
-    # Check against villain list
-    if normalized in VILLAIN_LOOKUP:
-        return True
+# Substrings that mark a name as a villain, scenario or game mode rather than a hero
+VILLAIN_NAME_KEYWORDS = [
+    'vs ', ' vs', 'versus',
+    'villain', 'boss', 'enemy',
+    'scenario', 'campaign', 'mission'
+]
+
+_villain_matcher = None
+
+def get_villain_matcher():
+    """
+    Build the villain/scenario matcher once per villain list.
+
+    Spellings come from VILLAIN_LOOKUP plus the comment villain patterns; a
+    comment spelling that is also a hero spelling (e.g. "nebula") is left out
+    as ambiguous. 'names' maps every spelling to its canonical villain and is
+    used for exact name checks, 'comment_names' is the subset safe to look for
+    inside free-text comments.
+    """
+    global _villain_matcher
+    key = (id(VILLAIN_LOOKUP), len(VILLAIN_LOOKUP), id(HERO_LOOKUP), len(HERO_LOOKUP))
+    if _villain_matcher is not None and _villain_matcher['key'] == key:
+        return _villain_matcher
     
-    # Check for common villain patterns
-    villain_patterns = [
-        'vs ', ' vs', 'versus',
-        'villain', 'boss', 'enemy',
-        'scenario', 'campaign', 'mission'
-    ]
+    hero_spellings = set(HERO_LOOKUP)
+    for pattern in COMMENT_HERO_PATTERNS:
+        hero_spellings.update(_pattern_alternatives(pattern))
     
-    for pattern in villain_patterns:
-        if pattern in normalized:
-            return True
+    names = dict(VILLAIN_LOOKUP)
+    for pattern, villain_name in COMMENT_VILLAIN_PATTERNS.items():
+        canonical = VILLAIN_LOOKUP.get(villain_name.lower(), villain_name)
+        for spelling in _pattern_alternatives(pattern):
+            if spelling not in hero_spellings:
+                names.setdefault(spelling, canonical)
     
-    return False
+    _villain_matcher = {
+        'key': key,
+        'names': names,
+        'comment_names': {spelling: name for spelling, name in names.items() if spelling not in hero_spellings},
+        'keywords': re.compile('|'.join(re.escape(keyword) for keyword in VILLAIN_NAME_KEYWORDS)),
+        'memo': {}
+    }
+    return _villain_matcher
+
+def match_villain(name):
+    """
+    Match a name against the villain/scenario matcher.
+
+    Returns (is_villain, villain_name): villain_name is the canonical villain
+    for a known spelling and None when only a keyword ("vs", "scenario", ...)
+    marks the name as a non-hero.
+    """
+    if not name:
+        return False, None
+    matcher = get_villain_matcher()
+    normalized = name.lower().strip()
+    result = matcher['memo'].get(normalized)
+    if result is None:
+        villain_name = matcher['names'].get(normalized)
+        if villain_name is not None:
+            result = (True, villain_name)
+        else:
+            result = (matcher['keywords'].search(normalized) is not None, None)
+        matcher['memo'][normalized] = result
+    return result
+
+def is_villain_name(name):
+    """Check if a name matches known villains"""
+    return match_villain(name)[0]
 
 # Load the official hero and villain names
-OFFICIAL_HEROES, HERO_LOOKUP = load_official_hero_names()
-OFFICIAL_VILLAINS, VILLAIN_LOOKUP = load_official_villain_names()
-colored_print(f"✅ Loaded {len(OFFICIAL_HEROES)} official hero names", Colors.GREEN)
-colored_print(f"✅ Loaded {len(OFFICIAL_VILLAINS)} official villain names", Colors.GREEN)
+# (--jobs worker processes skip the download and get the parent's lists, see _init_extraction_worker)
+if multiprocessing.current_process().name == 'MainProcess':
+    OFFICIAL_HEROES, HERO_LOOKUP = load_official_hero_names()
+    OFFICIAL_VILLAINS, VILLAIN_LOOKUP = load_official_villain_names()
+    colored_print(f"✅ Loaded {len(OFFICIAL_HEROES)} official hero names", Colors.GREEN)
+    colored_print(f"✅ Loaded {len(OFFICIAL_VILLAINS)} official villain names", Colors.GREEN)
+else:
+    OFFICIAL_HEROES, HERO_LOOKUP = [], {}
+    OFFICIAL_VILLAINS, VILLAIN_LOOKUP = [], {}
 
-def match_to_official_hero(hero_name):
-    """Match a hero name to the official hero list, including AH (Altered Heroes) handling"""
-    if not hero_name:
-        return None, False, False, False
-    
-    # Check for AH (Altered Heroes) convention first
+# Common hero name variations, applied to the lower-cased name before lookup
+HERO_ALIASES = {
+    # Spider-Man variants - normalize all to the official list version
+    'spiderman': 'spidey',  # Spidey is in the official list
+    'spider-man': 'spidey', 
+    'spider man': 'spidey',
+    'spider-woman': 'spiderwoman',
+    'spider woman': 'spiderwoman',
+    # Miles Morales handling - he's a separate hero
+    'miles morales': 'miles morales',
+    'spider-man - miles morales': 'miles morales',
+    'spider-man - miles morales (aggr': 'miles morales',  # Handle truncated version
+    # Other common variants
+    'ant-man': 'ant man',
+    'ant man': 'ant man',
+    'dr strange': 'dr. strange',
+    'dr. strange': 'dr strange',
+    'doctor strange': 'dr strange',
+    # War Machine / Iron Man variants
+    'war machine': 'war machine',
+    'iron man': 'iron man',
+    # Captain variants
+    'captain america': 'captain america',
+    'captain marvel': 'captain marvel',
+    'cap marvel': 'captain marvel',  # Captain Marvel nickname
+    'capmarv': 'captain marvel',     # Captain Marvel abbreviation
+    # Wolverine variants
+    'wolverine': 'wolverine',
+    'wolvie': 'wolverine',
+    # Black Panther variants
+    'black panther': 'black panther',
+    'panther': 'black panther',      # Black Panther nickname
+    # Nick Fury variants
+    'nickfury': 'nick fury',
+    'nick fury': 'nick fury',
+    # Drax variants
+    'drax': 'drax',
+    'drax the destroyer': 'drax',
+    # Other heroes that might be missing
+    'falcon': 'falcon',
+    'adam warlock': 'adam warlock',
+    'spectrum': 'spectrum',
+}
+
+# Special handling for heroes we know should match but aren't in the official list
+# These might be newer heroes or need to be added to the GitHub list
+KNOWN_HEROES = {
+    'falcon': 'Falcon',
+    'adam warlock': 'Adam Warlock', 
+    'spectrum': 'Spectrum',
+    'miles morales': 'Miles Morales',
+    'black panther': 'Black Panther',
+    'captain marvel': 'Captain Marvel',
+    'drax': 'Drax',
+    # Handle Spider-Man variants that should all be treated as the same character
+    'spidey': 'Spider-Man',  # Use the most common name
+    'spider-man': 'Spider-Man',
+    'spiderman': 'Spider-Man',
+}
+
+# Resolver index built from OFFICIAL_HEROES/HERO_LOOKUP plus the alias tables
+_hero_resolver_index = None
+_hero_resolver_source = None
+
+def _squash_hero_key(key):
+    """Drop hyphens, dots and spaces from a lower-cased hero key"""
+    return key.replace('-', '').replace('.', '').replace(' ', '')
+
+def build_hero_resolver_index(official_heroes, hero_lookup):
+    """
+    Build the lookup tables used by match_to_official_hero.
+
+    'forms' maps every lower-cased key form (official name variants, aliases
+    and known heroes) straight to an (official_name, was_fuzzy, is_known)
+    entry, or None when the alias is known not to resolve. 'squashed' maps
+    names with hyphens, dots and spaces removed, which covers every other
+    spelling variation the old per-call variation list tried.
+    """
+    squashed = {key: hero for key, hero in hero_lookup.items() if key == _squash_hero_key(key)}
+    spider_fallback = hero_lookup.get('spider-man') or hero_lookup.get('spidey')
+
+    def resolve(normalized):
+        if normalized in hero_lookup:
+            return hero_lookup[normalized], False, False
+        squashed_hit = squashed.get(_squash_hero_key(normalized))
+        if squashed_hit:
+            return squashed_hit, True, False
+        # Handle case variations for Spider-Man specifically
+        if spider_fallback and 'spider' in normalized and 'man' in normalized:
+            return spider_fallback, True, False
+        if normalized in KNOWN_HEROES:
+            return KNOWN_HEROES[normalized], True, True
+        return None
+
+    forms = {key: (hero, False, False) for key, hero in hero_lookup.items()}
+    for key in KNOWN_HEROES:
+        forms.setdefault(key, resolve(key))
+    # Aliases are applied before any lookup, so they take precedence
+    for alias, target in HERO_ALIASES.items():
+        forms[alias] = resolve(target)
+
+    return {
+        'official': frozenset(official_heroes),
+        'forms': forms,
+        'squashed': squashed,
+        'spider_fallback': spider_fallback
+    }
+
+def get_hero_resolver_index():
+    """Return the hero resolver index, rebuilding it if the official list has changed"""
+    global _hero_resolver_index, _hero_resolver_source
+    source = (id(OFFICIAL_HEROES), len(OFFICIAL_HEROES), id(HERO_LOOKUP), len(HERO_LOOKUP))
+    if _hero_resolver_index is None or source != _hero_resolver_source:
+        _hero_resolver_index = build_hero_resolver_index(OFFICIAL_HEROES, HERO_LOOKUP)
+        _hero_resolver_source = source
+    return _hero_resolver_index
+
+def split_altered_hero(hero_name):
+    """Split the AH (Altered Heroes) convention into (base_name, is_altered)"""
     is_altered = False
     base_name = hero_name
     if hero_name.lower().startswith('ah - ') or hero_name.lower().startswith('ah-'):
@@ -197,101 +511,127 @@ def match_to_official_hero(hero_name):
         
         if TERMINAL_DEBUG:
             colored_print(f"  🔄 Altered Hero detected: '{hero_name}' → base: '{base_name}'", Colors.BLUE)
-    
-    # Try exact match first (on base name for AH heroes)
-    if base_name in OFFICIAL_HEROES:
-        return base_name, True, False, is_altered
-    
-    # Try normalized matches
+    return base_name, is_altered
+
+def lookup_hero_forms(index, base_name):
+    """Resolve normalized, alias, known-hero and squashed forms to an (official_name, was_fuzzy, is_known) entry"""
     normalized = base_name.lower().strip()
+    if normalized in index['forms']:
+        return index['forms'][normalized]
+    squashed_hit = index['squashed'].get(_squash_hero_key(normalized))
+    if squashed_hit:
+        return squashed_hit, True, False
+    if index['spider_fallback'] and 'spider' in normalized and 'man' in normalized:
+        return index['spider_fallback'], True, False
+    return None
+
+def match_to_official_hero(hero_name):
+    """Match a hero name to the official hero list, including AH (Altered Heroes) handling"""
+    if not hero_name:
+        return None, False, False, False
     
-    # Handle common hero name variations
-    hero_normalizations = {
-        # Spider-Man variants - normalize all to the official list version
-        'spiderman': 'spidey',  # Spidey is in the official list
-        'spider-man': 'spidey', 
-        'spider man': 'spidey',
-        'spider-woman': 'spiderwoman',
-        'spider woman': 'spiderwoman',
-        # Miles Morales handling - he's a separate hero
-        'miles morales': 'miles morales',
-        'spider-man - miles morales': 'miles morales',
-        'spider-man - miles morales (aggr': 'miles morales',  # Handle truncated version
-        # Other common variants
-        'ant-man': 'ant man',
-        'ant man': 'ant man',
-        'dr strange': 'dr. strange',
-        'dr. strange': 'dr strange',
-        'doctor strange': 'dr strange',
-        # War Machine / Iron Man variants
-        'war machine': 'war machine',
-        'iron man': 'iron man',
-        # Captain variants
-        'captain america': 'captain america',
-        'captain marvel': 'captain marvel',
-        'cap marvel': 'captain marvel',  # Captain Marvel nickname
-        'capmarv': 'captain marvel',     # Captain Marvel abbreviation
-        # Wolverine variants
-        'wolverine': 'wolverine',
-        'wolvie': 'wolverine',
-        # Black Panther variants
-        'black panther': 'black panther',
-        'panther': 'black panther',      # Black Panther nickname
-        # Nick Fury variants
-        'nickfury': 'nick fury',
-        'nick fury': 'nick fury',
-        # Drax variants
-        'drax': 'drax',
-        'drax the destroyer': 'drax',
-        # Other heroes that might be missing
-        'falcon': 'falcon',
-        'adam warlock': 'adam warlock',
-        'spectrum': 'spectrum',
-    }
+    # Check for AH (Altered Heroes) convention first
+    base_name, is_altered = split_altered_hero(hero_name)
     
-    # Apply hero normalizations
-    if normalized in hero_normalizations:
-        normalized = hero_normalizations[normalized]
-    
-    # Try various normalized forms with case-insensitive matching
-    variations = [
-        normalized,
-        normalized.replace('-', ' '),
-        normalized.replace('.', ''),
-        normalized.replace(' ', ''),
-        normalized.replace('-', '').replace('.', '').replace(' ', ''),
-        # Handle case variations for Spider-Man specifically
-        'spider-man' if 'spider' in normalized and 'man' in normalized else normalized,
-        'spidey' if 'spider' in normalized and 'man' in normalized else normalized,
-    ]
+    index = get_hero_resolver_index()
     
-    for variation in variations:
-        if variation in HERO_LOOKUP:
-            official_name = HERO_LOOKUP[variation]
-            return official_name, True, variation != normalized, is_altered
-    
-    # Special handling for heroes we know should match but aren't in the official list
-    # These might be newer heroes or need to be added to the GitHub list
-    known_heroes = {
-        'falcon': 'Falcon',
-        'adam warlock': 'Adam Warlock', 
-        'spectrum': 'Spectrum',
-        'miles morales': 'Miles Morales',
-        'black panther': 'Black Panther',
-        'captain marvel': 'Captain Marvel',
-        'drax': 'Drax',
-        # Handle Spider-Man variants that should all be treated as the same character
-        'spidey': 'Spider-Man',  # Use the most common name
-        'spider-man': 'Spider-Man',
-        'spiderman': 'Spider-Man',
-    }
+    # Try exact match first (on base name for AH heroes)
+    if base_name in index['official']:
+        return base_name, True, False, is_altered
     
-    if normalized in known_heroes:
-        colored_print(f"  🔧 Known hero not in official list: '{base_name}' → '{known_heroes[normalized]}'", Colors.BLUE)
-        return known_heroes[normalized], True, True, is_altered
+    # Normalized, alias and known-hero forms resolve with a single lookup
+    entry = lookup_hero_forms(index, base_name)
+    if entry is None:
+        # No match found
+        return base_name, False, False, is_altered
     
-    # No match found
-    return base_name, False, False, is_altered
+    official_name, was_fuzzy, is_known = entry
+    if is_known:
+        colored_print(f"  🔧 Known hero not in official list: '{base_name}' → '{official_name}'", Colors.BLUE)
+    return official_name, True, was_fuzzy, is_altered
+
+# Offline hero lexicon: the languages consulted for each Unicode script
+LEXICON_SCRIPT_LANGUAGES = {
+    'latin': ['es', 'pt', 'fr', 'de'],
+    'han': ['zh'],
+    'hangul': ['ko'],
+}
+# Scripts whose unknown names are sent to Google Translate
+REMOTE_TRANSLATION_SCRIPTS = {'han', 'hangul', 'kana', 'cyrillic'}
+_LIGATURES = str.maketrans({'œ': 'oe', 'Œ': 'OE', 'æ': 'ae', 'Æ': 'AE'})
+_hero_lexicon = None
+
+def detect_script(text):
+    """Return the dominant Unicode script of the letters in text, or None if it has no letters"""
+    counts = Counter()
+    for char in text:
+        if not char.isalpha():
+            continue
+        if char < '\u0080':
+            counts['latin'] += 1
+            continue
+        name = unicodedata.name(char, '')
+        if name.startswith('LATIN'):
+            counts['latin'] += 1
+        elif name.startswith('CJK'):
+            counts['han'] += 1
+        elif name.startswith('HANGUL'):
+            counts['hangul'] += 1
+        elif name.startswith(('HIRAGANA', 'KATAKANA')):
+            counts['kana'] += 1
+        elif name.startswith('CYRILLIC'):
+            counts['cyrillic'] += 1
+        else:
+            counts['other'] += 1
+    return counts.most_common(1)[0][0] if counts else None
+
+def strip_accents(text):
+    """Fold accented letters and ligatures to plain letters ('Halcón' -> 'Halcon')"""
+    decomposed = unicodedata.normalize('NFKD', text.translate(_LIGATURES))
+    return ''.join(char for char in decomposed if not unicodedata.combining(char))
+
+def lexicon_key(text):
+    """Accent-, case-, space- and punctuation-insensitive lexicon key"""
+    return ''.join(char for char in strip_accents(text).casefold() if char.isalnum())
+
+def load_hero_lexicon():
+    """Load the versioned hero lexicon once and index it by script and folded key"""
+    global _hero_lexicon
+    if _hero_lexicon is not None:
+        return _hero_lexicon
+    _hero_lexicon = {'version': None, 'scripts': {script: {} for script in LEXICON_SCRIPT_LANGUAGES}}
+    try:
+        with open(HERO_LEXICON_FILE, encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError) as e:
+        colored_print(f"⚠️  Could not load hero lexicon: {e}", Colors.YELLOW)
+        return _hero_lexicon
+    
+    _hero_lexicon['version'] = data.get('version')
+    languages = data.get('languages', {})
+    for script, script_languages in LEXICON_SCRIPT_LANGUAGES.items():
+        index = _hero_lexicon['scripts'][script]
+        for language in script_languages:
+            for name, english in languages.get(language, {}).items():
+                # Earlier languages win when two share a spelling
+                index.setdefault(lexicon_key(name), (english, language))
+    return _hero_lexicon
+
+def lookup_hero_lexicon(name, script=None):
+    """Return (english_name, language) from the lexicon for the name's script, or None"""
+    index = load_hero_lexicon()['scripts'].get(script or detect_script(name))
+    if not index:
+        return None
+    return index.get(lexicon_key(name))
+
+def needs_remote_translation(name):
+    """True if only Google Translate can help with this name (unknown CJK/Cyrillic text)"""
+    script = detect_script(name)
+    return script in REMOTE_TRANSLATION_SCRIPTS and lookup_hero_lexicon(name, script) is None
+
+
+# Words in a machine translation that mark the name as a villain or scenario
+TRANSLATED_VILLAIN_KEYWORDS = ['villain', 'boss', 'enemy', 'scheme', 'escape', 'siege', 'attack']
 
 def translate_hero_name(hero_name):
     """Translate non-English hero names to English and filter out villains"""
@@ -304,82 +644,33 @@ def translate_hero_name(hero_name):
             colored_print(f"  🦹 Villain detected: '{hero_name}' - filtering out", Colors.MAGENTA)
         return None, False  # Return None to indicate this should be filtered
     
-    was_translated = False
-    
-    # Manual translations for Marvel character names
-    translations = {
-        # Spanish heroes
-        'Halcón': 'Falcon',
-        'Soldado de invierno': 'Winter Soldier',
-        'Araña': 'Spider',
-        'Hombre Araña': 'Spider-Man',
-        'Mujer Araña': 'Spider-Woman',
-        'Máquina de Guerra': 'War Machine',
-        'Ojo de Halcón': 'Hawkeye',
-        'Capitán América': 'Captain America',
-        'Hombre Hormiga': 'Ant-Man',
-        'Avispa': 'Wasp',
-        'Viuda Negra': 'Black Widow',
-        'Pantera Negra': 'Black Panther',
-        'Bruja Escarlata': 'Scarlet Witch',
-        'Visión': 'Vision',
-        'Thor': 'Thor',
-        'Hulk': 'Hulk',
-        'Iron Man': 'Iron Man',
-        'Capitana Marvel': 'Captain Marvel',
-        'Doctor Extraño': 'Doctor Strange',
-        'Estrella Señora': 'Star-Lord',
-        'Gamora': 'Gamora',
-        'Drax': 'Drax',
-        'Rocket': 'Rocket',
-        'Groot': 'Groot',
-        # Chinese hero names
-        '凤凰女': 'Phoenix',
-        '钢铁侠': 'Iron Man',
-        '美国队长': 'Captain America',
-        '蜘蛛侠': 'Spider-Man',
-        '蜘蛛女侠': 'Spider-Woman',
-        '金刚狼': 'Wolverine',
-        '雷神': 'Thor',
-        '绿巨人': 'Hulk',
-        '黑寡妇': 'Black Widow',
-        '鹰眼': 'Hawkeye',
-        '奇异博士': 'Doctor Strange',
-        '万磁王': 'Magneto',
-        # Chinese villain/scenario names (mark as non-heroes)
-        '红坦克': '[VILLAIN] Juggernaut',
-        '惊恶先生': '[VILLAIN] Mister Sinister',
-        '纷争': '[SCENARIO] Strife',
-        '围攻': '[SCENARIO] Siege',
-        '逃出': '[SCENARIO] Escape',
-        '毁灭博士': '[VILLAIN] Doctor Doom',
-        '绿魔': '[VILLAIN] Green Goblin',
-    }
-    
-    # Check manual translations first
-    if hero_name in translations:
-        translated = translations[hero_name]
+    # Check the offline lexicon for the name's script first
+    script = detect_script(hero_name)
+    entry = lookup_hero_lexicon(hero_name, script)
+    if entry is not None:
+        translated, language = entry
         if translated.startswith('[VILLAIN]') or translated.startswith('[SCENARIO]'):
             colored_print(f"  🚫 Skipping non-hero: '{hero_name}' → '{translated}'", Colors.MAGENTA)
             return None, True  # Return None to skip this entry
         else:
-            colored_print(f"  🔧 Manual translation: '{hero_name}' → '{translated}'", Colors.YELLOW)
+            colored_print(f"  🔧 Lexicon translation ({language}): '{hero_name}' → '{translated}'", Colors.YELLOW)
             return translated, True
     
+    # Unknown Latin-script names only need their accents folded before matching
+    if script not in REMOTE_TRANSLATION_SCRIPTS:
+        return strip_accents(hero_name), False
+    
     try:
-        # Check if the string contains non-ASCII characters (likely non-English)
-        if any(ord(char) > 127 for char in hero_name):
-            # Try to translate to English
-            translated = translator.translate(hero_name, dest='en')
-            if translated and translated.text:
-                # Check if it's likely a villain or scenario
-                villain_keywords = ['villain', 'boss', 'enemy', 'scheme', 'escape', 'siege', 'attack']
-                if any(keyword in translated.text.lower() for keyword in villain_keywords):
-                    colored_print(f"  🚫 Skipping likely villain/scenario: '{hero_name}' → '{translated.text}'", Colors.MAGENTA)
-                    return None, True
-                else:
-                    colored_print(f"  🤖 Auto-translated: '{hero_name}' → '{translated.text}'", Colors.YELLOW)
-                    return translated.text, True
+        # Unknown CJK/Cyrillic name: translate to English (each distinct string at most once)
+        translated_text = translate_remote(hero_name)
+        if translated_text:
+            # Check if it's likely a villain or scenario
+            if any(keyword in translated_text.lower() for keyword in TRANSLATED_VILLAIN_KEYWORDS):
+                colored_print(f"  🚫 Skipping likely villain/scenario: '{hero_name}' → '{translated_text}'", Colors.MAGENTA)
+                return None, True
+            else:
+                colored_print(f"  🤖 Auto-translated: '{hero_name}' → '{translated_text}'", Colors.YELLOW)
+                return translated_text, True
                 
         return hero_name, False
         
@@ -387,6 +678,307 @@ def translate_hero_name(hero_name):
         colored_print(f"  ❌ Translation error for '{hero_name}': {e}", Colors.RED)
         return hero_name, False
 
+class StringTable:
+    """Interns strings to small integer ids, keeping each distinct string once on the side"""
+    
+    __slots__ = ('ids', 'strings')
+    
+    def __init__(self):
+        self.ids = {}
+        self.strings = []
+    
+    def intern(self, value):
+        """Id for value (None stays None)"""
+        if value is None:
+            return None
+        code = self.ids.get(value)
+        if code is None:
+            code = self.ids[value] = len(self.strings)
+            self.strings.append(value)
+        return code
+    
+    def lookup(self, code):
+        """String for an id (None stays None)"""
+        return None if code is None else self.strings[code]
+    
+    def __len__(self):
+        return len(self.strings)
+
+# String tables shared by every record of a run
+USER_IDS = StringTable()  # BGG userids
+PLAYER_NAMES = StringTable()  # Player names and usernames
+HERO_NAMES = StringTable()  # Raw hero names as logged in the player color field
+
+def _int_or_none(value):
+    """Numeric BGG id as an int (None when missing or not numeric)"""
+    return int(value) if value and value.isdigit() else None
+
+# Compact records produced by iter_play_records instead of a full ElementTree.
+# Userids, player names and hero names are stored as ids into the string tables above,
+# play ids and object ids as ints and dates as interned strings.
+# With KEEP_PLAY_XML each PlayRecord also keeps a copy of its own <play> XML as source,
+# and spans are the byte offsets of an element's start and end events in it, so the XML
+# of the play, its players element or a player can be sliced back out on demand.
+# Records built from ElementTree input have source None and keep the Element as the span.
+# The string table ids only mean something in the process that made them, so records
+# pickle (for --jobs worker processes) as their strings and are re-interned on load.
+class PlayerRecord:
+    """One <player> of a play"""
+    
+    __slots__ = ('name_id', 'username_id', 'user_id', 'color_id', 'win', 'span')
+    
+    def __init__(self, name, username, userid, color, win, span):
+        self.name_id = PLAYER_NAMES.intern(name)
+        self.username_id = PLAYER_NAMES.intern(username)
+        self.user_id = USER_IDS.intern(userid)
+        self.color_id = HERO_NAMES.intern(color)
+        self.win = win == '1' if win is not None else None
+        self.span = span
+    
+    def __reduce__(self):
+        win = None if self.win is None else ('1' if self.win else '0')
+        return (PlayerRecord, (self.name, self.username, self.userid, self.color, win, self.span))
+    
+    @property
+    def name(self):
+        return PLAYER_NAMES.lookup(self.name_id)
+    
+    @property
+    def username(self):
+        return PLAYER_NAMES.lookup(self.username_id)
+    
+    @property
+    def userid(self):
+        return USER_IDS.lookup(self.user_id)
+    
+    @property
+    def color(self):
+        return HERO_NAMES.lookup(self.color_id)
+
+class PlayRecord:
+    """One <play> with the fields the analysis reads"""
+    
+    __slots__ = ('id', 'date', 'user_id', 'objectid', 'comments', 'players', 'players_span', 'span', 'source')
+    
+    def __init__(self, play_id, date, userid, objectid, comments, players, players_span, span, source):
+        self.id = _int_or_none(play_id)
+        self.date = sys.intern(date) if date else date
+        self.user_id = USER_IDS.intern(userid)
+        self.objectid = _int_or_none(objectid)
+        self.comments = comments
+        self.players = players
+        self.players_span = players_span
+        self.span = span
+        self.source = source
+    
+    def __reduce__(self):
+        return (PlayRecord, (None if self.id is None else str(self.id), self.date, self.userid,
+                             None if self.objectid is None else str(self.objectid), self.comments,
+                             self.players, self.players_span, self.span, self.source))
+    
+    @property
+    def userid(self):
+        return USER_IDS.lookup(self.user_id)
+
+_XML_TAG_END_RE = re.compile(rb'"[^"]*"|\'[^\']*\'|>')
+
+def _xml_tag_end(source, pos):
+    """Byte offset just past the tag starting at pos (quoted attribute values may contain '>')"""
+    for match in _XML_TAG_END_RE.finditer(source, pos):
+        if match.group() == b'>':
+            return match.end()
+    return len(source)
+
+def _xml_element_end(source, start, end_index):
+    """Byte offset just past an element, given expat's offsets for its start and end events"""
+    start_tag_end = _xml_tag_end(source, start)
+    if source[start_tag_end - 2:start_tag_end] == b'/>':
+        return start_tag_end  # Self-closing: expat reports the end event after the tag
+    return _xml_tag_end(source, end_index)
+
+def iter_play_records(chunks):
+    """Parse a BGG plays page with expat as its bytes arrive, yielding each PlayRecord once its </play> is read.
+
+    Only the bytes of the play being parsed are buffered, so memory does not grow with the page.
+    """
+    keep_xml = KEEP_PLAY_XML
+    completed = []
+    play = None  # Attributes and state of the play being parsed
+    # Nesting is tracked with depths rather than a stack of open elements, so most events cost one
+    # counter update and a tag comparison; offsets are only read for the elements spans are kept for
+    depth = 0  # Depth of the element being parsed (0 between elements of the page root)
+    players_depth = -2  # Depth of the play's first <players> while it is open (-2: none open)
+    players_start = None  # Page offset of that <players>
+    player_attrs = player_start = None  # The <player> being parsed, with KEEP_PLAY_XML
+    comments_depth = -1  # Depth of the <comments> whose text is being collected
+    comment_parts = None
+    buffer = b''  # Page bytes from buffer_start on, trimmed after each chunk
+    buffer_start = 0  # Page offset of buffer[0]
+    resume_from = 0  # Page offset before which no bytes are needed once no play is open
+    parser = expat.ParserCreate()
+    parser.buffer_text = True
+    
+    def start_element(tag, attrs):
+        nonlocal depth, play, players_depth, players_start, player_attrs, player_start, comments_depth, comment_parts
+        depth += 1
+        if play is None:
+            if tag == 'play':
+                play = {'attrs': attrs, 'objectid': None, 'comments': None, 'players': None, 'players_span': None,
+                        'base': parser.CurrentByteIndex, 'depth': depth}
+        elif tag == 'player':
+            if depth == players_depth + 1:
+                if keep_xml:
+                    # Built at the end event, once the player's span is known
+                    player_attrs, player_start = attrs, parser.CurrentByteIndex
+                else:
+                    play['players'].append(PlayerRecord(
+                        attrs.get('name'), attrs.get('username'), attrs.get('userid'), attrs.get('color', ''), attrs.get('win'), None))
+        elif tag == 'item':
+            if play['objectid'] is None:
+                play['objectid'] = attrs.get('objectid')
+        elif tag == 'comments':
+            if play['comments'] is None and comment_parts is None:
+                comment_parts = []
+                comments_depth = depth
+                parser.CharacterDataHandler = character_data  # Only comment text is kept
+        elif tag == 'players':
+            if play['players'] is None:
+                play['players'] = []
+                players_depth = depth
+                players_start = parser.CurrentByteIndex
+    
+    def end_element(tag):
+        nonlocal depth, play, players_depth, player_attrs, comments_depth, comment_parts, resume_from
+        depth -= 1
+        if play is None:
+            return
+        if tag == 'player':
+            if player_attrs is not None and depth == players_depth:
+                base = play['base']
+                attrs = player_attrs
+                play['players'].append(PlayerRecord(
+                    attrs.get('name'), attrs.get('username'), attrs.get('userid'), attrs.get('color', ''),
+                    attrs.get('win'), (player_start - base, parser.CurrentByteIndex - base)))
+                player_attrs = None
+        elif tag == 'comments':
+            if depth + 1 == comments_depth:
+                play['comments'] = ''.join(comment_parts)
+                comment_parts = None
+                comments_depth = -1
+                parser.CharacterDataHandler = None
+        elif tag == 'players':
+            if depth + 1 == players_depth:
+                base = play['base']
+                play['players_span'] = (players_start - base, parser.CurrentByteIndex - base) if keep_xml else None
+                players_depth = -2
+        elif tag == 'play' and depth + 1 == play['depth']:
+            attrs = play['attrs']
+            players = play['players']
+            base = play['base']
+            end_index = parser.CurrentByteIndex
+            source = span = None
+            if keep_xml:
+                source = buffer[base - buffer_start:_xml_element_end(buffer, base - buffer_start, end_index - buffer_start)]
+                span = (0, end_index - base)
+            completed.append(PlayRecord(
+                attrs.get('id'), attrs.get('date'), attrs.get('userid'), play['objectid'], play['comments'],
+                tuple(players) if players is not None else None, play['players_span'], span, source))
+            play = None
+            resume_from = end_index
+    
+    def character_data(data):
+        if depth == comments_depth:
+            comment_parts.append(data)
+    
+    parser.StartElementHandler = start_element
+    parser.EndElementHandler = end_element
+    try:
+        for chunk in chunks:
+            if not chunk:
+                continue
+            buffer = buffer + chunk if buffer else chunk
+            parser.Parse(chunk, False)
+            yield from completed
+            completed.clear()
+            # Drop the bytes no open or upcoming play can refer to
+            keep_from = play['base'] if play is not None else resume_from
+            buffer = buffer[keep_from - buffer_start:]
+            buffer_start = keep_from
+        parser.Parse(b'', True)
+        yield from completed
+    finally:
+        # The handlers close over the parser; unhook them so it is freed now rather than by the cycle collector
+        parser.StartElementHandler = parser.EndElementHandler = parser.CharacterDataHandler = None
+
+def parse_plays_page(source):
+    """Parse a whole BGG plays page into a list of PlayRecords"""
+    return list(iter_play_records([source]))
+
+def stream_plays_page(url):
+    """Download a plays page in chunks and yield its PlayRecords as they are parsed"""
+    response = safe_api_call(url, stream=True)
+    if response is None:
+        raise Exception(f"Failed to fetch {url} after retries")
+    try:
+        yield from iter_play_records(response.iter_content(chunk_size=STREAM_CHUNK_SIZE))
+    finally:
+        response.close()
+
+def peak_rss_mb():
+    """Peak resident set size of this process in MB, or None where the resource module is unavailable"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024  # Bytes on macOS, KB on Linux
+
+def play_record_from_element(play):
+    """Convert an ElementTree <play> element into the PlayRecord the extractor works on"""
+    item = play.find('item')
+    comments = play.find('comments')
+    players = play.find('players')
+    player_records = None
+    if players is not None:
+        player_records = tuple(
+            PlayerRecord(player.get('name'), player.get('username'), player.get('userid'), player.get('color', ''), player.get('win'), player)
+            for player in players.findall('player'))
+    return PlayRecord(
+        play.get('id'), play.get('date'), play.get('userid'), item.get('objectid') if item is not None else None,
+        comments.text if comments is not None else None, player_records, players, play, None)
+
+def as_play_record(play):
+    """Accept either a PlayRecord or an ElementTree <play> element"""
+    return play if isinstance(play, PlayRecord) else play_record_from_element(play)
+
+def record_xml(source, span):
+    """Reconstruct the XML of a record on demand from its byte span (or serialize its Element)"""
+    if span is None:
+        return ""
+    if source is None:
+        return ET.tostring(span, encoding='unicode', method='xml')
+    start, end_index = span
+    return source[start:_xml_element_end(source, start, end_index)].decode('utf-8', errors='replace')
+
+def play_record_fields(play):
+    """A PlayRecord as JSON-ready data, without its XML (see play_record_from_fields)"""
+    players = None if play.players is None else [
+        [player.name, player.username, player.userid, player.color, None if player.win is None else int(player.win)]
+        for player in play.players
+    ]
+    return [play.id, play.date, play.userid, play.objectid, play.comments, players]
+
+def play_record_from_fields(fields):
+    """Rebuild a PlayRecord saved by play_record_fields"""
+    play_id, date, userid, objectid, comments, players = fields
+    if players is not None:
+        players = [PlayerRecord(name, username, player_userid, color, None if win is None else str(win), None)
+                   for name, username, player_userid, color, win in players]
+    return PlayRecord(None if play_id is None else str(play_id), date, userid,
+                      None if objectid is None else str(objectid), comments, players, None, None, None)
+
+def describe_player(player):
+    """Short description of a player record for reports"""
+    return f"name='{player.name}' username='{player.username}' userid='{player.userid}' color='{player.color}' win={player.win}"
+
 def fetch_plays_xml(page=1, username=None):
     """Fetch plays XML using safe API call wrapper"""
     if username:
@@ -434,8 +1026,7 @@ def fetch_monthly_play_stats(year=2025, month=6):
                 break
             
             # Parse XML response
-            root = ET.fromstring(response.content)
-            plays = root.findall("play")
+            plays = parse_plays_page(response.content)
             
             if not plays:
                 colored_print(f"📄 No more plays found on page {page}", Colors.YELLOW)
@@ -445,8 +1036,8 @@ def fetch_monthly_play_stats(year=2025, month=6):
             page_target_plays = 0
             
             for play in plays:
-                play_date = play.get("date")
-                userid = play.get("userid")
+                play_date = play.date
+                userid = play.userid
                 
                 # Check if play is in target month
                 if play_date and play_date.startswith(f"{year}-{month:02d}"):
@@ -494,6 +1085,14 @@ def extract_usernames_from_plays(root):
             userids.append(userid)
     return list(set(userids))  # Remove duplicates
 
+def fetch_user_plays_page(userid, page):
+    """One page (up to 100, newest first) of a user's plays from the user-specific plays endpoint, None if the call failed"""
+    url = f"https://boardgamegeek.com/xmlapi2/plays?userid={userid}&id=285774&page={page}"
+    response = safe_api_call(url)
+    if response is None:
+        return None
+    return parse_plays_page(response.content)
+
 def fetch_user_plays_by_userid_direct(userid, max_plays=PLAY_LIMIT):
     """Fetch up to max_plays for a specific user using direct user plays API"""
     all_plays = []
@@ -510,15 +1109,10 @@ def fetch_user_plays_by_userid_direct(userid, max_plays=PLAY_LIMIT):
                 colored_print(f"📊 Progress: Fetched {plays_fetched}/{max_plays} plays ({plays_fetched/max_plays*100:.1f}%)", Colors.CYAN)
             
             print(f"  Fetching page {page}...")
-            # Try using the user-specific plays endpoint with safe API wrapper
-            url = f"https://boardgamegeek.com/xmlapi2/plays?userid={userid}&id=285774&page={page}"
-            response = safe_api_call(url)
-            if response is None:
+            plays = fetch_user_plays_page(userid, page)
+            if plays is None:
                 colored_print(f"❌ Failed to fetch page {page} for user {userid} after retries", Colors.RED)
                 break
-            root = ET.fromstring(response.content)
-            
-            plays = root.findall("play")
             if not plays:
                 print(f"  No more plays found on page {page}")
                 break
@@ -527,12 +1121,9 @@ def fetch_user_plays_by_userid_direct(userid, max_plays=PLAY_LIMIT):
             valid_plays = []
             for play in plays:
                 # Verify it's Marvel Champions
-                items = play.findall(".//item")
-                for item in items:
-                    if item.get("objectid") == "285774":
-                        valid_plays.append(play)
-                        plays_fetched += 1
-                        break
+                if play.objectid == 285774:
+                    valid_plays.append(play)
+                    plays_fetched += 1
                 if plays_fetched >= max_plays:
                     break
             
@@ -576,50 +1167,586 @@ def extract_hero_mentions(root):
     results.sort(key=lambda x: x["mention_count"], reverse=True)
     return results
 
-def extract_hero_names_from_plays(plays_list):
-    """Extract hero names from the color field in player data and translate to English"""
-    hero_counts = {}
-    translation_cache = {}  # Cache translations to avoid API calls
-    unmatched_heroes = []  # Track heroes that don't match official list
-    unmatched_xml_examples = {}  # Store XML examples for unmatched heroes
-    
-    # Track skipped plays with detailed information
-    skipped_plays = {
-        'no_players': [],
-        'empty_color': [],
-        'meaningless_names': [],
-        'villains': [],
-        'scenarios': [],
-        'translation_errors': []
+# Persistent cross-run cache of raw color string -> resolution chain result
+_resolution_cache = None
+_resolution_cache_dirty = False
+resolution_cache_stats = {'hits': 0, 'misses': 0}
+
+def resolver_fingerprint():
+    """Hash of the official lists, alias tables, hero lexicon version and resolver rule version"""
+    payload = json.dumps([
+        RESOLVER_RULE_VERSION,
+        RESOLUTION_ORDER,
+        RESOLUTION_FUZZY_MIN_SCORE,
+        load_hero_lexicon()['version'],
+        OFFICIAL_HEROES,
+        OFFICIAL_VILLAINS,
+        HERO_ALIASES,
+        KNOWN_HEROES
+    ], ensure_ascii=False, sort_keys=True)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+def read_cache_file(filename, description, force=False):
+    """Read a JSON cache file from CACHE_DIR, returning None if it is missing or unreadable (force ignores --no-cache)"""
+    if not RESOLUTION_CACHE_ENABLED and not force:
+        return None
+    try:
+        with open(os.path.join(CACHE_DIR, filename), encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        colored_print(f"⚠️  Could not read {description}: {e}", Colors.YELLOW)
+        return None
+
+def write_cache_file(filename, data, description, force=False):
+    """Atomically write a JSON cache file to CACHE_DIR, returning True on success (force ignores --no-cache)"""
+    if not RESOLUTION_CACHE_ENABLED and not force:
+        return False
+    path = os.path.join(CACHE_DIR, filename)
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+        return True
+    except OSError as e:
+        colored_print(f"⚠️  Could not write {description}: {e}", Colors.YELLOW)
+        return False
+
+def load_resolution_cache():
+    """Load the on-disk resolution cache, discarding it if the fingerprint changed"""
+    global _resolution_cache
+    if _resolution_cache is not None:
+        return _resolution_cache
+    _resolution_cache = {}
+    data = read_cache_file(RESOLUTION_CACHE_FILE, 'resolution cache')
+    if data is None:
+        return _resolution_cache
+    if data.get('fingerprint') == resolver_fingerprint():
+        _resolution_cache = data.get('entries', {})
+        if TERMINAL_DEBUG:
+            colored_print(f"💾 Loaded {len(_resolution_cache)} cached color resolutions", Colors.CYAN)
+    elif TERMINAL_DEBUG:
+        colored_print("💾 Hero/villain lists or resolver rules changed - resolution cache invalidated", Colors.YELLOW)
+    return _resolution_cache
+
+def save_resolution_cache():
+    """Write the resolution cache to disk if it has new entries"""
+    global _resolution_cache_dirty
+    if not _resolution_cache_dirty:
+        return
+    data = {'fingerprint': resolver_fingerprint(), 'entries': _resolution_cache}
+    if write_cache_file(RESOLUTION_CACHE_FILE, data, 'resolution cache'):
+        _resolution_cache_dirty = False
+
+# Process-wide cache of Google Translate output, persisted across runs
+_translation_cache = None
+_translation_cache_dirty = False
+translation_cache_stats = {'hits': 0, 'misses': 0, 'errors': 0, 'skipped': 0, 'prefetched': 0, 'batches': 0}
+
+def load_translation_cache():
+    """Load the on-disk translation cache once per process"""
+    global _translation_cache
+    if _translation_cache is not None:
+        return _translation_cache
+    _translation_cache = {}
+    data = read_cache_file(TRANSLATION_CACHE_FILE, 'translation cache')
+    if data is not None and data.get('version') == TRANSLATION_CACHE_VERSION:
+        _translation_cache = data.get('entries', {})
+        if TERMINAL_DEBUG:
+            colored_print(f"💾 Loaded {len(_translation_cache)} cached translations", Colors.CYAN)
+    return _translation_cache
+
+def save_translation_cache():
+    """Write the translation cache to disk if it has new entries"""
+    global _translation_cache_dirty
+    if not _translation_cache_dirty:
+        return
+    data = {'version': TRANSLATION_CACHE_VERSION, 'entries': _translation_cache}
+    if write_cache_file(TRANSLATION_CACHE_FILE, data, 'translation cache'):
+        _translation_cache_dirty = False
+
+def translate_remote(text):
+    """Translate text to English with Google Translate, at most once per distinct string"""
+    global _translation_cache_dirty
+    cache = load_translation_cache()
+    if text in cache:
+        translation_cache_stats['hits'] += 1
+        return cache[text]
+    if not translation_breaker.allow():
+        translation_cache_stats['skipped'] += 1
+        return None
+    translation_cache_stats['misses'] += 1
+    
+    try:
+        translated = translator.translate(text, dest='en')
+        translation_breaker.record_success()
+    except Exception:
+        # Failures are not cached so the next run retries
+        translation_cache_stats['errors'] += 1
+        translation_breaker.record_failure()
+        raise
+    finally:
+        # Small delay to be respectful to translation API
+        time.sleep(TRANSLATION_DELAY)
+    
+    translated_text = translated.text if translated and translated.text else None
+    cache[text] = translated_text
+    _translation_cache_dirty = True
+    return translated_text
+
+def translate_batch(names, deadline=None):
+    """
+    Translate a list of names with as few Google Translate requests as possible.
+
+    The names are sent newline-joined in one request; if the reply doesn't
+    split back into one line per name, each name is sent on its own. No request
+    is started after deadline (a time.monotonic() value). Returns
+    {name: translated text or None} for the names that got an answer.
+    """
+    results = {}
+    if not translation_breaker.allow():
+        return results
+    try:
+        translated = translator.translate('\n'.join(names), dest='en')
+        translation_breaker.record_success()
+    except Exception as e:
+        translation_cache_stats['errors'] += 1
+        translation_breaker.record_failure()
+        if TERMINAL_DEBUG:
+            colored_print(f"  ❌ Batch translation error for {len(names)} names: {e}", Colors.RED)
+        return results
+    finally:
+        time.sleep(TRANSLATION_DELAY)
+    lines = translated.text.split('\n') if translated and translated.text else []
+    if len(lines) == len(names):
+        for name, line in zip(names, lines):
+            results[name] = line.strip() or None
+        return results
+    
+    # Paced and counted like translate_remote's single requests
+    for name in names:
+        if deadline is not None and time.monotonic() >= deadline:
+            break
+        if not translation_breaker.allow():
+            translation_cache_stats['skipped'] += 1
+            continue
+        translation_cache_stats['misses'] += 1
+        try:
+            translated = translator.translate(name, dest='en')
+            translation_breaker.record_success()
+        except Exception:
+            translation_cache_stats['errors'] += 1
+            translation_breaker.record_failure()
+            continue
+        finally:
+            time.sleep(TRANSLATION_DELAY)
+        results[name] = translated.text if translated and translated.text else None
+    return results
+
+def prefetch_translations(colors):
+    """
+    Translate every distinct non-English name among the colors before resolution.
+
+    Only unknown CJK/Cyrillic names go to Google Translate; names answered by
+    the resolution cache, the villain filter, the translation cache or a
+    cascade tier ordered before 'remote' are skipped. The rest are sent in
+    batches of TRANSLATION_BATCH_SIZE, TRANSLATION_WORKERS at a time, and the
+    results go into the translation cache that translate_hero_name reads.
+    Returns the number of names translated.
+    """
+    if 'remote' not in RESOLUTION_ORDER:
+        return 0
+    # Lexicon hits are already excluded by needs_remote_translation
+    cheaper_tiers = [tier for tier in RESOLUTION_ORDER[:RESOLUTION_ORDER.index('remote')] if tier != 'lexicon']
+    resolutions = load_resolution_cache()
+    cache = load_translation_cache()
+    pending = []
+    seen = set()
+    for color in colors:
+        if not color or color in resolutions:
+            continue
+        name = clean_hero_name(color)
+        if not name or name in seen:
+            continue
+        seen.add(name)
+        if name in cache or not needs_remote_translation(name):
+            continue
+        if is_villain_name(name):
+            continue
+        if any(RESOLUTION_TIERS[tier](name) for tier in cheaper_tiers):
+            continue
+        pending.append(name)
+    
+    if not pending or not translation_breaker.allow():
+        return 0
+    
+    batches = [pending[i:i + TRANSLATION_BATCH_SIZE] for i in range(0, len(pending), TRANSLATION_BATCH_SIZE)]
+    workers = min(TRANSLATION_WORKERS, len(batches))
+    rounds = -(-len(batches) // workers)
+    # Each worker runs up to `rounds` batches, and a batch whose reply doesn't split makes one
+    # request for the batch plus one per name, each taking up to the timeout plus the pause after it
+    deadline = time.monotonic() + rounds * (1 + TRANSLATION_BATCH_SIZE) * (TRANSLATION_TIMEOUT + TRANSLATION_DELAY)
+    translated = []
+    lock = threading.Lock()
+    
+    def translate_and_store(batch):
+        """Put a batch's answers in the cache as soon as they arrive, so a batch finishing late isn't lost"""
+        global _translation_cache_dirty
+        results = translate_batch(batch, deadline)
+        with lock:
+            cache.update(results)
+            translated.extend(results)
+            translation_cache_stats['prefetched'] += len(results)
+            if results:
+                _translation_cache_dirty = True
+    
+    executor = ThreadPoolExecutor(max_workers=workers)
+    futures = [executor.submit(translate_and_store, batch) for batch in batches]
+    done, not_done = wait(futures, timeout=max(0, deadline - time.monotonic()))
+    # Batches still running start no request after the deadline and store what they already have
+    executor.shutdown(wait=False, cancel_futures=True)
+    translation_cache_stats['batches'] += len(batches)
+    
+    with lock:
+        translated_count = len(translated)
+    if not_done:
+        colored_print(f"⚠️  {len(not_done)} translation batches timed out - names they didn't answer will be translated individually", Colors.YELLOW)
+    colored_print(f"🌐 Prefetched {translated_count}/{len(pending)} translations in {len(batches)} batches", Colors.CYAN)
+    return translated_count
+
+def _matched_resolution(translated_name, was_translated):
+    """Resolution fields for a translated name matched against the official list"""
+    official_name, is_official, was_fuzzy, is_altered = match_to_official_hero(translated_name)
+    return {
+        'translated_name': translated_name,
+        'was_translated': was_translated,
+        'official_name': official_name,
+        'is_official': is_official,
+        'was_fuzzy': was_fuzzy,
+        'is_altered': is_altered
+    }
+
+def resolve_tier_exact(name):
+    """Cascade tier: the name (minus an AH prefix) is an official hero name"""
+    base_name, is_altered = split_altered_hero(name)
+    if base_name not in get_hero_resolver_index()['official']:
+        return None
+    return {
+        'translated_name': name,
+        'was_translated': False,
+        'official_name': base_name,
+        'is_official': True,
+        'was_fuzzy': False,
+        'is_altered': is_altered
+    }
+
+def resolve_tier_alias(name):
+    """Cascade tier: normalized, alias, known-hero and squashed forms of the accent-folded name"""
+    resolution = _matched_resolution(strip_accents(name), False)
+    return resolution if resolution['is_official'] else None
+
+def resolve_tier_lexicon(name):
+    """Cascade tier: the offline multilingual hero lexicon"""
+    entry = lookup_hero_lexicon(name)
+    if entry is None:
+        return None
+    translated, language = entry
+    if translated.startswith('[VILLAIN]') or translated.startswith('[SCENARIO]'):
+        colored_print(f"  🚫 Skipping non-hero: '{name}' → '{translated}'", Colors.MAGENTA)
+        return {'translated_name': None, 'was_translated': True, 'villain_name': translated.split('] ', 1)[-1]}
+    colored_print(f"  🔧 Lexicon translation ({language}): '{name}' → '{translated}'", Colors.YELLOW)
+    return _matched_resolution(translated, True)
+
+def resolve_tier_fuzzy(name):
+    """Cascade tier: a near-certain fuzzy match of a Latin-script name"""
+    base_name, is_altered = split_altered_hero(strip_accents(name))
+    if not OFFICIAL_HEROES or detect_script(base_name) != 'latin':
+        return None
+    matches = get_fuzzy_index('heroes', OFFICIAL_HEROES).top_k(base_name, 1, min_score=RESOLUTION_FUZZY_MIN_SCORE)
+    if not matches:
+        return None
+    return {
+        'translated_name': strip_accents(name),
+        'was_translated': False,
+        'official_name': matches[0]['name'],
+        'is_official': True,
+        'was_fuzzy': True,
+        'is_altered': is_altered
+    }
+
+def resolve_tier_remote(name):
+    """Cascade tier: Google Translate, for CJK/Cyrillic names only"""
+    if detect_script(name) not in REMOTE_TRANSLATION_SCRIPTS:
+        return None
+    try:
+        translated_text = translate_remote(name)
+    except Exception as e:
+        colored_print(f"  ❌ Translation error for '{name}': {e}", Colors.RED)
+        return None
+    if not translated_text:
+        return None
+    if any(keyword in translated_text.lower() for keyword in TRANSLATED_VILLAIN_KEYWORDS):
+        colored_print(f"  🚫 Skipping likely villain/scenario: '{name}' → '{translated_text}'", Colors.MAGENTA)
+        return {'translated_name': None, 'was_translated': True, 'villain_name': None}
+    colored_print(f"  🤖 Auto-translated: '{name}' → '{translated_text}'", Colors.YELLOW)
+    return _matched_resolution(translated_text, True)
+
+# Resolution cascade tiers by name, see RESOLUTION_ORDER
+RESOLUTION_TIERS = {
+    'exact': resolve_tier_exact,
+    'alias': resolve_tier_alias,
+    'lexicon': resolve_tier_lexicon,
+    'fuzzy': resolve_tier_fuzzy,
+    'remote': resolve_tier_remote,
+}
+resolution_tier_stats = {tier: {'attempts': 0, 'hits': 0, 'seconds': 0.0} for tier in RESOLUTION_TIERS}
+
+def resolve_name_cascade(name, tiers=None):
+    """
+    Resolve a cleaned name through the villain filter and the resolution tiers.
+
+    Tiers run in RESOLUTION_ORDER (or the given order) and the first one that
+    answers wins, so the network is only reached for names no local tier
+    knows. Returns the resolution fields plus 'tier', the tier that answered
+    ('villain' for filtered names, None if nothing matched).
+    """
+    is_villain, villain_name = match_villain(name)
+    if is_villain:
+        if TERMINAL_DEBUG:
+            colored_print(f"  🦹 Villain detected: '{name}' - filtering out", Colors.MAGENTA)
+        return {'translated_name': None, 'was_translated': False, 'villain_name': villain_name, 'tier': 'villain'}
+    
+    for tier in tiers or RESOLUTION_ORDER:
+        stats = resolution_tier_stats[tier]
+        start = time.perf_counter()
+        resolution = RESOLUTION_TIERS[tier](name)
+        stats['seconds'] += time.perf_counter() - start
+        stats['attempts'] += 1
+        if resolution is not None:
+            stats['hits'] += 1
+            resolution['tier'] = tier
+            return resolution
+    
+    # Nothing matched: keep the (accent-folded) name as an unmatched hero
+    translated_name = name if detect_script(name) in REMOTE_TRANSLATION_SCRIPTS else strip_accents(name)
+    base_name, is_altered = split_altered_hero(translated_name)
+    return {
+        'translated_name': translated_name,
+        'was_translated': False,
+        'official_name': base_name,
+        'is_official': False,
+        'was_fuzzy': False,
+        'is_altered': is_altered,
+        'tier': None
+    }
+
+def is_unresolved_remote_name(resolution):
+    """True for a CJK/Cyrillic name no tier resolved, which a later translation attempt may still resolve"""
+    return resolution['tier'] is None and bool(resolution['cleaned_name']) and needs_remote_translation(resolution['cleaned_name'])
+
+def resolve_hero_color(color):
+    """
+    Run a raw color value through cleaning, translation and official matching.
+
+    Returns a dict with cleaned_name, translated_name, was_translated,
+    official_name, is_official, was_fuzzy, is_altered, villain_name (the
+    villain/scenario a filtered name was recognised as) and tier (the
+    resolution cascade tier that answered). Results are cached
+    on disk per raw string, so warm runs skip the whole chain.
+    """
+    global _resolution_cache_dirty
+    cache = load_resolution_cache()
+    if color in cache:
+        resolution_cache_stats['hits'] += 1
+        return cache[color]
+    resolution_cache_stats['misses'] += 1
+    
+    resolution = {
+        'cleaned_name': clean_hero_name(color),
+        'translated_name': None,
+        'was_translated': False,
+        'official_name': None,
+        'is_official': False,
+        'was_fuzzy': False,
+        'is_altered': False,
+        'villain_name': None,
+        'tier': None
     }
+    cleaned_name = resolution['cleaned_name']
+    if cleaned_name:
+        resolution.update(resolve_name_cascade(cleaned_name))
+        
+        # An unresolved CJK/Cyrillic name may be a transient translator failure
+        if is_unresolved_remote_name(resolution):
+            return resolution
+    
+    cache[color] = resolution
+    _resolution_cache_dirty = True
+    return resolution
+
+def encode_distinct_values(values):
+    """Dictionary-encode values: returns (codes, distinct) with distinct[codes[i]] == values[i]"""
+    index = {}
+    distinct = []
+    codes = []
+    for value in values:
+        code = index.get(value)
+        if code is None:
+            code = index[value] = len(distinct)
+            distinct.append(value)
+        codes.append(code)
+    return codes, distinct
+
+def resolve_distinct_colors(distinct_colors):
+    """Resolve each distinct color value once, on RESOLUTION_WORKERS threads; empty values map to None"""
+    to_resolve = [color for color in distinct_colors if color]
+    if RESOLUTION_WORKERS > 1 and len(to_resolve) > 1:
+        with ThreadPoolExecutor(max_workers=RESOLUTION_WORKERS) as executor:
+            resolved = dict(zip(to_resolve, executor.map(resolve_hero_color, to_resolve)))
+    else:
+        resolved = {color: resolve_hero_color(color) for color in to_resolve}
+    return [resolved.get(color) for color in distinct_colors]
+
+SKIP_CATEGORIES = ['no_players', 'empty_color', 'meaningless_names', 'villains', 'scenarios', 'translation_errors']
+
+class SkipDiagnostics:
+    """Skipped-play counts per category plus a fixed-size reservoir sample of examples.
+
+    Examples reference the play and player records instead of rendered XML, so memory
+    stays constant however many plays are skipped; XML is rendered only when printed.
+    """
+    
+    def __init__(self, sample_size=DIAGNOSTIC_SAMPLE_SIZE):
+        self.sample_size = sample_size
+        self.counts = Counter()
+        self.samples = {category: [] for category in SKIP_CATEGORIES}
+        self.random = random.Random()
+    
+    def add(self, category, example):
+        """Count a skipped play, keeping it in the category's sample with probability sample_size/count"""
+        self.counts[category] += 1
+        sample = self.samples[category]
+        if len(sample) < self.sample_size:
+            sample.append(example)
+        else:
+            slot = self.random.randrange(self.counts[category])
+            if slot < self.sample_size:
+                sample[slot] = example
+    
+    def merge(self, other):
+        """Fold in another SkipDiagnostics, keeping a uniform sample of the combined skipped plays"""
+        for category in SKIP_CATEGORIES:
+            mine, theirs = list(self.samples[category]), list(other.samples[category])
+            mine_left, theirs_left = self.counts[category], other.counts[category]
+            merged = []
+            while len(merged) < self.sample_size and (mine or theirs):
+                # Draw from each side in proportion to the plays it still stands for
+                if theirs and (not mine or self.random.randrange(mine_left + theirs_left) >= mine_left):
+                    merged.append(theirs.pop(self.random.randrange(len(theirs))))
+                    theirs_left -= 1
+                else:
+                    merged.append(mine.pop(self.random.randrange(len(mine))))
+                    mine_left -= 1
+            self.samples[category] = merged
+            self.counts[category] += other.counts[category]
+        return self
+    
+    def total(self):
+        return sum(self.counts.values())
+
+def diagnostic_xml(example):
+    """Render the raw XML of a skipped or unmatched example (empty unless KEEP_PLAY_XML kept it)"""
+    play, player = example.get('play'), example.get('player')
+    if play is None:
+        return ""
+    if player is not None:
+        return record_xml(play.source, player.span)
+    return record_xml(play.source, play.span)
+
+def comment_hero_status(hero_data):
+    """Status flags for a hero recovered from play comments"""
+    if hero_data['is_altered']:
+        return HeroStatus.ALTERED_HERO | HeroStatus.OFFICIAL | HeroStatus.FROM_COMMENTS
+    if hero_data['is_official']:
+        return HeroStatus.OFFICIAL | HeroStatus.FROM_COMMENTS
+    if hero_data['is_fuzzy']:
+        return HeroStatus.OFFICIAL | HeroStatus.FUZZY_MATCHED | HeroStatus.FROM_COMMENTS
+    return HeroStatus.FROM_COMMENTS
+
+def extract_hero_names_from_plays(plays_list, report=True):
+    """Extract hero names from the color field in player data and translate to English (PlayRecords or <play> Elements)
+
+    With report=False nothing is printed or saved: the caller is analyzing a batch and reports and saves the caches itself.
+    """
+    plays_list = [as_play_record(play) for play in plays_list]
+    hero_counts = {}
+    unmatched_heroes = {}  # Heroes that don't match the official list -> first example, for debugging
+    
+    # Track skipped plays: counts per category and a bounded sample of examples
+    skipped_plays = SkipDiagnostics()
     
     # Statistics tracking
     total_plays = len(plays_list)
     plays_with_players = 0
     total_players = 0
     total_players_with_color = 0
+    comment_parses = 0
+    comment_parses_avoided = 0
+    villain_counts = Counter()  # Villain/scenario -> number of plays it was detected in
+    plays_with_villain = 0
     
-    colored_print("🎯 Extracting and translating hero names...", Colors.CYAN)
-    if total_plays >= 500:
+    if report:
+        colored_print("🎯 Extracting and translating hero names...", Colors.CYAN)
+    if report and total_plays >= 500:
         colored_print(f"📊 Processing {total_plays} plays (large dataset - progress will be shown every {BATCH_PROGRESS_INTERVAL} plays)", Colors.CYAN)
     
+    # Dictionary-encode the player colors so each distinct raw value is resolved once
+    raw_colors = []
+    for play in plays_list:
+        if play.players is not None:
+            raw_colors.extend(player.color.strip() for player in play.players)
+    color_codes, distinct_colors = encode_distinct_values(raw_colors)
+    
+    # Translate all distinct non-English names up front instead of one at a time in the loop
+    prefetch_translations(distinct_colors)
+    
+    resolve_start = time.perf_counter()
+    color_resolutions = resolve_distinct_colors(distinct_colors)
+    resolve_seconds = time.perf_counter() - resolve_start
+    record_index = 0
+    
+    # Names left unresolved because the translator failed or its circuit breaker was open
+    transient_failures = sum(1 for resolution in color_resolutions
+                             if resolution is not None and 'remote' in RESOLUTION_ORDER and is_unresolved_remote_name(resolution))
+    
     for play_index, play in enumerate(plays_list):
         # Show progress for large datasets
-        if total_plays >= 500 and (play_index + 1) % BATCH_PROGRESS_INTERVAL == 0:
+        if report and total_plays >= 500 and (play_index + 1) % BATCH_PROGRESS_INTERVAL == 0:
             colored_print(f"📊 Progress: Processed {play_index + 1}/{total_plays} plays ({(play_index + 1)/total_plays*100:.1f}%)", Colors.CYAN)
         
-        play_id = play.get('id')
-        play_date = play.get('date')
-        userid = play.get('userid')
+        play_id = play.id
+        play_date = play.date
+        userid = play.userid
         
         # Extract comments for debugging
-        comments_elem = play.find('comments')
-        comments = comments_elem.text.strip() if comments_elem is not None and comments_elem.text else ""
+        comments = play.comments.strip() if play.comments else ""
+        
+        # Villains are always scanned for; comment heroes are parsed on first use and shared by every player of the play
+        play_comment_heroes = None
+        play_comment_heroes_counted = False
+        play_villains = set(parse_comment_villains(comments)) if comments else set()
+        if play_villains:
+            plays_with_villain += 1
+            villain_counts.update(play_villains)
         
-        players = play.find("players")
+        players = play.players
         if players is None:
             # Try to extract hero names from comments before giving up
             heroes_from_comments = parse_heroes_from_comments(comments, play_id)
+            comment_parses += 1
             
             if heroes_from_comments:
                 # Found heroes in comments! Process each one
@@ -635,23 +1762,16 @@ def extract_hero_names_from_plays(plays_list):
                     hero_name = hero_data['matched']
                     
                     # Determine status based on how it was matched
-                    if hero_data['is_altered']:
-                        status = 'ALTERED_HERO|OFFICIAL|FROM_COMMENTS|NO_PLAYERS'
-                    elif hero_data['is_official']:
-                        status = 'OFFICIAL|FROM_COMMENTS|NO_PLAYERS'
-                    elif hero_data['is_fuzzy']:
-                        status = 'OFFICIAL|FUZZY_MATCHED|FROM_COMMENTS|NO_PLAYERS'
-                    else:
-                        status = 'FROM_COMMENTS|NO_PLAYERS'
+                    status = comment_hero_status(hero_data) | HeroStatus.NO_PLAYERS
                     
                     # Add to results
                     if hero_name in hero_counts:
                         hero_counts[hero_name]['count'] += 1
-                        hero_counts[hero_name]['status'].add(status)
+                        hero_counts[hero_name]['status'] |= status
                     else:
                         hero_counts[hero_name] = {
                             'count': 1, 
-                            'status': {status},
+                            'status': status,
                             'is_altered': hero_data['is_altered']
                         }
                     
@@ -667,7 +1787,7 @@ def extract_hero_names_from_plays(plays_list):
                     colored_print(f"\n🚫 SKIPPED - No Players Element:", Colors.MAGENTA)
                     colored_print(f"   Play ID: {play_id} | Date: {play_date}", Colors.CYAN)
                     colored_print(f"   Raw Play XML:", Colors.YELLOW)
-                    play_xml_str = ET.tostring(play, encoding='unicode', method='xml')
+                    play_xml_str = record_xml(play.source, play.span)
                     colored_print(f"   {play_xml_str[:500]}...", Colors.YELLOW)  # First 500 chars
                     if comments:
                         colored_print(f"   📄 FULL COMMENTS:", Colors.CYAN)
@@ -677,20 +1797,21 @@ def extract_hero_names_from_plays(plays_list):
                     colored_print(f"   📝 No heroes found in comments either", Colors.RED)
                     colored_print(f"   🔗 BGG Play Link: https://boardgamegeek.com/play/{play_id}", Colors.BLUE)
                 
-                skipped_plays['no_players'].append({
+                skipped_plays.add('no_players', {
                     'play_id': play_id,
                     'play_date': play_date,
                     'userid': userid,
                     'comments': comments,
-                    'full_xml': ET.tostring(play, encoding='unicode', method='xml'),
+                    'play': play,
                     'reason': 'No players element found, no heroes in comments'
                 })
                 continue
             
-        player_list = players.findall("player")
+        player_list = players
         if len(player_list) == 0:
             # Try to extract hero names from comments before giving up
             heroes_from_comments = parse_heroes_from_comments(comments, play_id)
+            comment_parses += 1
             
             if heroes_from_comments:
                 # Found heroes in comments! Process each one
@@ -706,23 +1827,16 @@ def extract_hero_names_from_plays(plays_list):
                     hero_name = hero_data['matched']
                     
                     # Determine status based on how it was matched
-                    if hero_data['is_altered']:
-                        status = 'ALTERED_HERO|OFFICIAL|FROM_COMMENTS|EMPTY_PLAYERS'
-                    elif hero_data['is_official']:
-                        status = 'OFFICIAL|FROM_COMMENTS|EMPTY_PLAYERS'
-                    elif hero_data['is_fuzzy']:
-                        status = 'OFFICIAL|FUZZY_MATCHED|FROM_COMMENTS|EMPTY_PLAYERS'
-                    else:
-                        status = 'FROM_COMMENTS|EMPTY_PLAYERS'
+                    status = comment_hero_status(hero_data) | HeroStatus.EMPTY_PLAYERS
                     
                     # Add to results
                     if hero_name in hero_counts:
                         hero_counts[hero_name]['count'] += 1
-                        hero_counts[hero_name]['status'].add(status)
+                        hero_counts[hero_name]['status'] |= status
                     else:
                         hero_counts[hero_name] = {
                             'count': 1, 
-                            'status': {status},
+                            'status': status,
                             'is_altered': hero_data['is_altered']
                         }
                     
@@ -738,7 +1852,7 @@ def extract_hero_names_from_plays(plays_list):
                     colored_print(f"\n🚫 SKIPPED - Empty Players List:", Colors.MAGENTA)
                     colored_print(f"   Play ID: {play_id} | Date: {play_date}", Colors.CYAN)
                     colored_print(f"   Players Element XML:", Colors.YELLOW)
-                    players_xml_str = ET.tostring(players, encoding='unicode', method='xml')
+                    players_xml_str = record_xml(play.source, play.players_span)
                     colored_print(f"   {players_xml_str}", Colors.YELLOW)
                     if comments:
                         colored_print(f"   📄 FULL COMMENTS:", Colors.CYAN)
@@ -748,12 +1862,12 @@ def extract_hero_names_from_plays(plays_list):
                     colored_print(f"   📝 No heroes found in comments either", Colors.RED)
                     colored_print(f"   🔗 BGG Play Link: https://boardgamegeek.com/play/{play_id}", Colors.BLUE)
                 
-                skipped_plays['no_players'].append({
+                skipped_plays.add('no_players', {
                     'play_id': play_id,
                     'play_date': play_date,
                     'userid': userid,
                     'comments': comments,
-                    'full_xml': ET.tostring(players, encoding='unicode', method='xml'),
+                    'play': play,
                     'reason': 'Empty players list, no heroes in comments'
                 })
                 continue
@@ -762,12 +1876,23 @@ def extract_hero_names_from_plays(plays_list):
         total_players += len(player_list)
         
         for player in player_list:
-            color = player.get("color", "").strip()
+            color = player.color.strip()
+            color_code = color_codes[record_index]
+            record_index += 1
             if not color:
                 # Try to extract hero names from comments before giving up
-                heroes_from_comments = parse_heroes_from_comments(comments, play_id)
+                if play_comment_heroes is None:
+                    play_comment_heroes = parse_heroes_from_comments(comments, play_id)
+                    comment_parses += 1
+                else:
+                    comment_parses_avoided += 1
+                heroes_from_comments = play_comment_heroes
                 
+                if heroes_from_comments and play_comment_heroes_counted:
+                    # Another player of this play already counted these heroes
+                    continue
                 if heroes_from_comments:
+                    play_comment_heroes_counted = True
                     # Found heroes in comments! Process each one
                     if TERMINAL_DEBUG:
                         colored_print(f"\n🔍 RECOVERED - Found Heroes in Comments (Empty Color):", Colors.GREEN)
@@ -781,72 +1906,74 @@ def extract_hero_names_from_plays(plays_list):
                         hero_name = hero_data['matched']
                         
                         # Determine status based on how it was matched
-                        if hero_data['is_altered']:
-                            status = 'ALTERED_HERO|OFFICIAL|FROM_COMMENTS|EMPTY_COLOR'
-                        elif hero_data['is_official']:
-                            status = 'OFFICIAL|FROM_COMMENTS|EMPTY_COLOR'
-                        elif hero_data['is_fuzzy']:
-                            status = 'OFFICIAL|FUZZY_MATCHED|FROM_COMMENTS|EMPTY_COLOR'
-                        else:
-                            status = 'FROM_COMMENTS|EMPTY_COLOR'
+                        status = comment_hero_status(hero_data) | HeroStatus.EMPTY_COLOR
                         
                         # Add to results
                         if hero_name in hero_counts:
                             hero_counts[hero_name]['count'] += 1
-                            hero_counts[hero_name]['status'].add(status)
+                            hero_counts[hero_name]['status'] |= status
                         else:
                             hero_counts[hero_name] = {
                                 'count': 1, 
-                                'status': {status},
+                                'status': status,
                                 'is_altered': hero_data['is_altered']
                             }
                         
                         if TERMINAL_DEBUG:
                             status_colored_print(hero_data['original'], hero_name, status)
                 
-                # Don't skip this record since we found heroes
-                plays_with_players += 1  # Count as having usable data
-                continue
-            else:
-                # Track players with empty color field and no heroes in comments
-                if TERMINAL_DEBUG:
-                    colored_print(f"\n🚫 SKIPPED - Empty Color Field:", Colors.MAGENTA)
-                    colored_print(f"   Play ID: {play_id} | Date: {play_date}", Colors.CYAN)
-                    colored_print(f"   Raw Player XML:", Colors.YELLOW)
-                    # Convert player element to string for full XML dump
-                    player_xml_str = ET.tostring(player, encoding='unicode', method='xml')
-                    colored_print(f"   {player_xml_str}", Colors.YELLOW)
-                    colored_print(f"   Player Attributes: {player.attrib}", Colors.CYAN)
-                    if comments:
-                        colored_print(f"   📄 FULL COMMENTS:", Colors.CYAN)
-                        colored_print(f"   {comments}", Colors.CYAN)
-                    else:
-                        colored_print(f"   📄 No comments in this play", Colors.CYAN)
-                    colored_print(f"   📝 No heroes found in comments either", Colors.RED)
-                    colored_print(f"   🔗 BGG Play Link: https://boardgamegeek.com/play/{play_id}", Colors.BLUE)
+                    # Don't skip this record since we found heroes (the play is already counted above)
+                    continue
+                else:
+                    # Track players with empty color field and no heroes in comments
+                    if TERMINAL_DEBUG:
+                        colored_print(f"\n🚫 SKIPPED - Empty Color Field:", Colors.MAGENTA)
+                        colored_print(f"   Play ID: {play_id} | Date: {play_date}", Colors.CYAN)
+                        colored_print(f"   Raw Player XML:", Colors.YELLOW)
+                        # Convert player element to string for full XML dump
+                        player_xml_str = record_xml(play.source, player.span)
+                        colored_print(f"   {player_xml_str}", Colors.YELLOW)
+                        colored_print(f"   Player: {describe_player(player)}", Colors.CYAN)
+                        if comments:
+                            colored_print(f"   📄 FULL COMMENTS:", Colors.CYAN)
+                            colored_print(f"   {comments}", Colors.CYAN)
+                        else:
+                            colored_print(f"   📄 No comments in this play", Colors.CYAN)
+                        colored_print(f"   📝 No heroes found in comments either", Colors.RED)
+                        colored_print(f"   🔗 BGG Play Link: https://boardgamegeek.com/play/{play_id}", Colors.BLUE)
                 
-                skipped_plays['empty_color'].append({
-                    'play_id': play_id,
-                    'play_date': play_date,
-                    'userid': userid,
-                    'comments': comments,
-                    'player_xml': player.attrib,
-                    'full_xml': ET.tostring(player, encoding='unicode', method='xml'),
-                    'reason': 'Empty color field, no heroes in comments'
-                })
-                continue
+                    skipped_plays.add('empty_color', {
+                        'play_id': play_id,
+                        'play_date': play_date,
+                        'userid': userid,
+                        'comments': comments,
+                        'play': play,
+                        'player': player,
+                        'reason': 'Empty color field, no heroes in comments'
+                    })
+                    continue
             
             total_players_with_color += 1
             
-            # Clean up the hero name (remove extra info like aspects, team numbers, etc.)
-            cleaned_name = clean_hero_name(color)
+            # Clean, translate and match the color field (cached across runs)
+            resolution = color_resolutions[color_code]
+            cleaned_name = resolution['cleaned_name']
             
             # Skip empty or meaningless names, but first try to parse from comments
             if not cleaned_name:
                 # Try to extract hero names from comments before giving up
-                heroes_from_comments = parse_heroes_from_comments(comments, play_id)
+                if play_comment_heroes is None:
+                    play_comment_heroes = parse_heroes_from_comments(comments, play_id)
+                    comment_parses += 1
+                else:
+                    comment_parses_avoided += 1
+                heroes_from_comments = play_comment_heroes
                 
+                if heroes_from_comments and play_comment_heroes_counted:
+                    # Another player of this play already counted these heroes
+                    continue
                 if heroes_from_comments:
+                    play_comment_heroes_counted = True
                     # Found heroes in comments! Process each one
                     if TERMINAL_DEBUG:
                         colored_print(f"\n🔍 RECOVERED - Found Heroes in Comments:", Colors.GREEN)
@@ -861,71 +1988,57 @@ def extract_hero_names_from_plays(plays_list):
                         hero_name = hero_data['matched']
                         
                         # Determine status based on how it was matched
-                        if hero_data['is_altered']:
-                            status = 'ALTERED_HERO|OFFICIAL|FROM_COMMENTS'
-                        elif hero_data['is_official']:
-                            status = 'OFFICIAL|FROM_COMMENTS'
-                        elif hero_data['is_fuzzy']:
-                            status = 'OFFICIAL|FUZZY_MATCHED|FROM_COMMENTS'
-                        else:
-                            status = 'FROM_COMMENTS'
+                        status = comment_hero_status(hero_data)
                         
                         # Add to results
                         if hero_name in hero_counts:
                             hero_counts[hero_name]['count'] += 1
-                            hero_counts[hero_name]['status'].add(status)
+                            hero_counts[hero_name]['status'] |= status
                         else:
                             hero_counts[hero_name] = {
                                 'count': 1, 
-                                'status': {status},
+                                'status': status,
                                 'is_altered': hero_data['is_altered']
                             }
                         
                         if TERMINAL_DEBUG:
                             status_colored_print(hero_data['original'], hero_name, status)
                 
-                # Don't skip this record since we found heroes
-                continue
-            else:
-                # No heroes found in comments either, skip as meaningless
-                if TERMINAL_DEBUG:
-                    colored_print(f"\n🚫 SKIPPED - Meaningless Name:", Colors.MAGENTA)
-                    colored_print(f"   Play ID: {play_id} | Date: {play_date}", Colors.CYAN)
-                    colored_print(f"   Original Color: '{color}'", Colors.YELLOW)
-                    colored_print(f"   Cleaned Name: '{cleaned_name}'", Colors.YELLOW)
-                    colored_print(f"   Raw Player XML:", Colors.YELLOW)
-                    player_xml_str = ET.tostring(player, encoding='unicode', method='xml')
-                    colored_print(f"   {player_xml_str}", Colors.YELLOW)
-                    if comments:
-                        colored_print(f"   📄 FULL COMMENTS:", Colors.CYAN)
-                        colored_print(f"   {comments}", Colors.CYAN)
-                    else:
-                        colored_print(f"   📄 No comments in this play", Colors.CYAN)
-                    colored_print(f"   📝 No heroes found in comments either", Colors.RED)
-                    colored_print(f"   🔗 BGG Play Link: https://boardgamegeek.com/play/{play_id}", Colors.BLUE)
+                    # Don't skip this record since we found heroes
+                    continue
+                else:
+                    # No heroes found in comments either, skip as meaningless
+                    if TERMINAL_DEBUG:
+                        colored_print(f"\n🚫 SKIPPED - Meaningless Name:", Colors.MAGENTA)
+                        colored_print(f"   Play ID: {play_id} | Date: {play_date}", Colors.CYAN)
+                        colored_print(f"   Original Color: '{color}'", Colors.YELLOW)
+                        colored_print(f"   Cleaned Name: '{cleaned_name}'", Colors.YELLOW)
+                        colored_print(f"   Raw Player XML:", Colors.YELLOW)
+                        player_xml_str = record_xml(play.source, player.span)
+                        colored_print(f"   {player_xml_str}", Colors.YELLOW)
+                        if comments:
+                            colored_print(f"   📄 FULL COMMENTS:", Colors.CYAN)
+                            colored_print(f"   {comments}", Colors.CYAN)
+                        else:
+                            colored_print(f"   📄 No comments in this play", Colors.CYAN)
+                        colored_print(f"   📝 No heroes found in comments either", Colors.RED)
+                        colored_print(f"   🔗 BGG Play Link: https://boardgamegeek.com/play/{play_id}", Colors.BLUE)
                 
-                skipped_plays['meaningless_names'].append({
-                    'play_id': play_id,
-                    'play_date': play_date,
-                    'userid': userid,
-                    'comments': comments,
-                    'original_color': color,
-                    'cleaned_name': cleaned_name,
-                    'player_xml': player.attrib,
-                    'full_xml': ET.tostring(player, encoding='unicode', method='xml'),
-                    'reason': 'Meaningless name after cleaning, no heroes in comments'
-                })
-                continue
+                    skipped_plays.add('meaningless_names', {
+                        'play_id': play_id,
+                        'play_date': play_date,
+                        'userid': userid,
+                        'comments': comments,
+                        'original_color': color,
+                        'cleaned_name': cleaned_name,
+                        'play': play,
+                        'player': player,
+                        'reason': 'Meaningless name after cleaning, no heroes in comments'
+                    })
+                    continue
             
-            # Use cached translation if available
-            if cleaned_name in translation_cache:
-                translated_name, was_translated = translation_cache[cleaned_name]
-            else:
-                translated_name, was_translated = translate_hero_name(cleaned_name)
-                translation_cache[cleaned_name] = (translated_name, was_translated)
-                # Small delay to be respectful to translation API
-                if was_translated:
-                    time.sleep(0.1)
+            translated_name = resolution['translated_name']
+            was_translated = resolution['was_translated']
             
             # Check if this was filtered as a villain or resulted in empty translation
             if translated_name is None:
@@ -936,22 +2049,30 @@ def extract_hero_names_from_plays(plays_list):
                     colored_print(f"   Cleaned Name: '{cleaned_name}'", Colors.YELLOW)
                     colored_print(f"   Translation Result: None (filtered)", Colors.RED)
                     colored_print(f"   Raw Player XML:", Colors.YELLOW)
-                    player_xml_str = ET.tostring(player, encoding='unicode', method='xml')
+                    player_xml_str = record_xml(play.source, player.span)
                     colored_print(f"   {player_xml_str}", Colors.YELLOW)
                     if comments:
                         colored_print(f"   Comments: {comments[:100]}...", Colors.CYAN)
                     colored_print(f"  🦹 Villain filtered: '{color}' → '{cleaned_name}'", Colors.MAGENTA)
                     colored_print(f"   🔗 BGG Play Link: https://boardgamegeek.com/play/{play_id}", Colors.BLUE)
                 
-                skipped_plays['villains'].append({
+                villain_name = resolution['villain_name']
+                if villain_name and villain_name not in play_villains:
+                    if not play_villains:
+                        plays_with_villain += 1
+                    play_villains.add(villain_name)
+                    villain_counts[villain_name] += 1
+                
+                skipped_plays.add('villains', {
                     'play_id': play_id,
                     'play_date': play_date,
                     'userid': userid,
                     'comments': comments,
                     'original_color': color,
                     'cleaned_name': cleaned_name,
-                    'player_xml': player.attrib,
-                    'full_xml': ET.tostring(player, encoding='unicode', method='xml'),
+                    'villain_name': villain_name,
+                    'play': play,
+                    'player': player,
                     'reason': 'Filtered as villain/scenario'
                 })
                 continue
@@ -965,14 +2086,14 @@ def extract_hero_names_from_plays(plays_list):
                     colored_print(f"   Cleaned Name: '{cleaned_name}'", Colors.YELLOW)
                     colored_print(f"   Translation Result: '{translated_name}'", Colors.RED)
                     colored_print(f"   Raw Player XML:", Colors.YELLOW)
-                    player_xml_str = ET.tostring(player, encoding='unicode', method='xml')
+                    player_xml_str = record_xml(play.source, player.span)
                     colored_print(f"   {player_xml_str}", Colors.YELLOW)
                     if comments:
                         colored_print(f"   Comments: {comments[:100]}...", Colors.CYAN)
                     colored_print(f"  ❌ Translation error: '{color}' → '{cleaned_name}' → '{translated_name}'", Colors.RED)
                     colored_print(f"   🔗 BGG Play Link: https://boardgamegeek.com/play/{play_id}", Colors.BLUE)
                 
-                skipped_plays['translation_errors'].append({
+                skipped_plays.add('translation_errors', {
                     'play_id': play_id,
                     'play_date': play_date,
                     'userid': userid,
@@ -980,8 +2101,8 @@ def extract_hero_names_from_plays(plays_list):
                     'original_color': color,
                     'cleaned_name': cleaned_name,
                     'translated_name': translated_name,
-                    'player_xml': player.attrib,
-                    'full_xml': ET.tostring(player, encoding='unicode', method='xml'),
+                    'play': play,
+                    'player': player,
                     'reason': 'Translation resulted in empty string'
                 })
                 continue
@@ -1003,7 +2124,7 @@ def extract_hero_names_from_plays(plays_list):
                 except:
                     pass
                     
-                skipped_plays[category].append({
+                skipped_plays.add(category, {
                     'play_id': play_id,
                     'play_date': play_date,
                     'userid': userid,
@@ -1011,13 +2132,14 @@ def extract_hero_names_from_plays(plays_list):
                     'original_color': color,
                     'cleaned_name': cleaned_name,
                     'translated_name': str(test_translation) if test_translation else None,
-                    'player_xml': player.attrib,
+                    'play': play,
+                    'player': player,
                     'reason': f'Filtered as {category[:-1]}' if category in ['villains', 'scenarios'] else 'Translation returned None'
                 })
                 continue
                 
             if not str(translated_name).strip():
-                skipped_plays['translation_errors'].append({
+                skipped_plays.add('translation_errors', {
                     'play_id': play_id,
                     'play_date': play_date,
                     'userid': userid,
@@ -1025,153 +2147,185 @@ def extract_hero_names_from_plays(plays_list):
                     'original_color': color,
                     'cleaned_name': cleaned_name,
                     'translated_name': translated_name,
-                    'player_xml': player.attrib,
+                    'play': play,
+                    'player': player,
                     'reason': 'Empty string after translation'
                 })
                 continue
             
-            # Try to match to official hero list
-            official_name, is_official, was_fuzzy_matched, is_altered = match_to_official_hero(translated_name)
+            # Official hero list match from the resolution chain
+            official_name = resolution['official_name']
+            is_official = resolution['is_official']
+            was_fuzzy_matched = resolution['was_fuzzy']
+            is_altered = resolution['is_altered']
             
             # Use the official name if found, otherwise use translated name
             final_name = official_name if is_official else translated_name
             
             # Track status for reporting
-            status_flags = []
+            status = HeroStatus(0)
             if was_translated:
-                status_flags.append("TRANSLATED")
+                status |= HeroStatus.TRANSLATED
             if is_official:
-                status_flags.append("OFFICIAL")
+                status |= HeroStatus.OFFICIAL
             else:
-                status_flags.append("UNMATCHED")
+                status |= HeroStatus.UNMATCHED
                 if final_name not in unmatched_heroes:
-                    unmatched_heroes.append(final_name)
-                    # Store enhanced XML example for debugging
-                    unmatched_xml_examples[final_name] = {
+                    # Store enhanced example for debugging
+                    unmatched_heroes[final_name] = {
                         'original_color': color,
                         'cleaned_name': cleaned_name,
                         'translated_name': translated_name,
-                        'player_xml': player.attrib,
+                        'play': play,
+                        'player': player,
                         'play_id': play_id,
                         'play_date': play_date,
                         'userid': userid,
                         'comments': comments,
-                        'raw_player_xml': str(ET.tostring(player, encoding='unicode')),  # Full XML before processing
                         'is_altered': is_altered
                     }
             if was_fuzzy_matched:
-                status_flags.append("FUZZY_MATCHED")
+                status |= HeroStatus.FUZZY_MATCHED
             if is_altered:
-                status_flags.append("ALTERED_HERO")
+                status |= HeroStatus.ALTERED_HERO
             
             # Enhanced status with color coding
-            status_str = ", ".join(status_flags)
-            if cleaned_name != final_name or status_flags:
+            if cleaned_name != final_name or status:
                 if is_altered:
-                    colored_print(f"  🔄 Altered Hero: '{cleaned_name}' → '{final_name}' [{status_str}]", Colors.BLUE)
+                    colored_print(f"  🔄 Altered Hero: '{cleaned_name}' → '{final_name}' [{format_status(status)}]", Colors.BLUE)
                 else:
-                    status_colored_print(cleaned_name, final_name, status_str)
+                    status_colored_print(cleaned_name, final_name, status)
             
             # Add to results using consistent structure
             if final_name in hero_counts:
                 hero_counts[final_name]['count'] += 1
-                hero_counts[final_name]['status'].add(status_str)
+                hero_counts[final_name]['status'] |= status
                 if is_altered:
                     hero_counts[final_name]['is_altered'] = True
             else:
                 hero_counts[final_name] = {
                     'count': 1,
-                    'status': {status_str},
+                    'status': status,
                     'is_altered': is_altered
                 }
     
-    # Report statistics
-    colored_print(f"\n📊 Play Analysis Statistics:", Colors.BOLD)
-    colored_print(f"- Total plays analyzed: {total_plays}", Colors.CYAN)
-    colored_print(f"- Plays with player data: {plays_with_players} ({plays_with_players/total_plays*100:.1f}%)", Colors.CYAN)
-    colored_print(f"- Total players found: {total_players}", Colors.CYAN)
-    colored_print(f"- Players with color data: {total_players_with_color} ({total_players_with_color/total_players*100:.1f}% of players)" if total_players > 0 else "- Players with color data: 0", Colors.CYAN)
-    colored_print(f"- Average players per play: {total_players/plays_with_players:.1f}" if plays_with_players > 0 else "- Average players per play: 0", Colors.CYAN)
-    
-    # Report skipped plays with detailed breakdown
-    total_skipped = sum(len(category_list) for category_list in skipped_plays.values())
-    if total_skipped > 0:
-        colored_print(f"\n🚫 Skipped Plays Analysis ({total_skipped} total):", Colors.MAGENTA)
+    if report:
+        save_resolution_cache()
+        save_translation_cache()
+    
+        # Report statistics
+        colored_print(f"\n📊 Play Analysis Statistics:", Colors.BOLD)
+        colored_print(f"- Total plays analyzed: {total_plays}", Colors.CYAN)
+        colored_print(f"- Plays with player data: {plays_with_players} ({plays_with_players/total_plays*100:.1f}%)", Colors.CYAN)
+        colored_print(f"- Total players found: {total_players}", Colors.CYAN)
+        colored_print(f"- Players with color data: {total_players_with_color} ({total_players_with_color/total_players*100:.1f}% of players)" if total_players > 0 else "- Players with color data: 0", Colors.CYAN)
+        colored_print(f"- Average players per play: {total_players/plays_with_players:.1f}" if plays_with_players > 0 else "- Average players per play: 0", Colors.CYAN)
+        clean_stats = get_clean_cache_stats()
+        resolution_lookups = resolution_cache_stats['hits'] + resolution_cache_stats['misses']
+        colored_print(f"- Resolution cache: {resolution_cache_stats['hits']}/{resolution_lookups} color values resolved from cache ({resolution_cache_stats['hits']/resolution_lookups*100:.1f}%)" if resolution_lookups > 0 else "- Resolution cache: no lookups", Colors.CYAN)
+        tier_report = ', '.join(
+            f"{tier} {resolution_tier_stats[tier]['hits']}/{resolution_tier_stats[tier]['attempts']} ({resolution_tier_stats[tier]['seconds']/resolution_tier_stats[tier]['attempts']*1000:.2f} ms avg)"
+            for tier in RESOLUTION_ORDER if resolution_tier_stats[tier]['attempts'] > 0
+        )
+        colored_print(f"- Resolution tiers (hits/attempts): {tier_report}" if tier_report else "- Resolution tiers: no lookups", Colors.CYAN)
+        distinct_values = sum(1 for value in distinct_colors if value)
+        colored_print(f"- Distinct color values: {distinct_values} for {total_players_with_color} player records ({distinct_values/total_players_with_color*100:.1f}%), resolved in {resolve_seconds:.2f}s (~{resolve_seconds/distinct_values*(total_players_with_color-distinct_values):.2f}s saved vs. resolving every record)" if distinct_values > 0 and total_players_with_color > 0 else "- Distinct color values: 0", Colors.CYAN)
+        colored_print(f"- Color cleaning cache: {clean_stats['hits']} hits, {clean_stats['misses']} misses ({clean_stats['hit_rate']*100:.1f}% hit rate, {clean_stats['size']}/{clean_stats['maxsize']} entries)", Colors.CYAN)
+        translation_lookups = translation_cache_stats['hits'] + translation_cache_stats['misses']
+        colored_print(f"- Translation cache: {translation_cache_stats['hits']}/{translation_lookups} translations reused ({translation_cache_stats['prefetched']} prefetched in {translation_cache_stats['batches']} batches), {translation_cache_stats['misses']} single Google Translate requests ({translation_cache_stats['errors']} failed, {translation_cache_stats['skipped']} skipped by circuit breaker)" if translation_lookups + translation_cache_stats['skipped'] > 0 else "- Translation cache: no remote translations needed", Colors.CYAN)
+        colored_print(f"- Comment parses: {comment_parses} ({comment_parses_avoided} repeat parses avoided by sharing per-play results)", Colors.CYAN)
+        top_villains = ', '.join(f"{name} ({count})" for name, count in villain_counts.most_common(5))
+        colored_print(f"- Plays with a detected villain/scenario: {plays_with_villain} (most common: {top_villains})" if plays_with_villain > 0 else "- Plays with a detected villain/scenario: 0", Colors.CYAN)
+
+        # Report skipped plays with detailed breakdown
+        total_skipped = skipped_plays.total()
+        if total_skipped > 0:
+            colored_print(f"\n🚫 Skipped Plays Analysis ({total_skipped} total):", Colors.MAGENTA)
         
-        for category, plays in skipped_plays.items():
-            if plays:
-                category_name = category.replace('_', ' ').title()
-                colored_print(f"\n   📋 {category_name}: {len(plays)} plays", Colors.YELLOW)
+            for category in SKIP_CATEGORIES:
+                skipped_count = skipped_plays.counts[category]
+                if skipped_count:
+                    category_name = category.replace('_', ' ').title()
+                    colored_print(f"\n   📋 {category_name}: {skipped_count} plays", Colors.YELLOW)
                 
-                # Show first few examples with XML details
-                for i, play_info in enumerate(plays[:3]):  # Show first 3 examples
-                    colored_print(f"      Example {i+1}:", Colors.CYAN)
-                    colored_print(f"         Play ID: {play_info['play_id']}", Colors.CYAN)
-                    colored_print(f"         Date: {play_info['play_date']}", Colors.CYAN)
-                    colored_print(f"         User ID: {play_info['userid']}", Colors.CYAN)
-                    colored_print(f"         Reason: {play_info['reason']}", Colors.CYAN)
-                    if play_info.get('comments'):
-                        colored_print(f"         Comments: {play_info['comments'][:100]}{'...' if len(play_info['comments']) > 100 else ''}", Colors.CYAN)
-                    if play_info.get('original_color'):
-                        colored_print(f"         Original color: '{play_info['original_color']}'", Colors.CYAN)
-                    if play_info.get('cleaned_name'):
-                        colored_print(f"         Cleaned name: '{play_info['cleaned_name']}'", Colors.CYAN)
-                    if play_info.get('translated_name'):
-                        colored_print(f"         Translated: '{play_info['translated_name']}'", Colors.CYAN)
-                    if play_info.get('player_xml'):
-                        colored_print(f"         Player XML: {play_info['player_xml']}", Colors.CYAN)
+                    # Show the sampled examples with their details
+                    for i, play_info in enumerate(skipped_plays.samples[category]):
+                        colored_print(f"      Example {i+1}:", Colors.CYAN)
+                        colored_print(f"         Play ID: {play_info['play_id']}", Colors.CYAN)
+                        colored_print(f"         Date: {play_info['play_date']}", Colors.CYAN)
+                        colored_print(f"         User ID: {play_info['userid']}", Colors.CYAN)
+                        colored_print(f"         Reason: {play_info['reason']}", Colors.CYAN)
+                        if play_info.get('comments'):
+                            colored_print(f"         Comments: {play_info['comments'][:100]}{'...' if len(play_info['comments']) > 100 else ''}", Colors.CYAN)
+                        if play_info.get('original_color'):
+                            colored_print(f"         Original color: '{play_info['original_color']}'", Colors.CYAN)
+                        if play_info.get('cleaned_name'):
+                            colored_print(f"         Cleaned name: '{play_info['cleaned_name']}'", Colors.CYAN)
+                        if play_info.get('translated_name'):
+                            colored_print(f"         Translated: '{play_info['translated_name']}'", Colors.CYAN)
+                        if play_info.get('player'):
+                            colored_print(f"         Player: {describe_player(play_info['player'])}", Colors.CYAN)
+                        example_xml = diagnostic_xml(play_info) if TERMINAL_DEBUG else ""
+                        if example_xml:
+                            colored_print(f"         XML: {example_xml[:500]}", Colors.CYAN)
                 
-                if len(plays) > 3:
-                    colored_print(f"      ... and {len(plays) - 3} more {category_name.lower()}", Colors.CYAN)
-    
-    # Report unmatched heroes with detailed XML debugging info
-    if unmatched_heroes:
-        colored_print(f"\n⚠️  Unmatched heroes found ({len(unmatched_heroes)}):", Colors.MAGENTA)
-        for hero in unmatched_heroes:
-            colored_print(f"\n   🔍 Hero: {hero}", Colors.RED)
-            if hero in unmatched_xml_examples:
-                example = unmatched_xml_examples[hero]
-                colored_print(f"      📝 XML Debug Info:", Colors.YELLOW)
-                colored_print(f"         Original color field: '{example['original_color']}'", Colors.YELLOW)
-                colored_print(f"         Cleaned name: '{example['cleaned_name']}'", Colors.YELLOW)
-                colored_print(f"         Translated name: '{example['translated_name']}'", Colors.YELLOW)
-                colored_print(f"         Play ID: {example['play_id']}", Colors.YELLOW)
-                colored_print(f"         Play Date: {example['play_date']}", Colors.YELLOW)
-                colored_print(f"         User ID: {example['userid']}", Colors.YELLOW)
-                colored_print(f"         🔗 BGG Play Link: https://boardgamegeek.com/play/{example['play_id']}", Colors.BLUE)
-                if example.get('comments'):
-                    colored_print(f"         Comments: {example['comments'][:100]}{'...' if len(example['comments']) > 100 else ''}", Colors.YELLOW)
-                colored_print(f"         Full player XML: {example['player_xml']}", Colors.YELLOW)
+                    shown = len(skipped_plays.samples[category])
+                    if skipped_count > shown:
+                        colored_print(f"      ... and {skipped_count - shown} more {category_name.lower()}", Colors.CYAN)
+    
+        # Report unmatched heroes with detailed XML debugging info
+        if unmatched_heroes:
+            colored_print(f"\n⚠️  Unmatched heroes found ({len(unmatched_heroes)}):", Colors.MAGENTA)
+        
+            # Score every unmatched name against both lists in one batch
+            hero_suggestions, villain_suggestions = {}, {}
+            if TERMINAL_DEBUG:
+                cleaned_names = [example['cleaned_name'] for example in unmatched_heroes.values()]
+                hero_suggestions = batch_closest_matches(cleaned_names, OFFICIAL_HEROES)
+                villain_suggestions = batch_closest_matches(cleaned_names, OFFICIAL_VILLAINS)
+        
+            for hero, example in unmatched_heroes.items():
+                colored_print(f"\n   🔍 Hero: {hero}", Colors.RED)
+                if example:
+                    colored_print(f"      📝 XML Debug Info:", Colors.YELLOW)
+                    colored_print(f"         Original color field: '{example['original_color']}'", Colors.YELLOW)
+                    colored_print(f"         Cleaned name: '{example['cleaned_name']}'", Colors.YELLOW)
+                    colored_print(f"         Translated name: '{example['translated_name']}'", Colors.YELLOW)
+                    colored_print(f"         Play ID: {example['play_id']}", Colors.YELLOW)
+                    colored_print(f"         Play Date: {example['play_date']}", Colors.YELLOW)
+                    colored_print(f"         User ID: {example['userid']}", Colors.YELLOW)
+                    colored_print(f"         🔗 BGG Play Link: https://boardgamegeek.com/play/{example['play_id']}", Colors.BLUE)
+                    if example.get('comments'):
+                        colored_print(f"         Comments: {example['comments'][:100]}{'...' if len(example['comments']) > 100 else ''}", Colors.YELLOW)
+                    colored_print(f"         Player: {describe_player(example['player'])}", Colors.YELLOW)
                 
-                # Enhanced debugging - show raw XML before cleaning
-                if TERMINAL_DEBUG and example.get('raw_player_xml'):
-                    colored_print(f"         📋 Raw Player XML (before processing):", Colors.CYAN)
-                    colored_print(f"         {example['raw_player_xml']}", Colors.CYAN)
+                    # Enhanced debugging - show raw XML before cleaning
+                    raw_player_xml = diagnostic_xml(example) if TERMINAL_DEBUG else ""
+                    if raw_player_xml:
+                        colored_print(f"         📋 Raw Player XML (before processing):", Colors.CYAN)
+                        colored_print(f"         {raw_player_xml}", Colors.CYAN)
                 
-                # Enhanced debugging - show if it matches villain patterns
-                if TERMINAL_DEBUG:
-                    villain_match = is_villain_name(example['cleaned_name'])
-                    if villain_match:
-                        colored_print(f"         🦹 Villain check: MATCHES villain patterns", Colors.MAGENTA)
-                    else:
-                        colored_print(f"         🦸 Villain check: No villain pattern match", Colors.CYAN)
+                    # Enhanced debugging - show if it matches villain patterns
+                    if TERMINAL_DEBUG:
+                        villain_match = is_villain_name(example['cleaned_name'])
+                        if villain_match:
+                            colored_print(f"         🦹 Villain check: MATCHES villain patterns", Colors.MAGENTA)
+                        else:
+                            colored_print(f"         🦸 Villain check: No villain pattern match", Colors.CYAN)
                     
-                    # Check if this was an altered hero
-                    if example.get('is_altered'):
-                        colored_print(f"         🔄 Altered Hero: This was detected as an AH variant", Colors.BLUE)
+                        # Check if this was an altered hero
+                        if example.get('is_altered'):
+                            colored_print(f"         🔄 Altered Hero: This was detected as an AH variant", Colors.BLUE)
                     
-                    # Check against both hero and villain lists
-                    hero_similarity = find_closest_hero_match(example['cleaned_name'])
-                    if hero_similarity:
-                        colored_print(f"         🎯 Closest hero match: '{hero_similarity['name']}' (similarity: {hero_similarity['score']:.2f})", Colors.BLUE)
+                        # Check against both hero and villain lists
+                        hero_similarity = (hero_suggestions.get(example['cleaned_name']) or [None])[0]
+                        if hero_similarity:
+                            colored_print(f"         🎯 Closest hero match: '{hero_similarity['name']}' (similarity: {hero_similarity['score']:.2f})", Colors.BLUE)
                     
-                    villain_similarity = find_closest_villain_match(example['cleaned_name'])
-                    if villain_similarity:
-                        colored_print(f"         🦹 Closest villain match: '{villain_similarity['name']}' (similarity: {villain_similarity['score']:.2f})", Colors.MAGENTA)
+                        villain_similarity = (villain_suggestions.get(example['cleaned_name']) or [None])[0]
+                        if villain_similarity:
+                            colored_print(f"         🦹 Closest villain match: '{villain_similarity['name']}' (similarity: {villain_similarity['score']:.2f})", Colors.MAGENTA)
 
-    if not hero_counts:
-        return []
-    
     # Parse the results to separate name, status, and track altered heroes
     results = []
     hero_totals = {}  # Track total plays per hero (including altered versions)
@@ -1180,12 +2334,9 @@ def extract_hero_names_from_plays(plays_list):
     for hero_name, hero_data in hero_counts.items():
         # Extract count and status from the data structure
         count = hero_data['count']
-        status_set = hero_data['status']
+        status = hero_data['status']
         is_altered_entry = hero_data.get('is_altered', False)
         
-        # Convert status set to string
-        status = '|'.join(sorted(status_set))
-        
         # Add to hero totals
         if hero_name not in hero_totals:
             hero_totals[hero_name] = 0
@@ -1219,51 +2370,233 @@ def extract_hero_names_from_plays(plays_list):
         'total_plays': total_plays,
         'plays_with_players': plays_with_players,
         'total_players': total_players,
-        'total_players_with_color': total_players_with_color
+        'total_players_with_color': total_players_with_color,
+        'plays_with_villain': plays_with_villain,
+        'villains': villain_counts,
+        'transient_failures': transient_failures
     }
     
     return results, skipped_plays, stats
 
-def find_closest_hero_match(name):
-    """Find the closest matching hero name using basic string similarity"""
-    if not name or not OFFICIAL_HEROES:
-        return None
-    
-    best_match = None
-    best_score = 0
+class FuzzyNameIndex:
+    """Character n-gram inverted index for fuzzy name matching.
+
+    Candidates are the names sharing the most n-grams with the query (found
+    through the posting lists, so only overlapping names are touched), and
+    are then ranked by normalized Levenshtein similarity.
+    """
+
+    def __init__(self, names, ngram_size=FUZZY_NGRAM_SIZE):
+        self.ngram_size = ngram_size
+        self.names = list(dict.fromkeys(name for name in names if name))
+        self.keys = [self.normalize(name) for name in self.names]
+        self.postings = defaultdict(list)
+        for position, key in enumerate(self.keys):
+            for gram in self.ngrams(key):
+                self.postings[gram].append(position)
+
+    @staticmethod
+    def normalize(name):
+        """Lower-case a name and collapse punctuation and spacing to single spaces"""
+        return ' '.join(re.findall(r'[^\W_]+', name.lower()))
+
+    def ngrams(self, key):
+        """Return the set of padded character n-grams of a normalized key"""
+        return set(name_ngrams(key, self.ngram_size))
+
+    def top_k(self, name, k=5, min_score=FUZZY_MIN_SCORE, max_candidates=FUZZY_MAX_CANDIDATES):
+        """Return up to k {"name", "score"} dicts for the closest names, best first"""
+        query = self.normalize(name or '')
+        if not query:
+            return []
+        shared = Counter()
+        for gram in self.ngrams(query):
+            for position in self.postings.get(gram, ()):
+                shared[position] += 1
+        
+        matches = []
+        for position, _ in shared.most_common(max_candidates):
+            score = levenshtein_similarity(query, self.keys[position])
+            if score >= min_score:
+                matches.append({"name": self.names[position], "score": score})
+        matches.sort(key=lambda match: match["score"], reverse=True)
+        return matches[:k]
+
+def name_ngrams(key, ngram_size=FUZZY_NGRAM_SIZE):
+    """Return the padded character n-grams of a normalized key, with repeats"""
+    padded = f' {key} '
+    if len(padded) <= ngram_size:
+        return [padded]
+    return [padded[i:i + ngram_size] for i in range(len(padded) - ngram_size + 1)]
+
+def batch_closest_matches(names, candidates, top_k=1, min_score=FUZZY_MIN_SCORE, ngram_size=FUZZY_NGRAM_SIZE):
+    """
+    Score many names against a candidate list in one matrix product.
+
+    Names and candidates are encoded as n-gram count vectors over the
+    candidates' n-gram vocabulary and compared by cosine similarity.
+    Returns {name: [{"name", "score"}, ...]} with up to top_k matches each.
+    """
+    names = list(dict.fromkeys(name for name in names if name))
+    candidates = list(dict.fromkeys(candidate for candidate in candidates if candidate))
+    if not names or not candidates:
+        return {name: [] for name in names}
     
-    name_lower = name.lower()
-    for hero in OFFICIAL_HEROES:
-        hero_lower = hero.lower()
-        # Simple similarity based on character overlap
-        score = len(set(name_lower) & set(hero_lower)) / len(set(name_lower) | set(hero_lower))
-        if score > best_score and score > 0.3:  # Minimum similarity threshold
-            best_score = score
-            best_match = hero
+    candidate_grams = [Counter(name_ngrams(FuzzyNameIndex.normalize(candidate), ngram_size)) for candidate in candidates]
+    vocabulary = {}
+    for grams in candidate_grams:
+        for gram in grams:
+            vocabulary.setdefault(gram, len(vocabulary))
     
-    return {"name": best_match, "score": best_score} if best_match else None
-
-def find_closest_villain_match(name):
-    """Find the closest matching villain name using basic string similarity"""
-    if not name or not OFFICIAL_VILLAINS:
-        return None
+    candidate_matrix = np.zeros((len(candidates), len(vocabulary)), dtype=np.float32)
+    for row, grams in enumerate(candidate_grams):
+        for gram, count in grams.items():
+            candidate_matrix[row, vocabulary[gram]] = count
     
-    best_match = None
-    best_score = 0
+    # Query norms include n-grams outside the vocabulary so cosine stays exact
+    query_matrix = np.zeros((len(names), len(vocabulary)), dtype=np.float32)
+    query_norms = np.zeros(len(names), dtype=np.float32)
+    for row, name in enumerate(names):
+        grams = Counter(name_ngrams(FuzzyNameIndex.normalize(name), ngram_size))
+        query_norms[row] = np.sqrt(sum(count * count for count in grams.values()))
+        for gram, count in grams.items():
+            column = vocabulary.get(gram)
+            if column is not None:
+                query_matrix[row, column] = count
     
-    name_lower = name.lower()
-    for villain in OFFICIAL_VILLAINS:
-        villain_lower = villain.lower()
-        # Simple similarity based on character overlap
-        score = len(set(name_lower) & set(villain_lower)) / len(set(name_lower) | set(villain_lower))
-        if score > best_score and score > 0.3:  # Minimum similarity threshold
-            best_score = score
-            best_match = villain
+    scores = query_matrix @ candidate_matrix.T
+    norms = np.outer(query_norms, np.linalg.norm(candidate_matrix, axis=1))
+    scores = np.divide(scores, norms, out=np.zeros_like(scores), where=norms > 0)
     
-    return {"name": best_match, "score": best_score} if best_match else None
+    top_k = min(top_k, len(candidates))
+    best = np.argsort(-scores, axis=1, kind='stable')[:, :top_k]
+    results = {}
+    for row, name in enumerate(names):
+        results[name] = [
+            {"name": candidates[column], "score": float(scores[row, column])}
+            for column in best[row] if scores[row, column] >= min_score
+        ]
+    return results
+
+def levenshtein_similarity(a, b):
+    """Return 1 - edit_distance / max(len(a), len(b)), so 1.0 means identical"""
+    if a == b:
+        return 1.0
+    if not a or not b:
+        return 0.0
+    if len(a) < len(b):
+        a, b = b, a
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (char_a != char_b)
+            ))
+        previous = current
+    return 1.0 - previous[-1] / len(a)
+
+# Fuzzy indexes per name list, rebuilt when the list object or its size changes
+_fuzzy_indexes = {}
+
+def get_fuzzy_index(kind, names):
+    """Return the FuzzyNameIndex for a name list ('heroes' or 'villains')"""
+    source = (id(names), len(names))
+    cached = _fuzzy_indexes.get(kind)
+    if cached is None or cached[0] != source:
+        cached = (source, FuzzyNameIndex(names))
+        _fuzzy_indexes[kind] = cached
+    return cached[1]
+
+def find_closest_hero_matches(name, top_k=5):
+    """Return the top_k closest official hero names with similarity scores"""
+    if not name or not OFFICIAL_HEROES:
+        return []
+    return get_fuzzy_index('heroes', OFFICIAL_HEROES).top_k(name, top_k)
+
+def find_closest_villain_matches(name, top_k=5):
+    """Return the top_k closest official villain names with similarity scores"""
+    if not name or not OFFICIAL_VILLAINS:
+        return []
+    return get_fuzzy_index('villains', OFFICIAL_VILLAINS).top_k(name, top_k)
+
+def find_closest_hero_match(name):
+    """Find the closest matching hero name using the fuzzy name index"""
+    matches = find_closest_hero_matches(name, top_k=1)
+    return matches[0] if matches else None
+
+def find_closest_villain_match(name):
+    """Find the closest matching villain name using the fuzzy name index"""
+    matches = find_closest_villain_matches(name, top_k=1)
+    return matches[0] if matches else None
+
+# Compiled color-string cleaning rules (built once at import, see clean_hero_name)
+HERO_ASPECTS = ['Justice', 'Aggression', 'Leadership', 'Protection', 'Pool']
+_ASPECTS_ALT = '|'.join(HERO_ASPECTS)
 
+# Bare team labels carry no hero information
+_TEAM_ONLY_RE = re.compile(r'^(Team\s*\d+|팀\s*\d+|Team\s*[A-Z]?)$', re.IGNORECASE)
+
+# "Aspect: X／Hero" format
+_ASPECT_LABEL_RE = re.compile(r'^Aspect:\s*[^／]+／(.+)$')
+
+# Aspect-hero layouts combined into one anchored alternation. Alternatives are
+# tried in order at position 0, so the first layout that matches wins exactly
+# as if each pattern were tried in sequence. Each layout captures the hero
+# part in its own named group.
+_ASPECT_HERO_LAYOUTS = [
+    # "Aspect／Hero" or "Aspect/Hero" - extract hero
+    rf'^(?:{_ASPECTS_ALT})／(?P<h0>.+)$',
+    rf'^(?:{_ASPECTS_ALT})/(?P<h1>.+)$',
+
+    # "Hero／Aspect" or "Hero/Aspect" - extract hero
+    rf'^(?P<h2>.+)／(?:{_ASPECTS_ALT})(?:\s|$)',
+    rf'^(?P<h3>.+)/(?:{_ASPECTS_ALT})(?:\s|$)',
+
+    # "Aspect - Hero" or "Hero - Aspect" formats
+    rf'^(?:{_ASPECTS_ALT})\s*[-–]\s*(?P<h4>.+)$',
+    rf'^(?P<h5>.+)\s*[-–]\s*(?:{_ASPECTS_ALT})(?:\s|$)',
+
+    # "Aspect Hero" or "Hero Aspect" (space separated)
+    rf'^(?:{_ASPECTS_ALT})\s+(?P<h6>.+)$',
+    rf'^(?P<h7>.+)\s+(?:{_ASPECTS_ALT})(?:\s|$)',
+
+    # ".Aspect／Hero" format (like ".Aggression／-Gambit")
+    rf'^\.(?:{_ASPECTS_ALT})／[-]?(?P<h8>.+)$',
+    rf'^\.(?:{_ASPECTS_ALT})/[-]?(?P<h9>.+)$',
+
+    # Handle prefixed hero names like "-Gambit"
+    r'^[-](?P<h10>.+)$',
+]
+_ASPECT_HERO_RE = re.compile('|'.join(f'(?:{layout})' for layout in _ASPECT_HERO_LAYOUTS), re.IGNORECASE)
+_ASPECT_ONLY_RE = re.compile(rf'^(?:{_ASPECTS_ALT})$', re.IGNORECASE)
+
+# Everything after a full-width or ASCII slash
+_SLASH_TAIL_RE = re.compile(r'[／/].*$')
+
+# Trailing noise: aspect suffixes, parenthetical info, aspect labels and team
+# numbers. These rules have always been applied case-sensitively.
+_NOISE_TAIL_RE = re.compile(
+    r'\s*-\s*(?:Aggr|Prot|Just|Lead|Leadership|Justice|Protection|Aggression|Pool).*$'
+    r'|\s*\(.*\).*$'
+    r'|ASPECT:.*'
+    r'|Team\s*\d+.*'
+    r'|팀\s*\d+.*'
+)
+
+# "Justice Maria Hill" -> "Maria Hill" and "Bishop Justice" -> "Bishop"
+_LEADING_ASPECT_RE = re.compile(rf'^(?:{_ASPECTS_ALT})\s+(.+)$')
+_TRAILING_ASPECT_RE = re.compile(rf'^(.+)\s+(?:{_ASPECTS_ALT})$')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+@lru_cache(maxsize=CLEAN_CACHE_SIZE)
 def clean_hero_name(raw_name):
-    """Clean up hero name by removing aspects, team info, etc."""
+    """Clean up hero name by removing aspects, team info, etc.
+
+    Results are memoized per distinct raw string (see get_clean_cache_stats).
+    """
     if not raw_name or not raw_name.strip():
         return ""
     
@@ -1271,77 +2604,33 @@ def clean_hero_name(raw_name):
     name = raw_name.strip()
     
     # Skip if it's just a team number or empty
-    if re.match(r'^(Team\s*\d+|팀\s*\d+|Team\s*[A-Z]?)$', name, re.IGNORECASE):
+    if _TEAM_ONLY_RE.match(name):
         return ""
     
-    # Define all Marvel Champions aspects (including Pool)
-    aspects = ['Justice', 'Aggression', 'Leadership', 'Protection', 'Pool']
-    aspect_pattern = '|'.join([f'({asp})' for asp in aspects])
-    
     # Handle special cases first
     # Extract hero name from "Aspect: X／Hero" format
-    aspect_match = re.match(r'^Aspect:\s*[^／]+／(.+)$', name)
+    aspect_match = _ASPECT_LABEL_RE.match(name)
     if aspect_match:
         name = aspect_match.group(1).strip()
     
-    # Enhanced aspect-hero parsing patterns
-    aspect_hero_patterns = [
-        # "Aspect／Hero" or "Aspect/Hero" - extract hero
-        rf'^(?:{aspect_pattern})／(.+)$',
-        rf'^(?:{aspect_pattern})/(.+)$',
-        
-        # "Hero／Aspect" or "Hero/Aspect" - extract hero  
-        rf'^(.+)／(?:{aspect_pattern})(?:\s|$)',
-        rf'^(.+)/(?:{aspect_pattern})(?:\s|$)',
-        
-        # "Aspect - Hero" or "Hero - Aspect" formats
-        rf'^(?:{aspect_pattern})\s*[-–]\s*(.+)$',
-        rf'^(.+)\s*[-–]\s*(?:{aspect_pattern})(?:\s|$)',
-        
-        # "Aspect Hero" or "Hero Aspect" (space separated)
-        rf'^(?:{aspect_pattern})\s+(.+)$',
-        rf'^(.+)\s+(?:{aspect_pattern})(?:\s|$)',
-        
-        # ".Aspect／Hero" format (like ".Aggression／-Gambit")
-        rf'^\.(?:{aspect_pattern})／[-]?(.+)$',
-        rf'^\.(?:{aspect_pattern})/[-]?(.+)$',
-        
-        # Handle prefixed hero names like "-Gambit"
-        r'^[-](.+)$',
-    ]
-    
-    # Try each pattern to extract hero name
-    for pattern in aspect_hero_patterns:
-        match = re.match(pattern, name, re.IGNORECASE)
-        if match:
-            # Find the capture group that contains the hero name (not empty and not an aspect)
-            for group in match.groups():
-                if group and group.strip():
-                    candidate = group.strip()
-                    # Make sure it's not just an aspect name
-                    if not re.match(rf'^(?:{aspect_pattern})$', candidate, re.IGNORECASE):
-                        name = candidate
-                        break
-            break
+    # Extract the hero part from the first aspect-hero layout that matches,
+    # unless what's left is just an aspect name
+    match = _ASPECT_HERO_RE.match(name)
+    if match:
+        candidate = (match.group(match.lastgroup) or '').strip()
+        if candidate and not _ASPECT_ONLY_RE.match(candidate):
+            name = candidate
     
     # Additional cleanup patterns
-    name = re.sub(r'／.*$', '', name)  # Remove everything after ／
-    name = re.sub(r'/.*$', '', name)  # Remove everything after /
-    name = re.sub(r'\s*-\s*(Aggr|Prot|Just|Lead|Leadership|Justice|Protection|Aggression|Pool).*$', '', name, re.IGNORECASE)
-    name = re.sub(r'\s*\(.*\).*$', '', name)  # Remove parenthetical info
-    name = re.sub(r'ASPECT:.*', '', name, re.IGNORECASE)  # Remove aspect info
-    name = re.sub(r'Team\s*\d+.*', '', name, re.IGNORECASE)  # Remove team numbers
-    name = re.sub(r'팀\s*\d+.*', '', name)  # Remove Korean team numbers
+    name = _SLASH_TAIL_RE.sub('', name, count=1)
+    name = _NOISE_TAIL_RE.sub('', name, count=1)
     
     # Handle specific problematic patterns
-    # "Justice Maria Hill" -> "Maria Hill"
-    name = re.sub(rf'^(?:{aspect_pattern})\s+(.+)$', r'\6', name, re.IGNORECASE)
-    
-    # "Bishop Justice" -> "Bishop" (if Justice is at the end)
-    name = re.sub(rf'^(.+)\s+(?:{aspect_pattern})$', r'\1', name, re.IGNORECASE)
+    name = _LEADING_ASPECT_RE.sub(r'\1', name)
+    name = _TRAILING_ASPECT_RE.sub(r'\1', name)
     
     # Clean up spacing
-    name = re.sub(r'\s+', ' ', name).strip()
+    name = _WHITESPACE_RE.sub(' ', name).strip()
     
     # Return empty string if nothing meaningful remains
     if len(name) < 2 or name.isdigit():
@@ -1349,13 +2638,24 @@ def clean_hero_name(raw_name):
     
     return name
 
+def get_clean_cache_stats():
+    """Return hit/miss statistics for the clean_hero_name LRU cache"""
+    info = clean_hero_name.cache_info()
+    lookups = info.hits + info.misses
+    return {
+        'hits': info.hits,
+        'misses': info.misses,
+        'size': info.currsize,
+        'maxsize': info.maxsize,
+        'hit_rate': info.hits / lookups if lookups else 0.0
+    }
+
 def extract_hero_mentions_from_plays(plays_list):
-    """Extract hero mentions from a list of play elements"""
+    """Extract hero mentions from a list of play records or elements"""
     comments = []
-    for play in plays_list:
-        comment_elem = play.find("comments")
-        if comment_elem is not None and comment_elem.text:
-            comments.append(comment_elem.text.strip())
+    for play in map(as_play_record, plays_list):
+        if play.comments:
+            comments.append(play.comments.strip())
 
     hero_counts = {}
     for comment in comments:
@@ -1372,244 +2672,405 @@ def extract_hero_mentions_from_plays(plays_list):
     results.sort(key=lambda x: x["mention_count"], reverse=True)
     return results
 
-def parse_heroes_from_comments(comments, play_id=None):
+# Comment parsing tables. Campaign patterns infer default heroes (the first
+# matching campaign in table order wins); villain and hero patterns list the
+# spellings of each name as a single \b(...)\b alternation.
+COMMENT_CAMPAIGN_PATTERNS = {
+    # English campaign patterns
+    r'\b(?:shield|s\.?h\.?i\.?e\.?l\.?d\.?)\s+campaign\b': ['Agent 13', 'Nick Fury'],
+    r'\bagents?\s+of\s+shield\b': ['Agent 13', 'Nick Fury'],
+    r'\bmutant\s+genesis\b': ['Wolverine', 'Storm', 'Cyclops'],
+    r'\bnext\s+evolution\b': ['Colossus', 'Shadowcat'],
+    r'\bsinister\s+motives\b': ['Ghost-Spider', 'Miles Morales'],
+    r'\bmad\s+titan\'?s?\s+shadow\b': ['Adam Warlock', 'Spectrum'],
+    r'\bgalaxy\'?s?\s+most\s+wanted\b': ['Groot', 'Rocket Raccoon'],
+    r'\brise\s+of\s+red\s+skull\b': ['Hawkeye', 'Spider-Woman'],
+    r'\bhood\b.*\bcampaign\b': ['Captain America', 'Iron Man'],
+    
+    # French campaign patterns  
+    r'\bcampagne\s+shield\b': ['Agent 13', 'Nick Fury'],
+    r'\bcampagne\s+s\.?h\.?i\.?e\.?l\.?d\.?\b': ['Agent 13', 'Nick Fury'],
+    
+    # Spanish campaign patterns
+    r'\bcampaña\s+shield\b': ['Agent 13', 'Nick Fury'],
+    r'\bcampaña\s+s\.?h\.?i\.?e\.?l\.?d\.?\b': ['Agent 13', 'Nick Fury'],
+    
+    # German campaign patterns
+    r'\bschild\s+kampagne\b': ['Agent 13', 'Nick Fury'],
+    r'\bs\.?h\.?i\.?e\.?l\.?d\.?\s+kampagne\b': ['Agent 13', 'Nick Fury'],
+}
+
+# Villain detection - villain names in comments
+COMMENT_VILLAIN_PATTERNS = {
+    # Common villain name patterns (English, French, Spanish variants)
+    r'\b(batroc|bartoc)\b': 'Batroc',  # The villain from your example
+    r'\b(red skull|crâne rouge|calavera roja)\b': 'Red Skull',
+    r'\b(green goblin|goblin vert|duende verde)\b': 'Green Goblin',
+    r'\b(ultron)\b': 'Ultron',
+    r'\b(rhino|rhinocéros|rinoceronte)\b': 'Rhino',
+    r'\b(klaw|garra)\b': 'Klaw',
+    r'\b(taskmaster|supervisor de tareas)\b': 'Taskmaster',
+    r'\b(crossbones|huesos cruzados)\b': 'Crossbones',
+    r'\b(absorbing man|hombre absorbente)\b': 'Absorbing Man',
+    r'\b(titania)\b': 'Titania',
+    r'\b(wrecker|demoledor)\b': 'Wrecker',
+    r'\b(thunderball)\b': 'Thunderball',
+    r'\b(piledriver|piloteador)\b': 'Piledriver',
+    r'\b(bulldozer)\b': 'Bulldozer',
+    r'\b(nebula)\b': 'Nebula',  # Can be villain in some contexts
+    r'\b(ronan|ronan el acusador)\b': 'Ronan',
+    r'\b(collector|coleccionista)\b': 'Collector',
+    r'\b(drang)\b': 'Drang',
+    r'\b(ebony maw)\b': 'Ebony Maw',
+    r'\b(thanos)\b': 'Thanos',
+    r'\b(magneto|magnéto)\b': 'Magneto',
+    r'\b(sentinel|centinela)\b': 'Sentinel',
+    r'\b(mystique|mística)\b': 'Mystique',
+    r'\b(sabretooth|dientes de sable)\b': 'Sabretooth',
+    r'\b(juggernaut|mole)\b': 'Juggernaut',
+    r'\b(apocalypse|apocalipsis)\b': 'Apocalypse',
+    r'\b(mojo)\b': 'MojoMania',
+    r'\b(spiral)\b': 'Spiral',
+    r'\b(dark beast|bestia oscura)\b': 'Dark Beast',
+}
+
+# "against X" / "vs X" context, reported as a potential villain
+COMMENT_VILLAIN_CONTEXT_PATTERN = r'\b(?:against|vs\.?|versus|contre|contra)\s+([a-z\-\s]+)\b'
+
+# Common patterns for heroes in Marvel Champions comments
+COMMENT_HERO_PATTERNS = [
+    # Direct hero mentions with common formats
+    r'\b(spider-?man|spiderman)\b',
+    r'\b(iron-?man|ironman)\b', 
+    r'\b(captain america|cap america|steve rogers)\b',
+    r'\b(black widow|natasha)\b',
+    r'\b(she-?hulk|jennifer walters)\b',
+    r'\b(ms\.?\s*marvel|kamala|kamala khan)\b',
+    r'\b(doctor strange|dr\.?\s*strange|stephen strange)\b',
+    r'\b(captain marvel|carol danvers)\b',
+    r'\b(ant-?man|antman|scott lang)\b',
+    r'\b(wasp|janet|hope van dyne)\b',
+    r'\b(quicksilver|pietro)\b',
+    r'\b(scarlet witch|wanda|wanda maximoff)\b',
+    r'\b(hawkeye|clint barton)\b',
+    r'\b(black panther|t\'?challa)\b',
+    r'\b(spider-?woman|jessica drew)\b',
+    r'\b(valkyrie|brunnhilde)\b',
+    r'\b(vision|the vision)\b',
+    r'\b(war machine|james rhodes|rhodey)\b',
+    r'\b(falcon|sam wilson)\b',
+    r'\b(winter soldier|bucky|bucky barnes)\b',
+    r'\b(hulk|bruce banner)\b',
+    r'\b(thor|god of thunder)\b',
+    r'\b(wolverine|logan|james howlett)\b',
+    r'\b(storm|ororo)\b',
+    r'\b(cyclops|scott summers)\b',
+    r'\b(phoenix|jean grey)\b',
+    r'\b(colossus|piotr)\b',
+    r'\b(nightcrawler|kurt wagner)\b',
+    r'\b(shadowcat|kitty pryde)\b',
+    r'\b(gambit|remy lebeau)\b',
+    r'\b(rogue|marie)\b',
+    r'\b(deadpool|wade wilson)\b',
+    r'\b(cable|nathan summers)\b',
+    r'\b(domino|neena thurman)\b',
+    r'\b(psylocke|betsy braddock)\b',
+    r'\b(angel|warren worthington)\b',
+    r'\b(iceman|bobby drake)\b',
+    r'\b(magik|illyana rasputin)\b',
+    r'\b(nova|richard rider|sam alexander)\b',
+    r'\b(spider-?ham|peter porker)\b',
+    r'\b(ghost-?spider|spider-?gwen|gwen stacy)\b',
+    r'\b(miles morales|miles|ultimate spider-?man)\b',
+    r'\b(silk|cindy moon)\b',
+    r'\b(spider-?man 2099|miguel o\'?hara)\b',
+    r'\b(venom|eddie brock)\b',
+    r'\b(groot|i am groot)\b',
+    r'\b(rocket raccoon|rocket)\b',
+    r'\b(star-?lord|peter quill)\b',
+    r'\b(gamora|deadliest woman)\b',
+    r'\b(drax|the destroyer)\b',
+    r'\b(nebula|blue meanie)\b',
+    r'\b(adam warlock|adam)\b',
+    r'\b(maria hill|agent hill)\b',
+    r'\b(ironheart|riri williams)\b',
+    r'\b(x-?23|laura kinney)\b',
+    r'\b(jubilee|jubilation lee)\b',
+    r'\b(bishop|lucas bishop)\b',
+    
+    # Marvel Champions specific nickname patterns
+    r'\b(cap marvel|capmarv)\b',  # Captain Marvel nicknames
+    r'\b(panther)\b',  # Black Panther nickname
+    r'\b(spidey)\b',  # Spider-Man nickname
+    r'\b(wolverine|wolvie|logan)\b',  # Wolverine variations
+    r'\b(drax)\b',  # Drax nickname
+]
+
+# Generic comment structures ("Hero vs Villain", "Hero (Aspect)", "Hero - Aspect",
+# "Aspect／Hero", "Hero & Hero", "Hero, Hero") are read by a tokenizer, see
+# comment_structural_candidates. Rule names, in the order candidates are tried:
+COMMENT_STRUCTURAL_RULES = ['versus', 'aspect_parens', 'aspect_dash', 'aspect_slash', 'ampersand', 'comma_list', 'x_versus']
+_COMMENT_RUN_RE = re.compile(r'[a-z\-\s]+')
+_COMMENT_ASPECT_RE = re.compile(r'aggression|justice|protection|leadership|pool')
+_COMMENT_RUN_LEAD_CHARS = ' \t\n\r\f\v-'
+
+# Common non-hero words captured by the structural patterns
+COMMENT_SKIP_WORDS = {'with', 'and', 'the', 'vs', 'against', 'lose', 'lost', 'win', 'won', 
+                      'play', 'played', 'game', 'solo', 'duo', 'team', 'mode', 'standard', 
+                      'expert', 'heroic', 'campaign', 'scenario', 'deck', 'card', 'pack',
+                      'experto', 'normal', 'oturum', 'kazandik', 'kazandık'}
+
+_comment_matcher = None
+
+def _pattern_alternatives(pattern):
+    """Split a r'\b(a|b|c)\b' token pattern into its alternatives"""
+    return pattern[len(r'\b('):-len(r')\b')].split('|')
+
+def get_comment_matcher():
     """
-    Parse hero names from BGG play comments using various heuristics.
-    Returns list of potential hero names found in the comments.
+    Build (once per villain list) the single-pass matcher over all campaign, villain and hero tokens.
+
+    Every spelling becomes one alternative of a single compiled regex (longest
+    first, so "spider-man 2099" wins over "spider-man" at the same position),
+    and each alternative maps back to the table entries it came from. A
+    campaign pattern of the form "a.*b" is split into a start and an end token.
     """
-    if not comments:
-        return []
+    global _comment_matcher
+    villain_matcher = get_villain_matcher()
+    if _comment_matcher is not None and _comment_matcher['villain_matcher'] is villain_matcher:
+        return _comment_matcher
     
-    heroes_found = []
-    comment_lower = comments.lower()
-    
-    # Campaign detection - infer default heroes from campaigns
-    campaign_patterns = {
-        # English campaign patterns
-        r'\b(?:shield|s\.?h\.?i\.?e\.?l\.?d\.?)\s+campaign\b': ['Agent 13', 'Nick Fury'],
-        r'\bagents?\s+of\s+shield\b': ['Agent 13', 'Nick Fury'],
-        r'\bmutant\s+genesis\b': ['Wolverine', 'Storm', 'Cyclops'],
-        r'\bnext\s+evolution\b': ['Colossus', 'Shadowcat'],
-        r'\bsinister\s+motives\b': ['Ghost-Spider', 'Miles Morales'],
-        r'\bmad\s+titan\'?s?\s+shadow\b': ['Adam Warlock', 'Spectrum'],
-        r'\bgalaxy\'?s?\s+most\s+wanted\b': ['Groot', 'Rocket Raccoon'],
-        r'\brise\s+of\s+red\s+skull\b': ['Hawkeye', 'Spider-Woman'],
-        r'\bhood\b.*\bcampaign\b': ['Captain America', 'Iron Man'],
-        
-        # French campaign patterns  
-        r'\bcampagne\s+shield\b': ['Agent 13', 'Nick Fury'],
-        r'\bcampagne\s+s\.?h\.?i\.?e\.?l\.?d\.?\b': ['Agent 13', 'Nick Fury'],
-        
-        # Spanish campaign patterns
-        r'\bcampaña\s+shield\b': ['Agent 13', 'Nick Fury'],
-        r'\bcampaña\s+s\.?h\.?i\.?e\.?l\.?d\.?\b': ['Agent 13', 'Nick Fury'],
-        
-        # German campaign patterns
-        r'\bschild\s+kampagne\b': ['Agent 13', 'Nick Fury'],
-        r'\bs\.?h\.?i\.?e\.?l\.?d\.?\s+kampagne\b': ['Agent 13', 'Nick Fury'],
-    }
+    roles = defaultdict(list)  # fragment -> [(kind, ...), ...]
+    for index, pattern in enumerate(COMMENT_CAMPAIGN_PATTERNS):
+        parts = pattern.split('.*')
+        if len(parts) == 2:
+            roles[parts[0]].append(('campaign_start', index))
+            roles[parts[1]].append(('campaign_end', index))
+        else:
+            roles[pattern].append(('campaign', index))
+    for spelling, villain_name in villain_matcher['comment_names'].items():
+        roles[re.escape(spelling)].append(('villain', villain_name, spelling))
+    for index, pattern in enumerate(COMMENT_HERO_PATTERNS):
+        for fragment in _pattern_alternatives(pattern):
+            roles[fragment].append(('hero', index, pattern))
     
-    # Check for campaign patterns first
-    for pattern, default_heroes in campaign_patterns.items():
-        if re.search(pattern, comment_lower, re.IGNORECASE):
-            for hero in default_heroes:
-                heroes_found.append({
-                    'original': f'Campaign: {hero}',
-                    'cleaned': hero.lower(),
-                    'matched': hero,
-                    'is_official': True,
-                    'is_fuzzy': False,
-                    'is_altered': False,
-                    'pattern': f'campaign_detection: {pattern}',
-                    'source': 'campaign_inference'
-                })
-            if TERMINAL_DEBUG:
-                colored_print(f"    🏛️ Campaign detected: {default_heroes} from pattern '{pattern}'", Colors.GREEN)
-            break  # Only use first matching campaign pattern
-    
-    # Villain detection - look for villain names in comments
-    villain_patterns = {
-        # Common villain name patterns (English, French, Spanish variants)
-        r'\b(?:against|vs\.?|versus|contre|contra)\s+([a-z\-\s]+)\b': 'villain_context',
-        r'\b(batroc|bartoc)\b': 'Batroc',  # The villain from your example
-        r'\b(red skull|crâne rouge|calavera roja)\b': 'Red Skull',
-        r'\b(green goblin|goblin vert|duende verde)\b': 'Green Goblin',
-        r'\b(ultron)\b': 'Ultron',
-        r'\b(rhino|rhinocéros|rinoceronte)\b': 'Rhino',
-        r'\b(klaw|garra)\b': 'Klaw',
-        r'\b(taskmaster|supervisor de tareas)\b': 'Taskmaster',
-        r'\b(crossbones|huesos cruzados)\b': 'Crossbones',
-        r'\b(absorbing man|hombre absorbente)\b': 'Absorbing Man',
-        r'\b(titania)\b': 'Titania',
-        r'\b(wrecker|demoledor)\b': 'Wrecker',
-        r'\b(thunderball)\b': 'Thunderball',
-        r'\b(piledriver|piloteador)\b': 'Piledriver',
-        r'\b(bulldozer)\b': 'Bulldozer',
-        r'\b(nebula)\b': 'Nebula',  # Can be villain in some contexts
-        r'\b(ronan|ronan el acusador)\b': 'Ronan',
-        r'\b(collector|coleccionista)\b': 'Collector',
-        r'\b(drang)\b': 'Drang',
-        r'\b(ebony maw)\b': 'Ebony Maw',
-        r'\b(thanos)\b': 'Thanos',
-        r'\b(magneto|magnéto)\b': 'Magneto',
-        r'\b(sentinel|centinela)\b': 'Sentinel',
-        r'\b(mystique|mística)\b': 'Mystique',
-        r'\b(sabretooth|dientes de sable)\b': 'Sabretooth',
-        r'\b(juggernaut|mole)\b': 'Juggernaut',
-        r'\b(apocalypse|apocalipsis)\b': 'Apocalypse',
-        r'\b(mojo)\b': 'MojoMania',
-        r'\b(spiral)\b': 'Spiral',
-        r'\b(dark beast|bestia oscura)\b': 'Dark Beast',
+    # Alternatives carry no capture groups: a group in front of every
+    # alternative defeats the regex engine's first-character check and makes
+    # the scan an order of magnitude slower. Matched text is mapped back to
+    # its alternative afterwards (see comment_token_roles).
+    fragments = sorted(roles, key=len, reverse=True)
+    regex = re.compile(r'\b(?:' + '|'.join(fragments) + r')\b', re.IGNORECASE)
+    _comment_matcher = {
+        'villain_matcher': villain_matcher,
+        'regex': regex,
+        'fragments': [(re.compile(fragment, re.IGNORECASE), roles[fragment]) for fragment in fragments],
+        'token_roles': {},
+        'villain_context': re.compile(COMMENT_VILLAIN_CONTEXT_PATTERN, re.IGNORECASE)
     }
+    return _comment_matcher
+
+def comment_structural_candidates(text, max_candidate_chars=COMMENT_MAX_CANDIDATE_CHARS):
+    """
+    Return (candidate, rule) spans for the generic comment structures in linear time.
+
+    The text is split once into runs of letters, hyphens and whitespace (the
+    character class the old structural regexes captured). Candidates are then
+    read off the runs next to each separator: ",", "&" and "+", the words
+    "v"/"vs"/"x" inside a run, "(...aspect...)" groups, "- aspect" suffixes and
+    "aspect／hero" notation. Nothing backtracks, so long free-text comments
+    cost time proportional to their length. Candidates longer than
+    max_candidate_chars cannot be hero names and are dropped.
+    """
+    candidates = {rule: [] for rule in COMMENT_STRUCTURAL_RULES}
+    runs = [(match.start(), match.end()) for match in _COMMENT_RUN_RE.finditer(text)]
+    if not runs:
+        return []
+    run_starts = [start for start, _ in runs]
+    run_end_by_start = {start: end for start, end in runs}
+    run_start_by_end = {end: start for start, end in runs}
     
-    for pattern, villain_name in villain_patterns.items():
-        matches = re.findall(pattern, comment_lower, re.IGNORECASE)
-        if matches and villain_name != 'villain_context':
-            if TERMINAL_DEBUG:
-                colored_print(f"    🦹 Villain detected in comments: '{villain_name}' from pattern '{pattern}'", Colors.MAGENTA)
-        elif matches and villain_name == 'villain_context':
-            # Extract the villain name from the context
-            for match in matches:
-                villain_candidate = match.strip()
-                if len(villain_candidate) > 2:
-                    if TERMINAL_DEBUG:
-                        colored_print(f"    🦹 Potential villain in comments: '{villain_candidate}'", Colors.MAGENTA)
-    
-    # Common patterns for heroes in Marvel Champions comments
-    patterns = [
-        # Direct hero mentions with common formats
-        r'\b(spider-?man|spiderman)\b',
-        r'\b(iron-?man|ironman)\b', 
-        r'\b(captain america|cap america|steve rogers)\b',
-        r'\b(black widow|natasha)\b',
-        r'\b(she-?hulk|jennifer walters)\b',
-        r'\b(ms\.?\s*marvel|kamala|kamala khan)\b',
-        r'\b(doctor strange|dr\.?\s*strange|stephen strange)\b',
-        r'\b(captain marvel|carol danvers)\b',
-        r'\b(ant-?man|antman|scott lang)\b',
-        r'\b(wasp|janet|hope van dyne)\b',
-        r'\b(quicksilver|pietro)\b',
-        r'\b(scarlet witch|wanda|wanda maximoff)\b',
-        r'\b(hawkeye|clint barton)\b',
-        r'\b(black panther|t\'?challa)\b',
-        r'\b(spider-?woman|jessica drew)\b',
-        r'\b(valkyrie|brunnhilde)\b',
-        r'\b(vision|the vision)\b',
-        r'\b(war machine|james rhodes|rhodey)\b',
-        r'\b(falcon|sam wilson)\b',
-        r'\b(winter soldier|bucky|bucky barnes)\b',
-        r'\b(hulk|bruce banner)\b',
-        r'\b(thor|god of thunder)\b',
-        r'\b(wolverine|logan|james howlett)\b',
-        r'\b(storm|ororo)\b',
-        r'\b(cyclops|scott summers)\b',
-        r'\b(phoenix|jean grey)\b',
-        r'\b(colossus|piotr)\b',
-        r'\b(nightcrawler|kurt wagner)\b',
-        r'\b(shadowcat|kitty pryde)\b',
-        r'\b(gambit|remy lebeau)\b',
-        r'\b(rogue|marie)\b',
-        r'\b(deadpool|wade wilson)\b',
-        r'\b(cable|nathan summers)\b',
-        r'\b(domino|neena thurman)\b',
-        r'\b(psylocke|betsy braddock)\b',
-        r'\b(angel|warren worthington)\b',
-        r'\b(iceman|bobby drake)\b',
-        r'\b(magik|illyana rasputin)\b',
-        r'\b(nova|richard rider|sam alexander)\b',
-        r'\b(spider-?ham|peter porker)\b',
-        r'\b(ghost-?spider|spider-?gwen|gwen stacy)\b',
-        r'\b(miles morales|miles|ultimate spider-?man)\b',
-        r'\b(silk|cindy moon)\b',
-        r'\b(spider-?man 2099|miguel o\'?hara)\b',
-        r'\b(venom|eddie brock)\b',
-        r'\b(groot|i am groot)\b',
-        r'\b(rocket raccoon|rocket)\b',
-        r'\b(star-?lord|peter quill)\b',
-        r'\b(gamora|deadliest woman)\b',
-        r'\b(drax|the destroyer)\b',
-        r'\b(nebula|blue meanie)\b',
-        r'\b(adam warlock|adam)\b',
-        r'\b(maria hill|agent hill)\b',
-        r'\b(ironheart|riri williams)\b',
-        r'\b(x-?23|laura kinney)\b',
-        r'\b(jubilee|jubilation lee)\b',
-        r'\b(bishop|lucas bishop)\b',
-        
-        # Marvel Champions specific nickname patterns
-        r'\b(cap marvel|capmarv)\b',  # Captain Marvel nicknames
-        r'\b(panther)\b',  # Black Panther nickname
-        r'\b(spidey)\b',  # Spider-Man nickname
-        r'\b(wolverine|wolvie|logan)\b',  # Wolverine variations
-        r'\b(drax)\b',  # Drax nickname
-        
-        # Pattern for "Hero vs Villain" format
-        r'\b([a-z\-\s]+)\s+vs?\s+[a-z\-\s]+\b',
-        
-        # Pattern for "Hero (Aspect)" format
-        r'\b([a-z\-\s]+)\s*\([^)]*(?:aggression|justice|protection|leadership|pool)[^)]*\)',
-        
-        # Pattern for "Hero - Aspect" format  
-        r'\b([a-z\-\s]+)\s*[-–]\s*(?:aggression|justice|protection|leadership|pool)\b',
+    def add(rule, start, end):
+        candidate = text[start:end].lstrip(_COMMENT_RUN_LEAD_CHARS).rstrip()
+        if candidate and len(candidate) <= max_candidate_chars:
+            candidates[rule].append(candidate)
+    
+    close_positions = [i for i, char in enumerate(text) if char == ')']
+    aspects = [(match.start(), match.end()) for match in _COMMENT_ASPECT_RE.finditer(text)]
+    aspect_starts = [start for start, _ in aspects]
+    
+    for start, end in runs:
+        # "Hero vs Villain" / "Hero x Villain": words before a separator word
+        words = text[start:end].split()
+        segment_start = 0
+        for i in range(1, len(words) - 1):
+            if words[i] in ('v', 'vs', 'x'):
+                rule = 'x_versus' if words[i] == 'x' else 'versus'
+                candidate = ' '.join(words[segment_start:i]).lstrip('-')
+                if candidate and len(candidate) <= max_candidate_chars:
+                    candidates[rule].append(candidate)
+                segment_start = i + 1
         
-        # Pattern for aspect notation like "Justice／She-hulk"
-        r'(?:aggression|justice|protection|leadership|pool)／([a-z\-\s]+)',
-        r'([a-z\-\s]+)／(?:aggression|justice|protection|leadership|pool)',
+        following = text[end:end + 1]
+        preceding = text[start - 1:start] if start > 0 else ''
         
-        # Pattern for hero combinations with "&" or "and"
-        r'\b([a-z\-\s]+)\s*[&+]\s*([a-z\-\s]+)',
+        # "Hero (…Aspect…)"
+        if following == '(':
+            close = bisect.bisect_left(close_positions, end)
+            if close < len(close_positions):
+                first_aspect = bisect.bisect_left(aspect_starts, end + 1)
+                if first_aspect < len(aspects) and aspects[first_aspect][1] <= close_positions[close]:
+                    add('aspect_parens', start, end)
         
-        # Pattern for hero lists with commas
-        r'\b([a-z\-\s]+),\s*([a-z\-\s]+)(?:,\s*([a-z\-\s]+))?',
+        # "Hero & Hero", "Hero + Hero" and "Hero, Hero, Hero"
+        if following in ('&', '+'):
+            add('ampersand', start, end)
+        if preceding in ('&', '+'):
+            add('ampersand', start, end)
+        if following == ',':
+            add('comma_list', start, end)
+        if preceding == ',':
+            add('comma_list', start, end)
+    
+    for aspect_start, aspect_end in aspects:
+        # "Hero - Aspect" / "Hero – Aspect"
+        if aspect_end == len(text) or not (text[aspect_end].isalnum() or text[aspect_end] == '_'):
+            dash = aspect_start - 1
+            while dash >= 0 and text[dash].isspace():
+                dash -= 1
+            if dash > 0 and text[dash] in '-–':
+                run_index = bisect.bisect_right(run_starts, dash - 1) - 1
+                if run_index >= 0 and runs[run_index][1] >= dash:
+                    add('aspect_dash', runs[run_index][0], dash)
         
-        # Pattern for "Hero x Villain" format (x as vs)
-        r'\b([a-z\-\s]+)\s+x\s+[a-z\-\s]+\b',
-    ]
+        # "Aspect／Hero" and "Hero／Aspect"
+        if text[aspect_end:aspect_end + 1] == '／' and aspect_end + 1 in run_end_by_start:
+            add('aspect_slash', aspect_end + 1, run_end_by_start[aspect_end + 1])
+        if aspect_start > 0 and text[aspect_start - 1] == '／' and aspect_start - 1 in run_start_by_end:
+            add('aspect_slash', run_start_by_end[aspect_start - 1], aspect_start - 1)
+    
+    return [(candidate, rule) for rule in COMMENT_STRUCTURAL_RULES for candidate in candidates[rule]]
+
+def comment_token_roles(matcher, text):
+    """Return the table roles of a token matched by the combined comment regex"""
+    roles = matcher['token_roles'].get(text)
+    if roles is None:
+        # The alternation picks the first alternative that matches, which is
+        # also the first one that matches the whole token on its own
+        roles = next((fragment_roles for regex, fragment_roles in matcher['fragments'] if regex.fullmatch(text)), [])
+        matcher['token_roles'][text] = roles
+    return roles
+
+def _match_comment_hero(candidate, pattern, heroes_found):
+    """Match one comment candidate against the official list; returns True if added"""
+    # Clean up the match
+    hero_name = candidate.strip()
+    if not hero_name or len(hero_name) < 3:
+        return False
+    
+    # Skip common non-hero words
+    if hero_name.lower() in COMMENT_SKIP_WORDS:
+        return False
+    
+    # Try to match against known heroes
+    official_match, is_official, is_fuzzy, is_altered = match_to_official_hero(hero_name)
+    if not (is_official or is_fuzzy):
+        return False
+    heroes_found.append({
+        'original': candidate,
+        'cleaned': hero_name,
+        'matched': official_match,
+        'is_official': is_official,
+        'is_fuzzy': is_fuzzy,
+        'is_altered': is_altered,
+        'pattern': pattern
+    })
+    
+    if TERMINAL_DEBUG:
+        if is_official:
+            colored_print(f"    ✅ Found hero in comments: '{candidate}' → '{official_match}'", Colors.GREEN)
+        elif is_fuzzy:
+            colored_print(f"    🎯 Fuzzy match in comments: '{candidate}' → '{official_match}'", Colors.BLUE)
+    return True
+
+def parse_comment_entities(comments, play_id=None):
+    """
+    Parse heroes, villains and the campaign from BGG play comments.
+    Returns {'heroes': [...], 'villains': [...], 'campaign': pattern or None}.
+
+    Campaign, villain and hero tokens are found in one pass of the combined
+    comment matcher; the generic structures are then tokenized from the text
+    left once the matched hero tokens are blanked out. Only the first
+    COMMENT_MAX_CHARS characters of a comment are parsed.
+    """
+    if not comments:
+        return {'heroes': [], 'villains': [], 'campaign': None}
+    
+    heroes_found = []
+    comment_lower = comments[:COMMENT_MAX_CHARS].lower()
+    matcher = get_comment_matcher()
+    
+    campaign_hits = set()
+    campaign_starts = defaultdict(list)
+    campaign_ends = defaultdict(list)
+    villain_hits = {}
+    hero_hits = []
+    for match in matcher['regex'].finditer(comment_lower):
+        for role in comment_token_roles(matcher, match.group()):
+            kind = role[0]
+            if kind == 'hero':
+                hero_hits.append((role[1], match.start(), match.end(), match.group(), role[2]))
+            elif kind == 'villain':
+                villain_hits.setdefault(role[1], role[2])
+            elif kind == 'campaign':
+                campaign_hits.add(role[1])
+            elif kind == 'campaign_start':
+                campaign_starts[role[1]].append(match.end())
+            else:
+                campaign_ends[role[1]].append(match.start())
+    
+    # "a.*b" campaigns need an end token after a start token on the same line
+    for index, starts in campaign_starts.items():
+        for start in starts:
+            if any(end >= start and '\n' not in comment_lower[start:end] for end in campaign_ends.get(index, ())):
+                campaign_hits.add(index)
+                break
+    
+    # Campaign detection - infer default heroes from the first matching campaign
+    campaign = None
+    if campaign_hits:
+        pattern, default_heroes = list(COMMENT_CAMPAIGN_PATTERNS.items())[min(campaign_hits)]
+        campaign = pattern
+        for hero in default_heroes:
+            heroes_found.append({
+                'original': f'Campaign: {hero}',
+                'cleaned': hero.lower(),
+                'matched': hero,
+                'is_official': True,
+                'is_fuzzy': False,
+                'is_altered': False,
+                'pattern': f'campaign_detection: {pattern}',
+                'source': 'campaign_inference'
+            })
+        if TERMINAL_DEBUG:
+            colored_print(f"    🏛️ Campaign detected: {default_heroes} from pattern '{pattern}'", Colors.GREEN)
     
-    for pattern in patterns:
-        matches = re.findall(pattern, comment_lower, re.IGNORECASE)
-        for match in matches:
-            # Handle both single matches and tuple matches (from multiple capture groups)
-            match_list = []
-            if isinstance(match, tuple):
-                # Multiple capture groups - process each non-empty group
-                match_list = [m for m in match if m and m.strip()]
-            else:
-                # Single match
-                match_list = [match] if match and match.strip() else []
-            
-            for hero_candidate in match_list:
-                # Clean up the match
-                hero_name = hero_candidate.strip()
-                if not hero_name or len(hero_name) < 3:
-                    continue
-                    
-                # Skip common non-hero words
-                skip_words = {'with', 'and', 'the', 'vs', 'against', 'lose', 'lost', 'win', 'won', 
-                             'play', 'played', 'game', 'solo', 'duo', 'team', 'mode', 'standard', 
-                             'expert', 'heroic', 'campaign', 'scenario', 'deck', 'card', 'pack',
-                             'experto', 'normal', 'oturum', 'kazandik', 'kazandık'}
-                if hero_name.lower() in skip_words:
-                    continue
-                    
-                # Try to match against known heroes
-                official_match, is_official, is_fuzzy, is_altered = match_to_official_hero(hero_name)
-                if is_official or is_fuzzy:
-                    heroes_found.append({
-                        'original': hero_candidate,
-                        'cleaned': hero_name,
-                        'matched': official_match,
-                        'is_official': is_official,
-                        'is_fuzzy': is_fuzzy,
-                        'is_altered': is_altered,
-                        'pattern': pattern
-                    })
-                    
-                    if TERMINAL_DEBUG:
-                        if is_official:
-                            colored_print(f"    ✅ Found hero in comments: '{hero_candidate}' → '{official_match}'", Colors.GREEN)
-                        elif is_fuzzy:
-                            colored_print(f"    🎯 Fuzzy match in comments: '{hero_candidate}' → '{official_match}'", Colors.BLUE)
+    if TERMINAL_DEBUG:
+        for villain_name, spelling in villain_hits.items():
+            colored_print(f"    🦹 Villain detected in comments: '{villain_name}' from '{spelling}'", Colors.MAGENTA)
+        for match in matcher['villain_context'].findall(comment_lower):
+            villain_candidate = match.strip()
+            if len(villain_candidate) > 2:
+                colored_print(f"    🦹 Potential villain in comments: '{villain_candidate}'", Colors.MAGENTA)
+    
+    # Hero tokens in table order, blanking out every span that matched a hero
+    residual = list(comment_lower)
+    for _, start, end, text, pattern in sorted(hero_hits):
+        if _match_comment_hero(text, pattern, heroes_found):
+            residual[start:end] = ' ' * (end - start)
+    residual = ''.join(residual)
+    
+    for hero_candidate, rule in comment_structural_candidates(residual):
+        _match_comment_hero(hero_candidate, f'structural: {rule}', heroes_found)
     
     # Remove duplicates based on matched hero name
     seen = set()
@@ -1622,7 +3083,30 @@ def parse_heroes_from_comments(comments, play_id=None):
     if TERMINAL_DEBUG and unique_heroes:
         colored_print(f"    📝 Total unique heroes found in comments: {len(unique_heroes)}", Colors.CYAN)
         
-    return unique_heroes
+    return {'heroes': unique_heroes, 'villains': list(villain_hits), 'campaign': campaign}
+
+def parse_comment_villains(comments):
+    """
+    Return the villains/scenarios named in a BGG play comment.
+
+    Runs only the combined comment matcher, without the hero matching and
+    structural parse of parse_comment_entities, so it is cheap enough for
+    every play. The villains are the ones parse_comment_entities reports.
+    """
+    villain_hits = {}
+    matcher = get_comment_matcher()
+    for match in matcher['regex'].finditer(comments[:COMMENT_MAX_CHARS].lower()):
+        for role in comment_token_roles(matcher, match.group()):
+            if role[0] == 'villain':
+                villain_hits.setdefault(role[1], role[2])
+    return list(villain_hits)
+
+def parse_heroes_from_comments(comments, play_id=None):
+    """
+    Parse hero names from BGG play comments using various heuristics.
+    Returns list of potential hero names found in the comments.
+    """
+    return parse_comment_entities(comments, play_id)['heroes']
 
 def lookup_user_id_from_username(username):
     """Convert username to user ID using BGG API"""
@@ -1664,6 +3148,15 @@ def fetch_recent_month_users(year=2025, month=6, max_users=MAX_USERS):
     
     colored_print(f"🎯 Selected {len(all_user_ids)} users for analysis", Colors.GREEN)
     return all_user_ids
+
+def parse_resolution_order(value):
+    """argparse type for --resolution-order: a comma-separated list of cascade tiers"""
+    tiers = [tier.strip() for tier in value.split(',') if tier.strip()]
+    unknown = [tier for tier in tiers if tier not in RESOLUTION_TIERS]
+    if not tiers or unknown or len(set(tiers)) != len(tiers):
+        raise argparse.ArgumentTypeError(f"expected distinct tiers from {', '.join(RESOLUTION_TIERS)}, got '{value}'")
+    return tiers
+
 def parse_arguments():
     """Parse command line arguments"""
     parser = argparse.ArgumentParser(
@@ -1699,6 +3192,45 @@ def parse_arguments():
         action='store_true',
         help='Use conservative settings (fewer users, plays, and longer delays)'
     )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Do not read or write the on-disk resolution, translation and per-user result caches'
+    )
+    parser.add_argument(
+        '--resolution-order',
+        type=parse_resolution_order,
+        default=','.join(RESOLUTION_ORDER),
+        help='Comma-separated resolution tiers to try, in order (omit a tier to disable it)'
+    )
+    parser.add_argument(
+        '--pages',
+        type=int,
+        default=RECENT_PLAY_PAGES,
+        help='Pages of recent plays to fetch for the multi-user analysis'
+    )
+    parser.add_argument(
+        '--stream',
+        action='store_true',
+        help='Analyze each page while it downloads instead of holding every play in memory'
+    )
+    parser.add_argument(
+        '--resume',
+        action='store_true',
+        help='Continue the crawl saved when an earlier run hit the API call limit or was interrupted (same users and mode)'
+    )
+    parser.add_argument(
+        '--jobs', '-j',
+        type=int,
+        default=EXTRACTION_JOBS,
+        help='Worker processes for extracting users\' plays (per-user reports are skipped when above 1; not used with --stream)'
+    )
+    parser.add_argument(
+        '--workers', '-w',
+        type=int,
+        default=FETCH_WORKERS,
+        help='Worker processes fetching the recent plays pages through a shared SQLite work queue (not used with --stream)'
+    )
     parser.add_argument(
         '--debug', '-v',
         action='store_true',
@@ -1709,11 +3241,30 @@ def parse_arguments():
         action='store_true',
         help='Minimize output (only show summary)'
     )
+    
+    subparsers = parser.add_subparsers(dest='command')
+    crawl_parser = subparsers.add_parser(
+        'crawl',
+        help='Keep per-user play data fresh within an hourly API budget (runs until stopped)',
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter
+    )
+    crawl_parser.add_argument(
+        '--hourly-budget',
+        type=int,
+        default=CRAWL_HOURLY_BUDGET,
+        help='Maximum API calls in any rolling hour'
+    )
+    crawl_parser.add_argument(
+        '--hours',
+        type=float,
+        default=0,
+        help='Stop after this many hours (0 runs until Ctrl-C)'
+    )
     return parser.parse_args()
 
 def main():
     """Main execution function for the BGG analyzer"""
-    global PLAY_LIMIT, API_DELAY, TERMINAL_DEBUG, MAX_USERS, MAX_TOTAL_API_CALLS, api_call_count
+    global PLAY_LIMIT, API_DELAY, TERMINAL_DEBUG, KEEP_PLAY_XML, MAX_USERS, MAX_TOTAL_API_CALLS, api_call_count, RESOLUTION_CACHE_ENABLED, RESOLUTION_ORDER
     
     # Parse command line arguments
     args = parse_arguments()
@@ -1724,6 +3275,9 @@ def main():
     MAX_USERS = args.max_users
     MAX_TOTAL_API_CALLS = args.max_api_calls
     TERMINAL_DEBUG = args.debug and not args.quiet
+    KEEP_PLAY_XML = TERMINAL_DEBUG
+    RESOLUTION_CACHE_ENABLED = not args.no_cache
+    RESOLUTION_ORDER = args.resolution_order
     
     # Apply conservative settings if requested
     if args.conservative:
@@ -1735,6 +3289,12 @@ def main():
     
     # Reset API call counter
     api_call_count = 0
+    
+    # The crawl subcommand is paced by its hourly budget rather than the per-run call limit
+    if args.command == 'crawl':
+        MAX_TOTAL_API_CALLS = args.hourly_budget * math.ceil(args.hours) if args.hours else float('inf')
+        run_crawler(args.hourly_budget, args.hours)
+        return
 
     # Display configuration
     if not args.quiet:
@@ -1744,6 +3304,11 @@ def main():
         colored_print(f"📊 Configuration:", Colors.CYAN)
         colored_print(f"   • Max users to analyze: {MAX_USERS}", Colors.CYAN)
         colored_print(f"   • Max plays per user: {PLAY_LIMIT}", Colors.CYAN)
+        colored_print(f"   • Recent play pages: {args.pages}{' (streamed)' if args.stream else ''}", Colors.CYAN)
+        if args.jobs > 1 and not args.stream:
+            colored_print(f"   • Extraction worker processes: {args.jobs}", Colors.CYAN)
+        if args.workers > 1 and not args.stream:
+            colored_print(f"   • Fetch worker processes: {args.workers}", Colors.CYAN)
         colored_print(f"   • API delay: {API_DELAY}s", Colors.CYAN)
         colored_print(f"   • Max total API calls: {MAX_TOTAL_API_CALLS}", Colors.CYAN)
         colored_print(f"   • Debug mode: {'ON' if TERMINAL_DEBUG else 'OFF'}", Colors.CYAN)
@@ -1751,19 +3316,37 @@ def main():
         colored_print(f"   • Focus: June 2025 active users", Colors.CYAN)
         colored_print("=" * 60, Colors.CYAN)
 
-    # Get users who were active in June 2025 (current month)
-    colored_print("🔍 Fetching users active in June 2025...", Colors.CYAN)
-    monthly_user_ids = fetch_recent_month_users(year=2025, month=6, max_users=MAX_USERS)
+    # Continue a saved crawl with its users, or get users who were active in June 2025 (current month)
+    checkpoint = CrawlCheckpoint.load() if args.resume else None
+    if checkpoint is not None:
+        monthly_user_ids = checkpoint.user_ids
+        colored_print(f"⏯️  Resuming {'streamed ' if checkpoint.mode == 'stream' else ''}crawl at page {checkpoint.next_page} for {len(monthly_user_ids)} users", Colors.CYAN)
+    else:
+        colored_print("🔍 Fetching users active in June 2025...", Colors.CYAN)
+        monthly_user_ids = fetch_recent_month_users(year=2025, month=6, max_users=MAX_USERS)
 
     if monthly_user_ids:
         colored_print(f"👥 Found {len(monthly_user_ids)} active users from June 2025", Colors.GREEN)
         colored_print(f"📋 User IDs: {monthly_user_ids[:10]}{'...' if len(monthly_user_ids) > 10 else ''}", Colors.CYAN)
         
         # Analyze hero usage across all monthly users
-        hero_results, skipped_plays, stats = analyze_multiple_users_hero_usage(
-            monthly_user_ids, 
-            max_plays_per_user=min(PLAY_LIMIT, 300)  # Reasonable limit per user
-        )
+        stream = checkpoint.mode == 'stream' if checkpoint is not None else args.stream
+        if stream:
+            hero_results, skipped_plays, stats = analyze_multiple_users_hero_usage_streaming(
+                monthly_user_ids,
+                max_plays_per_user=min(PLAY_LIMIT, 300),  # Reasonable limit per user
+                pages_to_fetch=args.pages,
+                checkpoint=checkpoint
+            )
+        else:
+            hero_results, skipped_plays, stats = analyze_multiple_users_hero_usage(
+                monthly_user_ids,
+                max_plays_per_user=min(PLAY_LIMIT, 300),  # Reasonable limit per user
+                pages_to_fetch=args.pages,
+                jobs=args.jobs,
+                checkpoint=checkpoint,
+                workers=args.workers
+            )
         
         # Ensure summary variables are always defined
         total_plays = 0
@@ -1781,13 +3364,14 @@ def main():
                 if hero.get('altered_plays', 0) > 0:
                     altered_info = f" (🔄 {hero['altered_plays']} AH)"
                 user_info = f" [{hero['user_count']} users]"
-                print(f"{i+1:2d}. {hero['hero_name']:<20} {hero['play_count']:>3} plays{user_info} [{hero['status']}]" + altered_info)
+                print(f"{i+1:2d}. {hero['hero_name']:<20} {hero['play_count']:>3} plays{user_info} [{format_status(hero['status'])}]" + altered_info)
             # Show comprehensive summary statistics
             total_plays = sum(hero['play_count'] for hero in hero_results)
-            official_plays = sum(hero['play_count'] for hero in hero_results if 'OFFICIAL' in hero['status'])
-            translated_plays = sum(hero['play_count'] for hero in hero_results if 'TRANSLATED' in hero['status'])
-            unmatched_plays = sum(hero['play_count'] for hero in hero_results if 'UNMATCHED' in hero['status'])
-            altered_plays = sum(hero['play_count'] for hero in hero_results if 'ALTERED_HERO' in hero['status'])
+            flag_plays = status_play_counts(hero_results)
+            official_plays = flag_plays[HeroStatus.OFFICIAL]
+            translated_plays = flag_plays[HeroStatus.TRANSLATED]
+            unmatched_plays = flag_plays[HeroStatus.UNMATCHED]
+            altered_plays = flag_plays[HeroStatus.ALTERED_HERO]
             
             # Monthly focus metrics
             colored_print(f"� MONTHLY FOCUS (June 2025):", Colors.BOLD)
@@ -1815,6 +3399,12 @@ def main():
                 avg_plays = hero['play_count'] / hero['user_count'] if hero['user_count'] > 0 else 0
                 colored_print(f"   {i+1:2d}. {hero['hero_name']:<20} - {popularity} (avg: {avg_plays:.1f} plays/user)", Colors.CYAN)
             
+            # Villains detected from player colors and comments
+            if stats['villains']:
+                colored_print(f"\n🦹 TOP VILLAINS/SCENARIOS (detected in {stats['plays_with_villain']} plays):", Colors.BOLD)
+                for i, (villain_name, count) in enumerate(stats['villains'].most_common(10)):
+                    colored_print(f"   {i+1:2d}. {villain_name:<20} - {count} plays", Colors.MAGENTA)
+            
             colored_print(f"━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━", Colors.CYAN)
             
             # Display API usage statistics
@@ -1824,6 +3414,8 @@ def main():
             colored_print(f"   • API usage: {api_call_count/MAX_TOTAL_API_CALLS*100:.1f}%", Colors.GREEN if api_call_count < MAX_TOTAL_API_CALLS * 0.8 else Colors.YELLOW)
             colored_print(f"   • Average delay per call: {API_DELAY}s", Colors.CYAN)
             colored_print(f"   • Total time in API delays: ~{api_call_count * API_DELAY:.1f}s", Colors.CYAN)
+            peak = peak_rss_mb()
+            colored_print(f"   • Peak memory (RSS): {peak:.1f} MB" if peak is not None else "   • Peak memory (RSS): unavailable on this platform", Colors.CYAN)
             
         else:
             colored_print("❌ No hero data found for monthly users", Colors.RED)
@@ -1857,7 +3449,7 @@ def main():
                     altered_info = ""
                     if hero.get('altered_plays', 0) > 0:
                         altered_info = f" (🔄 {hero['altered_plays']} AH)"
-                    print(f"{i+1:2d}. {hero['hero_name']:<20} {hero['play_count']:>3} plays [{hero['status']}]" + altered_info)
+                    print(f"{i+1:2d}. {hero['hero_name']:<20} {hero['play_count']:>3} plays [{format_status(hero['status'])}]" + altered_info)
             else:
                 colored_print(f"❌ No plays found for user {first_userid}", Colors.RED)
         else:
@@ -1882,24 +3474,756 @@ def main():
         colored_print(f"   • Use --plays to limit plays per user", Colors.CYAN)
         colored_print(f"   • Use --delay to increase delays between API calls", Colors.CYAN)
 
-def analyze_multiple_users_hero_usage(user_ids, max_plays_per_user=200):
-    """Analyze hero usage across multiple users and aggregate results"""
-    all_hero_results = []
-    all_skipped_plays = {
-        'no_players': [],
-        'empty_color': [],
-        'meaningless_names': [],
-        'villains': [],
-        'scenarios': [],
-        'translation_errors': []
+class UserHeroAggregator:
+    """Running hero counts and statistics for one user, fed a batch of plays at a time"""
+    
+    STAT_KEYS = ['total_plays', 'plays_with_players', 'total_players', 'total_players_with_color', 'plays_with_villain']
+    
+    def __init__(self, user_id, max_plays):
+        self.user_id = user_id
+        self.max_plays = max_plays
+        self.plays_seen = 0  # Includes plays past max_plays, which are counted but not analyzed
+        self.hero_counts = {}
+        self.stats = Counter()
+        self.villains = Counter()
+        self.skipped = SkipDiagnostics()
+    
+    def add(self, plays):
+        """Analyze a batch of this user's plays and fold the results into the running totals"""
+        remaining = self.max_plays - self.stats['total_plays']
+        self.plays_seen += len(plays)
+        plays = plays[:max(remaining, 0)]
+        if not plays:
+            return
+        
+        hero_results, skipped_plays, stats = extract_hero_names_from_plays(plays, report=False)
+        for key in self.STAT_KEYS:
+            self.stats[key] += stats[key]
+        self.villains.update(stats['villains'])
+        self.skipped.merge(skipped_plays)
+        for hero_data in hero_results:
+            entry = self.hero_counts.get(hero_data['hero_name'])
+            if entry is None:
+                entry = self.hero_counts[hero_data['hero_name']] = {'count': 0, 'status': HeroStatus(0), 'altered_plays': 0, 'is_altered': False}
+            entry['count'] += hero_data['play_count']
+            entry['status'] |= hero_data['status']
+            # As in a single extraction: one altered play marks the hero altered and all of the user's plays of it count
+            entry['is_altered'] |= hero_data['is_altered']
+            entry['altered_plays'] = entry['count'] if entry['is_altered'] else 0
+    
+    def to_partial(self):
+        """Running totals as JSON-ready data; plays_seen is the user's cursor against max_plays"""
+        return {
+            'plays_seen': self.plays_seen,
+            'heroes': [[hero_name, entry['count'], int(entry['status']), entry['altered_plays'], entry['is_altered']]
+                       for hero_name, entry in self.hero_counts.items()],
+            'stats': dict(self.stats),
+            'villains': dict(self.villains),
+            'skipped': dict(self.skipped.counts)
+        }
+    
+    @classmethod
+    def from_partial(cls, user_id, max_plays, partial):
+        """Rebuild an aggregator saved by to_partial (skipped-play examples aren't saved)"""
+        aggregator = cls(user_id, max_plays)
+        aggregator.plays_seen = partial['plays_seen']
+        for hero_name, count, status, altered_plays, is_altered in partial['heroes']:
+            aggregator.hero_counts[hero_name] = {'count': count, 'status': HeroStatus(status), 'altered_plays': altered_plays, 'is_altered': is_altered}
+        aggregator.stats.update(partial['stats'])
+        aggregator.villains.update(partial['villains'])
+        aggregator.skipped.counts.update(partial['skipped'])
+        return aggregator
+
+class HeroUsageAggregator:
+    """Hero usage across users, built up one (user_id, plays) batch at a time.
+
+    Each user gets a UserHeroAggregator; snapshot() merges them into the same
+    (results, skipped_plays, stats) that analyze_multiple_users_hero_usage returns
+    and can be called at any point while batches are still arriving.
+    """
+    
+    def __init__(self, max_plays_per_user):
+        self.max_plays_per_user = max_plays_per_user
+        self.users = {}
+        self.plays_added = 0
+    
+    def add(self, user_id, plays):
+        """Analyze a batch of one user's plays"""
+        if user_id not in self.users:
+            self.users[user_id] = UserHeroAggregator(user_id, self.max_plays_per_user)
+        self.users[user_id].add(plays)
+        self.plays_added += len(plays)
+    
+    def select_users(self, user_ids):
+        """The requested users seen so far, or the most active users if none of them were"""
+        selected = [user_id for user_id in user_ids if user_id in self.users]
+        if not selected:
+            most_active = sorted(self.users.values(), key=lambda aggregator: aggregator.plays_seen, reverse=True)
+            selected = [aggregator.user_id for aggregator in most_active[:len(user_ids)]]
+        return selected
+    
+    def snapshot(self, user_ids=None):
+        """Merged results for user_ids (default every user so far), leaving the running totals untouched"""
+        user_ids = list(self.users) if user_ids is None else user_ids
+        skipped_plays = SkipDiagnostics()
+        total_stats = {key: 0 for key in UserHeroAggregator.STAT_KEYS}
+        total_stats.update({'users_analyzed': len(user_ids), 'users_with_plays': 0, 'villains': Counter()})
+        hero_counts = {}
+        
+        for user_id in user_ids:
+            aggregator = self.users[user_id]
+            total_stats['users_with_plays'] += 1
+            for key in UserHeroAggregator.STAT_KEYS:
+                total_stats[key] += aggregator.stats[key]
+            total_stats['villains'].update(aggregator.villains)
+            skipped_plays.merge(aggregator.skipped)
+            
+            for hero_name, data in aggregator.hero_counts.items():
+                if hero_name in hero_counts:
+                    hero_counts[hero_name]['count'] += data['count']
+                    hero_counts[hero_name]['users'].add(user_id)
+                    hero_counts[hero_name]['status'] |= data['status']
+                    hero_counts[hero_name]['altered_plays'] += data['altered_plays']
+                else:
+                    hero_counts[hero_name] = {
+                        'count': data['count'],
+                        'users': {user_id},
+                        'status': data['status'],
+                        'altered_plays': data['altered_plays'],
+                        'is_altered': data['is_altered']
+                    }
+        
+        results = [{
+            'hero_name': hero_name,
+            'play_count': data['count'],
+            'user_count': len(data['users']),
+            'users': list(data['users']),
+            'status': data['status'],
+            'altered_plays': data['altered_plays'],
+            'is_altered': data['is_altered']
+        } for hero_name, data in hero_counts.items()]
+        results.sort(key=lambda x: x['play_count'], reverse=True)
+        return results, skipped_plays, total_stats
+
+class CrawlCheckpoint:
+    """
+    Progress of a recent-plays crawl, saved in CACHE_DIR so a later run can --resume it.
+
+    Besides the next page to fetch and the requested users it holds the state of one
+    analysis mode: the plays of the completed pages for analyze_multiple_users_hero_usage
+    ('pages'), or for the streaming analysis ('stream') each user's running aggregate,
+    whose plays_seen is the user's cursor, and the play ids already counted.
+    """
+    
+    def __init__(self, mode, user_ids, max_plays_per_user):
+        self.mode = mode
+        self.user_ids = list(user_ids)
+        self.max_plays_per_user = max_plays_per_user
+        self.next_page = 1
+        self.plays = []
+        self.seen_play_ids = set()
+        self.aggregator = HeroUsageAggregator(max_plays_per_user)
+        self.pages_since_save = 0
+        self.saved_state = self.to_dict() if mode == 'stream' else None
+    
+    def to_dict(self):
+        data = {
+            'version': CRAWL_CHECKPOINT_VERSION,
+            'mode': self.mode,
+            'fingerprint': resolver_fingerprint(),
+            'user_ids': self.user_ids,
+            'max_plays_per_user': self.max_plays_per_user,
+            'next_page': self.next_page
+        }
+        if self.mode == 'pages':
+            data['plays'] = [play_record_fields(play) for play in self.plays]
+        else:
+            data['seen_play_ids'] = sorted(self.seen_play_ids)
+            data['plays_added'] = self.aggregator.plays_added
+            data['users'] = {user_id: aggregator.to_partial() for user_id, aggregator in self.aggregator.users.items()}
+        return data
+    
+    @classmethod
+    def load(cls):
+        """The saved checkpoint, or None if there is none or it can't be resumed"""
+        data = read_cache_file(CRAWL_CHECKPOINT_FILE, 'crawl checkpoint', force=True)
+        if data is None:
+            colored_print("⚠️  No crawl checkpoint to resume", Colors.YELLOW)
+            return None
+        if data.get('version') != CRAWL_CHECKPOINT_VERSION:
+            colored_print("⚠️  Crawl checkpoint was written by another version - starting a new crawl", Colors.YELLOW)
+            return None
+        if data['mode'] == 'stream' and data['fingerprint'] != resolver_fingerprint():
+            colored_print("⚠️  Hero/villain lists or resolver rules changed since the checkpoint - starting a new crawl", Colors.YELLOW)
+            return None
+        
+        checkpoint = cls(data['mode'], data['user_ids'], data['max_plays_per_user'])
+        checkpoint.next_page = data['next_page']
+        if checkpoint.mode == 'pages':
+            checkpoint.plays = [play_record_from_fields(fields) for fields in data['plays']]
+        else:
+            checkpoint.seen_play_ids = set(data['seen_play_ids'])
+            checkpoint.aggregator.plays_added = data['plays_added']
+            for user_id, partial in data['users'].items():
+                checkpoint.aggregator.users[user_id] = UserHeroAggregator.from_partial(user_id, checkpoint.max_plays_per_user, partial)
+            checkpoint.saved_state = data
+        return checkpoint
+    
+    def page_done(self, page):
+        """Record a fully analyzed page, writing the checkpoint every CHECKPOINT_INTERVAL pages"""
+        self.next_page = page + 1
+        if self.mode == 'stream':
+            # Aggregates change mid-page, so keep the state as of the last whole page to save on interruption
+            self.saved_state = self.to_dict()
+        self.pages_since_save += 1
+        if self.pages_since_save >= CHECKPOINT_INTERVAL:
+            self.save()
+    
+    def save(self):
+        state = self.saved_state if self.mode == 'stream' else self.to_dict()
+        if write_cache_file(CRAWL_CHECKPOINT_FILE, state, 'crawl checkpoint', force=True):
+            self.pages_since_save = 0
+    
+    def finish(self, complete):
+        """Remove the checkpoint once the crawl is complete, otherwise save it for --resume"""
+        if complete:
+            try:
+                os.remove(os.path.join(CACHE_DIR, CRAWL_CHECKPOINT_FILE))
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                colored_print(f"⚠️  Could not remove crawl checkpoint: {e}", Colors.YELLOW)
+            return
+        self.save()
+        colored_print(f"💾 Crawl checkpoint saved - run again with --resume to continue from page {self.next_page}", Colors.CYAN)
+
+def crawl_stop_reason(error):
+    """Describe why a crawl stopped early (API budget or Ctrl-C)"""
+    return "interrupted" if isinstance(error, KeyboardInterrupt) else str(error)
+
+class PageDone:
+    """Marker a source stage yields after a page's plays; stages flush and pass it on (plays == 0 ends the crawl)"""
+    
+    __slots__ = ('page', 'plays')
+    
+    def __init__(self, page, plays):
+        self.page = page
+        self.plays = plays
+
+# Streaming pipeline for the multi-user analysis: a source generator of play records
+# followed by stages that each take an iterable and yield items. Generators pull one
+# item at a time, so only the page being parsed and the batch being filled are held in
+# memory, and a new stage (translation, filtering, ...) is one more function in the chain.
+def run_pipeline(source, *stages):
+    """Chain generator stages onto a source, each stage consuming the previous one's output"""
+    for stage in stages:
+        source = stage(source)
+    return source
+
+def iter_recent_plays(pages_to_fetch, first_page=1):
+    """Source stage: stream the recent Marvel Champions plays pages, each followed by a PageDone marker.
+
+    Stops at the first empty or failed page; ApiBudgetExhausted is passed on so the crawl can be checkpointed.
+    """
+    plays_fetched = 0
+    for page in range(first_page, pages_to_fetch + 1):
+        url = f"https://boardgamegeek.com/xmlapi2/plays?id=285774&page={page}"
+        page_count = 0
+        try:
+            for play in stream_plays_page(url):
+                page_count += 1
+                yield play
+        except ApiBudgetExhausted:
+            raise
+        except Exception as e:
+            colored_print(f"❌ Failed to fetch page {page}: {e}", Colors.RED)
+            return
+        
+        yield PageDone(page, page_count)
+        if not page_count:
+            colored_print(f"📄 No more plays found on page {page}", Colors.YELLOW)
+            return
+        plays_fetched += page_count
+        peak = peak_rss_mb()
+        colored_print(f"✅ Streamed page {page}: {page_count} plays (total: {plays_fetched})" + (f", peak RSS {peak:.1f} MB" if peak is not None else ""), Colors.GREEN)
+
+def dedupe_plays(plays, seen=None):
+    """Stage: drop plays already seen (new plays logged mid-crawl shift BGG's pages and repeat plays)"""
+    seen = set() if seen is None else seen
+    for play in plays:
+        if not isinstance(play, PageDone) and play.id is not None:
+            if play.id in seen:
+                continue
+            seen.add(play.id)
+        yield play
+
+def batch_plays_by_user(plays, batch_size=PIPELINE_BATCH_SIZE):
+    """Stage: group plays into (user_id, plays) batches, flushed every batch_size plays"""
+    pending = defaultdict(list)
+    buffered = 0
+    for play in plays:
+        if isinstance(play, PageDone):
+            yield from pending.items()
+            pending = defaultdict(list)
+            buffered = 0
+            yield play
+            continue
+        if not play.userid:
+            continue
+        pending[play.userid].append(play)
+        buffered += 1
+        if buffered >= batch_size:
+            yield from pending.items()
+            pending = defaultdict(list)
+            buffered = 0
+    yield from pending.items()
+
+def analyze_multiple_users_hero_usage_streaming(user_ids, max_plays_per_user=200, pages_to_fetch=RECENT_PLAY_PAGES, checkpoint=None):
+    """Streaming variant of analyze_multiple_users_hero_usage with memory that stays flat as more pages are crawled.
+
+    Plays flow through iter_recent_plays -> dedupe_plays -> batch_plays_by_user into a
+    HeroUsageAggregator while each page downloads, so no play is kept once its batch has
+    been analyzed. Pass a loaded CrawlCheckpoint to continue an unfinished crawl.
+    """
+    if checkpoint is None:
+        checkpoint = CrawlCheckpoint('stream', user_ids, max_plays_per_user)
+    aggregator = checkpoint.aggregator
+    
+    colored_print(f"\n🎯 Analyzing hero usage for {len(user_ids)} users from recent plays (streaming)", Colors.BOLD)
+    colored_print(f"📊 Max plays per user: {checkpoint.max_plays_per_user}", Colors.CYAN)
+    colored_print(f"🔍 Streaming pages {checkpoint.next_page}-{pages_to_fetch} of recent Marvel Champions plays...", Colors.CYAN)
+    
+    try:
+        crawl_complete = False
+        try:
+            stages = [lambda plays: dedupe_plays(plays, checkpoint.seen_play_ids), batch_plays_by_user]
+            for item in run_pipeline(iter_recent_plays(pages_to_fetch, checkpoint.next_page), *stages):
+                if isinstance(item, PageDone):
+                    if item.plays:
+                        checkpoint.page_done(item.page)
+                    else:
+                        crawl_complete = True
+                    continue
+                user_id, plays = item
+                aggregator.add(user_id, plays)
+            crawl_complete = crawl_complete or checkpoint.next_page > pages_to_fetch
+        except (ApiBudgetExhausted, KeyboardInterrupt) as e:
+            colored_print(f"⏸️  Crawl stopped ({crawl_stop_reason(e)}) - reporting the pages analyzed so far", Colors.YELLOW)
+        checkpoint.finish(crawl_complete)
+        
+        save_resolution_cache()
+        save_translation_cache()
+        colored_print(f"📊 Total recent plays streamed: {aggregator.plays_added} from {len(aggregator.users)} unique users", Colors.GREEN)
+        
+        # Same user selection as the non-streaming analysis
+        requested_found = [user_id for user_id in user_ids if user_id in aggregator.users]
+        if TERMINAL_DEBUG:
+            for user_id in user_ids:
+                if user_id not in aggregator.users:
+                    colored_print(f"⚠️  User {user_id} not found in recent plays", Colors.YELLOW)
+        colored_print(f"🎯 {len(requested_found)} of {len(user_ids)} requested users have recent plays", Colors.CYAN)
+        
+        users_with_data = aggregator.select_users(user_ids)
+        if not requested_found:
+            colored_print("📈 No requested users found in recent plays, analyzing most active users instead", Colors.YELLOW)
+            colored_print(f"🎯 Analyzing top {len(users_with_data)} most active users instead", Colors.CYAN)
+        
+        for user_id in users_with_data:
+            user = aggregator.users[user_id]
+            limited = f", limited from {user.plays_seen}" if user.plays_seen > user.stats['total_plays'] else ""
+            colored_print(f"✅ User {user_id}: {len(user.hero_counts)} unique heroes, {user.stats['total_plays']} plays{limited}", Colors.GREEN)
+        
+        return aggregator.snapshot(users_with_data)
+        
+    except Exception as e:
+        colored_print(f"❌ Error in analyze_multiple_users_hero_usage_streaming: {e}", Colors.RED)
+        return aggregator.snapshot([])
+
+# Per-user extraction results from earlier runs, reused while the user's plays hash the same
+_user_partials = None
+_user_partials_dirty = False
+
+def load_user_partials():
+    """Load the stored per-user results once per process"""
+    global _user_partials
+    if _user_partials is not None:
+        return _user_partials
+    _user_partials = {}
+    data = read_cache_file(USER_PARTIALS_FILE, 'per-user results')
+    if data is not None and data.get('version') == USER_PARTIALS_VERSION:
+        _user_partials = data.get('users', {})
+        if TERMINAL_DEBUG:
+            colored_print(f"💾 Loaded stored results for {len(_user_partials)} users", Colors.CYAN)
+    return _user_partials
+
+def save_user_partials():
+    """Write the per-user results to disk if any changed"""
+    global _user_partials_dirty
+    if not _user_partials_dirty:
+        return
+    data = {'version': USER_PARTIALS_VERSION, 'users': _user_partials}
+    if write_cache_file(USER_PARTIALS_FILE, data, 'per-user results'):
+        _user_partials_dirty = False
+
+def play_set_hash(plays, fingerprint):
+    """Hash of the resolver fingerprint and every play field extraction reads, in play order"""
+    digest = hashlib.sha1(fingerprint.encode('utf-8'))
+    for play in plays:
+        players = None if play.players is None else [[player.name, player.username, player.userid, player.color, player.win] for player in play.players]
+        digest.update(json.dumps([play.id, play.date, play.objectid, play.comments, players], ensure_ascii=False).encode('utf-8'))
+    return digest.hexdigest()
+
+def store_user_partial(user_id, plays_hash, hero_results, skipped_plays, stats):
+    """
+    Keep one user's extraction result as a mergeable partial: hero counts and
+    status flags, the plain statistics and villain counts, and skipped-play
+    counts (example plays aren't stored, so reused users contribute none).
+    """
+    global _user_partials_dirty
+    load_user_partials()[user_id] = {
+        'hash': plays_hash,
+        'heroes': [[hero['hero_name'], hero['play_count'], int(hero['status']), hero['is_altered']] for hero in hero_results],
+        'stats': {key: stats[key] for key in UserHeroAggregator.STAT_KEYS},
+        'villains': dict(stats['villains']),
+        'skipped': dict(skipped_plays.counts)
+    }
+    _user_partials_dirty = True
+
+def user_partial_extraction(partial):
+    """A stored partial as the (hero_results, skipped_plays, stats) extract_hero_names_from_plays returns"""
+    hero_results = [{'hero_name': hero_name, 'play_count': play_count, 'status': HeroStatus(status), 'is_altered': is_altered}
+                    for hero_name, play_count, status, is_altered in partial['heroes']]
+    skipped_plays = SkipDiagnostics()
+    skipped_plays.counts.update(partial['skipped'])
+    stats = dict(partial['stats'], villains=Counter(partial['villains']))
+    return hero_results, skipped_plays, stats
+
+# Module globals a --jobs worker needs from the parent: settings main() may have changed from
+# the defaults and the official name tables, which workers don't download themselves
+EXTRACTION_WORKER_GLOBALS = ['TERMINAL_DEBUG', 'KEEP_PLAY_XML', 'RESOLUTION_ORDER', 'RESOLUTION_CACHE_ENABLED',
+                             'OFFICIAL_HEROES', 'HERO_LOOKUP', 'OFFICIAL_VILLAINS', 'VILLAIN_LOOKUP']
+
+_worker_known_resolutions = set()  # Resolution cache keys a worker has already reported to the parent
+
+def extraction_worker_state():
+    """Snapshot of the module state a worker process needs to extract plays the way this process would"""
+    return {
+        'globals': {name: globals()[name] for name in EXTRACTION_WORKER_GLOBALS},
+        'resolution_cache': load_resolution_cache(),
+        'translation_cache': load_translation_cache()
     }
+
+def _init_extraction_worker(state):
+    """ProcessPoolExecutor initializer: install the parent's state and build the resolver indexes once"""
+    global _resolution_cache, _translation_cache, _worker_known_resolutions
+    globals().update(state['globals'])
+    _resolution_cache = state['resolution_cache']
+    _translation_cache = state['translation_cache']
+    _worker_known_resolutions = set(_resolution_cache)
+    
+    # Warm the lazily built indexes so the first task doesn't pay for them
+    get_hero_resolver_index()
+    get_villain_matcher()
+    get_comment_matcher()
+    load_hero_lexicon()
+    get_fuzzy_index('heroes', OFFICIAL_HEROES)
+    get_fuzzy_index('villains', OFFICIAL_VILLAINS)
+
+def _extract_user_plays(plays):
+    """Worker task: extract one user's plays, also returning the color resolutions the worker added"""
+    hero_results, skipped_plays, stats = extract_hero_names_from_plays(plays, report=False)
+    new_resolutions = {color: resolution for color, resolution in _resolution_cache.items() if color not in _worker_known_resolutions}
+    _worker_known_resolutions.update(new_resolutions)
+    return hero_results, skipped_plays, stats, new_resolutions
+
+def extract_users_in_parallel(plays_by_user, jobs):
+    """
+    Run extract_hero_names_from_plays for each user's plays on a pool of worker processes.
+
+    Translations for every user's colors are prefetched here first, so workers
+    start with a warm translation cache, and color resolutions made by the
+    workers are merged back into this process's resolution cache. Returns
+    {user_id: (hero_results, skipped_plays, stats)}; a user whose extraction
+    failed is reported and left out.
+    """
+    global _resolution_cache_dirty
+    colors = [player.color.strip() for plays in plays_by_user.values() for play in plays
+              if play.players is not None for player in play.players]
+    prefetch_translations(encode_distinct_values(colors)[1])
+    
+    colored_print(f"⚙️  Extracting {len(plays_by_user)} users on {jobs} worker processes...", Colors.CYAN)
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_extraction_worker, initargs=(extraction_worker_state(),)) as executor:
+        # Biggest users first so a large one doesn't start last and hold up the pool
+        futures = {user_id: executor.submit(_extract_user_plays, plays)
+                   for user_id, plays in sorted(plays_by_user.items(), key=lambda item: len(item[1]), reverse=True)}
+    
+    extracted = {}
+    cache = load_resolution_cache()
+    for user_id in plays_by_user:
+        try:
+            hero_results, skipped_plays, stats, new_resolutions = futures[user_id].result()
+        except Exception as e:
+            colored_print(f"❌ Error analyzing user {user_id}: {e}", Colors.RED)
+            continue
+        if new_resolutions:
+            cache.update(new_resolutions)
+            _resolution_cache_dirty = True
+        extracted[user_id] = (hero_results, skipped_plays, stats)
+    colored_print(f"⚙️  Extracted {len(extracted)} users in {time.perf_counter() - start:.2f}s", Colors.CYAN)
+    return extracted
+
+class WorkQueue:
+    """
+    SQLite work queue (WAL mode) shared by the fetch worker processes of a run.
+
+    A task is a range of pages (first_page, last_page) of the recent plays feed.
+    Workers lease a task for WORK_QUEUE_LEASE seconds, renewing the lease after each page,
+    and a lease that expires (a worker that died or hung) puts the task back in the
+    queue. A task's pages are written in the same transaction that marks it done.
+    The budget row holds the run's API call limit and the time the next call may
+    start, so the limit and API_DELAY apply across all workers.
+    """
+    
+    SCHEMA_VERSION = 2  # Bump when the tables change; a queue file with another version is recreated
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS tasks (
+            id INTEGER PRIMARY KEY,
+            first_page INTEGER NOT NULL,
+            last_page INTEGER NOT NULL,
+            state TEXT NOT NULL DEFAULT 'pending',
+            owner TEXT,
+            lease_expires REAL,
+            attempts INTEGER NOT NULL DEFAULT 0,
+            error TEXT
+        );
+        CREATE TABLE IF NOT EXISTS results (
+            task_id INTEGER NOT NULL,
+            page INTEGER NOT NULL,
+            plays TEXT NOT NULL,
+            PRIMARY KEY (task_id, page)
+        );
+        CREATE TABLE IF NOT EXISTS budget (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            calls_used INTEGER NOT NULL,
+            call_limit REAL NOT NULL,
+            call_delay REAL NOT NULL,
+            next_call_at REAL NOT NULL
+        );
+    """
+    
+    def __init__(self, path):
+        self.db = sqlite3.connect(path, timeout=60, isolation_level=None)
+        self.db.execute('PRAGMA journal_mode=WAL')
+        self.db.execute('PRAGMA synchronous=NORMAL')
+        if self.db.execute('PRAGMA user_version').fetchone()[0] != self.SCHEMA_VERSION:
+            self.db.executescript('DROP TABLE IF EXISTS tasks; DROP TABLE IF EXISTS results; DROP TABLE IF EXISTS budget;')
+            self.db.execute(f'PRAGMA user_version = {self.SCHEMA_VERSION}')
+        self.db.executescript(self.SCHEMA)
+    
+    def close(self):
+        self.db.close()
+    
+    @contextmanager
+    def transaction(self):
+        """BEGIN IMMEDIATE takes the write lock up front, so two workers can't claim the same task or call slot"""
+        self.db.execute('BEGIN IMMEDIATE')
+        try:
+            yield self.db
+        except BaseException:
+            self.db.execute('ROLLBACK')
+            raise
+        self.db.execute('COMMIT')
+    
+    def reset(self, tasks, call_limit, call_delay):
+        """Replace the queue's contents with tasks ((first_page, last_page) tuples) and a fresh API budget"""
+        with self.transaction() as db:
+            db.execute('DELETE FROM results')
+            db.execute('DELETE FROM tasks')
+            db.execute('DELETE FROM budget')
+            db.executemany('INSERT INTO tasks (first_page, last_page) VALUES (?, ?)', tasks)
+            db.execute('INSERT INTO budget VALUES (1, 0, ?, ?, 0)', (call_limit, call_delay))
+    
+    def lease(self, owner):
+        """Claim the oldest pending task as (id, first_page, last_page), None if nothing is pending.
+
+        Expired leases are re-queued first; a task whose lease expired on its MAX_RETRIES-th attempt fails instead.
+        """
+        now = time.time()
+        with self.transaction() as db:
+            db.execute("UPDATE tasks SET state = CASE WHEN attempts >= ? THEN 'failed' ELSE 'pending' END, owner = NULL, error = 'lease expired' "
+                       "WHERE state = 'leased' AND lease_expires < ?", (MAX_RETRIES, now))
+            task = db.execute("SELECT id, first_page, last_page FROM tasks WHERE state = 'pending' ORDER BY id LIMIT 1").fetchone()
+            if task is not None:
+                db.execute("UPDATE tasks SET state = 'leased', owner = ?, lease_expires = ?, attempts = attempts + 1 WHERE id = ?",
+                           (owner, now + WORK_QUEUE_LEASE, task[0]))
+        return task
+    
+    def renew(self, task_id, owner):
+        """Extend a lease this worker still holds"""
+        self.db.execute("UPDATE tasks SET lease_expires = ? WHERE id = ? AND owner = ? AND state = 'leased'",
+                        (time.time() + WORK_QUEUE_LEASE, task_id, owner))
+    
+    def complete(self, task_id, owner, pages, feed_end=None):
+        """
+        Store a task's pages ({page: [play record fields]}) and mark it done in one transaction.
+
+        feed_end is a page that came back empty: pending tasks after it are dropped. Returns False, storing nothing, if the lease was lost to another worker.
+        """
+        with self.transaction() as db:
+            if db.execute("UPDATE tasks SET state = 'done', owner = NULL WHERE id = ? AND owner = ? AND state = 'leased'", (task_id, owner)).rowcount != 1:
+                return False
+            db.executemany('INSERT INTO results VALUES (?, ?, ?)', [(task_id, page, json.dumps(plays)) for page, plays in pages.items()])
+            if feed_end is not None:
+                db.execute("UPDATE tasks SET state = 'skipped' WHERE state = 'pending' AND first_page > ?", (feed_end,))
+        return True
+    
+    def release(self, task_id, owner, error=None):
+        """Give up a leased task: back to pending if it wasn't its fault (error None), otherwise failed"""
+        if error is None:
+            self.db.execute("UPDATE tasks SET state = 'pending', owner = NULL, attempts = attempts - 1 WHERE id = ? AND owner = ? AND state = 'leased'", (task_id, owner))
+        else:
+            self.db.execute("UPDATE tasks SET state = 'failed', owner = NULL, error = ? WHERE id = ? AND owner = ? AND state = 'leased'", (error, task_id, owner))
+    
+    def has_leases(self):
+        return self.db.execute("SELECT 1 FROM tasks WHERE state = 'leased' LIMIT 1").fetchone() is not None
+    
+    def claim_api_call(self):
+        """Take one call from the shared budget and sleep until its slot; raises ApiBudgetExhausted when the budget is spent"""
+        with self.transaction() as db:
+            calls_used, call_limit, call_delay, next_call_at = db.execute('SELECT calls_used, call_limit, call_delay, next_call_at FROM budget').fetchone()
+            if calls_used >= call_limit:
+                raise ApiBudgetExhausted(f"API call limit reached ({MAX_TOTAL_API_CALLS})")
+            slot = max(time.time(), next_call_at)
+            db.execute('UPDATE budget SET calls_used = calls_used + 1, next_call_at = ?', (slot + call_delay,))
+        time.sleep(max(0, slot - time.time()))
+    
+    def budget(self):
+        """(calls used, call limit)"""
+        return self.db.execute('SELECT calls_used, call_limit FROM budget').fetchone()
+    
+    def task_counts(self):
+        return dict(self.db.execute('SELECT state, COUNT(*) FROM tasks GROUP BY state').fetchall())
+    
+    def results(self):
+        """{page: [PlayRecord]} for every page of the completed tasks"""
+        rows = self.db.execute("SELECT r.page, r.plays FROM results r JOIN tasks t ON t.id = r.task_id WHERE t.state = 'done'")
+        return {page: [play_record_from_fields(fields) for fields in json.loads(plays)] for page, plays in rows}
+
+def run_fetch_task(queue, task_id, owner, first_page, last_page):
+    """Fetch a task's feed pages as {page: [play record fields]}, stopping after an empty page"""
+    pages = {}
+    for page in range(first_page, last_page + 1):
+        plays = parse_plays_page(safe_api_call(f"https://boardgamegeek.com/xmlapi2/plays?id=285774&page={page}").content)
+        pages[page] = [play_record_fields(play) for play in plays]
+        queue.renew(task_id, owner)
+        if not plays:
+            break
+    return pages
+
+def _work_queue_worker(path, settings):
+    """Worker process: run tasks from the queue at path until none are left or the shared API budget is spent"""
+    global MAX_TOTAL_API_CALLS, api_call_gate
+    globals().update(settings)
+    queue = WorkQueue(path)
+    MAX_TOTAL_API_CALLS = float('inf')  # The queue's shared budget is the limit
+    api_call_gate = queue.claim_api_call
+    owner = str(os.getpid())
+    try:
+        while True:
+            task = queue.lease(owner)
+            if task is None:
+                if not queue.has_leases():
+                    return
+                # Another worker's lease may still expire and come back to the queue
+                time.sleep(WORK_QUEUE_POLL_INTERVAL)
+                continue
+            
+            task_id, first_page, last_page = task
+            label = f"page {first_page}" if first_page == last_page else f"pages {first_page}-{last_page}"
+            try:
+                pages = run_fetch_task(queue, task_id, owner, first_page, last_page)
+            except ApiBudgetExhausted:
+                queue.release(task_id, owner)
+                return
+            except Exception as e:
+                colored_print(f"❌ Failed to fetch {label}: {e}", Colors.RED)
+                queue.release(task_id, owner, str(e))
+                continue
+            
+            last_fetched = max(pages)
+            feed_end = last_fetched if not pages[last_fetched] else None
+            if queue.complete(task_id, owner, pages, feed_end) and TERMINAL_DEBUG:
+                colored_print(f"🧵 Worker {owner} fetched {label}: {sum(len(plays) for plays in pages.values())} plays", Colors.CYAN)
+    except KeyboardInterrupt:
+        pass  # The parent collects the finished tasks; this worker's lease is left to expire
+    finally:
+        queue.close()
+
+def fetch_with_workers(tasks, workers, fetched):
+    """
+    Run fetch tasks ((first_page, last_page) feed page ranges) on worker processes sharing a WorkQueue.
+
+    The plays of every fetched page are added to the fetched dict as
+    {page: [PlayRecord]} even when the run stops early, and the
+    workers' API calls are added to api_call_count. Raises ApiBudgetExhausted if
+    the budget ran out with tasks left; KeyboardInterrupt stops the workers and is passed on.
+    """
+    global api_call_count
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    path = os.path.join(CACHE_DIR, WORK_QUEUE_FILE)
+    queue = WorkQueue(path)
+    queue.reset(tasks, MAX_TOTAL_API_CALLS - api_call_count, API_DELAY)
+    queue.close()  # Workers open their own connections; a connection must not be shared across fork
+    
+    colored_print(f"🧵 Fetching {len(tasks)} tasks on {workers} worker processes...", Colors.CYAN)
+    settings = {name: globals()[name] for name in ('TERMINAL_DEBUG', 'API_DELAY', 'MAX_RETRIES', 'BACKOFF_MULTIPLIER')}
+    processes = [multiprocessing.Process(target=_work_queue_worker, args=(path, settings)) for _ in range(workers)]
+    try:
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+    except KeyboardInterrupt:
+        for process in processes:
+            process.terminate()
+            process.join()
+        raise
+    finally:
+        queue = WorkQueue(path)
+        fetched.update(queue.results())
+        calls_used, call_limit = queue.budget()
+        counts = queue.task_counts()
+        queue.close()
+        api_call_count += calls_used
+    
+    colored_print(f"🧵 Workers finished: {counts.get('done', 0)} tasks done, {counts.get('failed', 0)} failed, {calls_used} API calls", Colors.CYAN)
+    unfinished = counts.get('pending', 0) + counts.get('leased', 0)
+    if unfinished and calls_used >= call_limit:
+        raise ApiBudgetExhausted(f"API call limit reached ({MAX_TOTAL_API_CALLS})")
+    if unfinished:
+        colored_print(f"⚠️  {unfinished} tasks were left unfinished by workers that exited early", Colors.YELLOW)
+
+def analyze_multiple_users_hero_usage(user_ids, max_plays_per_user=200, pages_to_fetch=RECENT_PLAY_PAGES, jobs=EXTRACTION_JOBS, checkpoint=None, workers=FETCH_WORKERS):
+    """Analyze hero usage across multiple users and aggregate results (jobs > 1 extracts users on a process pool).
+
+    Pass a loaded CrawlCheckpoint to continue an unfinished crawl. With workers > 1 the
+    pages are fetched by that many processes through the SQLite work queue.
+    """
+    if checkpoint is None:
+        checkpoint = CrawlCheckpoint('pages', user_ids, max_plays_per_user)
+    max_plays_per_user = checkpoint.max_plays_per_user
+    all_hero_results = []
+    all_skipped_plays = SkipDiagnostics()
     total_stats = {
         'total_plays': 0,
         'plays_with_players': 0,
         'total_players': 0,
         'total_players_with_color': 0,
         'users_analyzed': 0,
-        'users_with_plays': 0
+        'users_with_plays': 0,
+        'plays_with_villain': 0,
+        'villains': Counter()
     }
     
     colored_print(f"\n🎯 Analyzing hero usage for {len(user_ids)} users from recent plays", Colors.BOLD)
@@ -1908,33 +4232,59 @@ def analyze_multiple_users_hero_usage(user_ids, max_plays_per_user=200):
     # Instead of trying to fetch per-user (which doesn't work), fetch recent plays and group by user
     colored_print("🔍 Fetching recent Marvel Champions plays for all users...", Colors.CYAN)
     
-    all_recent_plays = []
-    pages_to_fetch = 5  # Fetch enough pages to get a good sample
+    all_recent_plays = checkpoint.plays
+    if all_recent_plays:
+        colored_print(f"⏯️  {len(all_recent_plays)} plays from pages 1-{checkpoint.next_page - 1} restored from the crawl checkpoint", Colors.CYAN)
+    
+    crawl_complete = False
+    
+    def add_page(page, plays):
+        """Add a fetched page to the crawl; False once no further page should be added"""
+        nonlocal crawl_complete
+        if not plays:
+            colored_print(f"📄 No more plays found on page {page}", Colors.YELLOW)
+            crawl_complete = True
+            return False
+        all_recent_plays.extend(plays)
+        checkpoint.page_done(page)
+        colored_print(f"✅ Fetched page {page}: {len(plays)} plays (total: {len(all_recent_plays)})", Colors.GREEN)
+        return True
     
     try:
-        for page in range(1, pages_to_fetch + 1):
-            url = f"https://boardgamegeek.com/xmlapi2/plays?id=285774&page={page}"
-            response = safe_api_call(url)
-            if response is None:
-                colored_print(f"❌ Failed to fetch page {page}", Colors.RED)
-                break
-            
-            root = ET.fromstring(response.content)
-            plays = root.findall("play")
-            
-            if not plays:
-                colored_print(f"📄 No more plays found on page {page}", Colors.YELLOW)
-                break
-                
-            all_recent_plays.extend(plays)
-            colored_print(f"✅ Fetched page {page}: {len(plays)} plays (total: {len(all_recent_plays)})", Colors.GREEN)
+        try:
+            if workers > 1:
+                fetched = {}
+                try:
+                    fetch_with_workers([(page, page) for page in range(checkpoint.next_page, pages_to_fetch + 1)], workers, fetched)
+                finally:
+                    # Pages are added in order up to the first missing one (failed, or not fetched before the crawl stopped)
+                    for page in range(checkpoint.next_page, pages_to_fetch + 1):
+                        if page not in fetched or not add_page(page, fetched[page]):
+                            break
+                    else:
+                        crawl_complete = True
+            else:
+                for page in range(checkpoint.next_page, pages_to_fetch + 1):
+                    url = f"https://boardgamegeek.com/xmlapi2/plays?id=285774&page={page}"
+                    response = safe_api_call(url)
+                    if response is None:
+                        colored_print(f"❌ Failed to fetch page {page}", Colors.RED)
+                        break
+                    
+                    if not add_page(page, parse_plays_page(response.content)):
+                        break
+                else:
+                    crawl_complete = True
+        except (ApiBudgetExhausted, KeyboardInterrupt) as e:
+            colored_print(f"⏸️  Crawl stopped ({crawl_stop_reason(e)}) - analyzing the {len(all_recent_plays)} plays fetched so far", Colors.YELLOW)
+        checkpoint.finish(crawl_complete)
             
         colored_print(f"📊 Total recent plays fetched: {len(all_recent_plays)}", Colors.GREEN)
         
         # Group plays by user ID
         plays_by_user = {}
-        for play in all_recent_plays:
-            userid = play.get('userid')
+        for play in dedupe_plays(all_recent_plays):
+            userid = play.userid
             if userid:
                 if userid not in plays_by_user:
                     plays_by_user[userid] = []
@@ -1964,6 +4314,22 @@ def analyze_multiple_users_hero_usage(user_ids, max_plays_per_user=200):
         # Track aggregated hero counts across all users
         aggregated_hero_counts = {}
         
+        # Users whose plays hash the same as in an earlier run reuse that run's result instead of being extracted again
+        partials = load_user_partials()
+        fingerprint = resolver_fingerprint()
+        play_hashes = {user_id: play_set_hash(plays_by_user[user_id][:max_plays_per_user], fingerprint) for user_id in users_with_data}
+        reused = {user_id: user_partial_extraction(partials[user_id]) for user_id in users_with_data
+                  if user_id in partials and partials[user_id]['hash'] == play_hashes[user_id]}
+        if reused:
+            colored_print(f"♻️  Reusing stored results for {len(reused)} of {len(users_with_data)} users whose plays haven't changed", Colors.CYAN)
+        
+        # With several jobs every changed user is extracted up front on the process pool and the loop below only merges
+        if jobs > 1:
+            changed_users = {user_id: plays_by_user[user_id][:max_plays_per_user] for user_id in users_with_data if user_id not in reused}
+            extracted = extract_users_in_parallel(changed_users, jobs) if changed_users else {}
+            save_resolution_cache()
+            save_translation_cache()
+        
         for i, user_id in enumerate(users_with_data):
             try:
                 user_plays = plays_by_user[user_id]
@@ -1979,20 +4345,31 @@ def analyze_multiple_users_hero_usage(user_ids, max_plays_per_user=200):
                     colored_print(f"⚠️  No plays found for user {user_id}", Colors.YELLOW)
                     continue
                     
-                total_stats['users_with_plays'] += 1
-                
                 # Analyze hero usage for this user
-                hero_results, skipped_plays, user_stats = extract_hero_names_from_plays(user_plays)
+                if user_id in reused:
+                    hero_results, skipped_plays, user_stats = reused[user_id]
+                else:
+                    if jobs > 1:
+                        if user_id not in extracted:
+                            continue
+                        hero_results, skipped_plays, user_stats = extracted[user_id]
+                    else:
+                        hero_results, skipped_plays, user_stats = extract_hero_names_from_plays(user_plays)
+                    # A result with names the translator failed on is extracted again next run rather than reused
+                    if not user_stats['transient_failures']:
+                        store_user_partial(user_id, play_hashes[user_id], hero_results, skipped_plays, user_stats)
                 
                 # Aggregate statistics
+                total_stats['users_with_plays'] += 1
                 total_stats['total_plays'] += user_stats['total_plays']
                 total_stats['plays_with_players'] += user_stats['plays_with_players']
                 total_stats['total_players'] += user_stats['total_players']
                 total_stats['total_players_with_color'] += user_stats['total_players_with_color']
+                total_stats['plays_with_villain'] += user_stats['plays_with_villain']
+                total_stats['villains'].update(user_stats['villains'])
                 
                 # Aggregate skipped plays
-                for category, plays in skipped_plays.items():
-                    all_skipped_plays[category].extend(plays)
+                all_skipped_plays.merge(skipped_plays)
                 
                 # Aggregate hero counts
                 for hero_data in hero_results:
@@ -2004,14 +4381,14 @@ def analyze_multiple_users_hero_usage(user_ids, max_plays_per_user=200):
                     if hero_name in aggregated_hero_counts:
                         aggregated_hero_counts[hero_name]['count'] += play_count
                         aggregated_hero_counts[hero_name]['users'].add(user_id)
-                        aggregated_hero_counts[hero_name]['status'].update(status.split('|'))
+                        aggregated_hero_counts[hero_name]['status'] |= status
                         if is_altered:
                             aggregated_hero_counts[hero_name]['altered_plays'] += play_count
                     else:
                         aggregated_hero_counts[hero_name] = {
                             'count': play_count,
                             'users': {user_id},
-                            'status': set(status.split('|')),
+                            'status': status,
                             'altered_plays': play_count if is_altered else 0,
                             'is_altered': is_altered
                         }
@@ -2023,6 +4400,7 @@ def analyze_multiple_users_hero_usage(user_ids, max_plays_per_user=200):
                 continue
         
         total_stats['users_analyzed'] = len(users_with_data)
+        save_user_partials()
         
         # Convert aggregated results to final format
         final_results = []
@@ -2032,7 +4410,7 @@ def analyze_multiple_users_hero_usage(user_ids, max_plays_per_user=200):
                 'play_count': data['count'],
                 'user_count': len(data['users']),
                 'users': list(data['users']),
-                'status': '|'.join(sorted(data['status'])),
+                'status': data['status'],
                 'altered_plays': data['altered_plays'],
                 'is_altered': data['is_altered']
             })
@@ -2046,5 +4424,186 @@ def analyze_multiple_users_hero_usage(user_ids, max_plays_per_user=200):
         colored_print(f"❌ Error in analyze_multiple_users_hero_usage: {e}", Colors.RED)
         return [], all_skipped_plays, total_stats
 
+# Long-running crawl (the crawl subcommand). Users are synced newest page first until a
+# page holds plays already stored, one page per turn. Each round every due user gets one
+# turn, in order of expected new plays (plays-per-day rate times days since the last
+# sync, plus plays of theirs spotted in the global feed), so heavy users are served first
+# but can't take a second page before everyone else due has had one.
+def load_crawl_state():
+    """The crawl's scheduling state from CACHE_DIR (a fresh one if missing or outdated)"""
+    data = read_cache_file(CRAWL_STATE_FILE, 'crawl state', force=True)
+    if data is None or data.get('version') != CRAWL_STATE_VERSION:
+        return {'version': CRAWL_STATE_VERSION, 'calls': [], 'feed_synced': None, 'users': {}}
+    return data
+
+def save_crawl_state(state):
+    write_cache_file(CRAWL_STATE_FILE, state, 'crawl state', force=True)
+
+def crawl_user_plays_file(user_id):
+    return os.path.join(CRAWL_PLAYS_DIR, f"{user_id}.json")
+
+def load_crawl_user_plays(user_id):
+    """A user's synced plays, newest first, as play_record_fields lists"""
+    return read_cache_file(crawl_user_plays_file(user_id), f"synced plays of user {user_id}", force=True) or []
+
+def new_crawl_user():
+    return {'last_sync': None, 'rate': 0.0, 'hinted': 0, 'newest_id': 0, 'next_page': 1, 'pending': []}
+
+def expected_new_plays(user, now):
+    """Plays a user probably logged since their last sync"""
+    if user['next_page'] > 1:
+        return 100.0  # Mid-sync: the last page was all new plays
+    if user['last_sync'] is None:
+        return CRAWL_NEW_USER_PLAYS + user['hinted']
+    return user['rate'] * (now - user['last_sync']) / 86400 + user['hinted']
+
+def schedule_crawl_round(state, now):
+    """User ids due this round, most expected new plays first"""
+    heap = []
+    for user_id, user in state['users'].items():
+        expected = expected_new_plays(user, now)
+        if expected >= CRAWL_MIN_EXPECTED_PLAYS:
+            heap.append((-expected, user_id))
+    heapq.heapify(heap)
+    return [heapq.heappop(heap)[1] for _ in range(len(heap))]
+
+def crawl_budget_wait(state, hourly_budget, now):
+    """Seconds until another API call fits the hourly budget (0 if one fits now)"""
+    state['calls'] = [call for call in state['calls'] if call > now - 3600]
+    if len(state['calls']) < hourly_budget:
+        return 0
+    return state['calls'][-hourly_budget] + 3600 - now
+
+def record_crawl_calls(state, calls_before):
+    """Add the API calls made since calls_before (retries included) to the budget window"""
+    now = time.time()
+    state['calls'].extend([now] * (api_call_count - calls_before))
+
+def poll_crawl_feed(state, now):
+    """Find users in the first page of recent plays and note plays newer than the ones stored for them"""
+    response = safe_api_call("https://boardgamegeek.com/xmlapi2/plays?id=285774&page=1")
+    if response is None:
+        raise Exception("Failed to fetch the recent plays feed after retries")
+    plays = parse_plays_page(response.content)
+    new_users = 0
+    unseen = Counter()
+    for play in plays:
+        if not play.userid:
+            continue
+        user = state['users'].get(play.userid)
+        if user is None:
+            user = state['users'][play.userid] = new_crawl_user()
+            new_users += 1
+        if play.id is not None and play.id > user['newest_id']:
+            unseen[play.userid] += 1
+    for user_id, count in unseen.items():
+        # The same feed plays show up again in later polls, so don't add them up
+        state['users'][user_id]['hinted'] = max(state['users'][user_id]['hinted'], count)
+    state['feed_synced'] = now
+    colored_print(f"📡 Feed: {len(plays)} recent plays, {new_users} new users ({len(state['users'])} tracked)", Colors.CYAN)
+
+def play_date_timestamp(date):
+    """A play's YYYY-MM-DD date as a timestamp, None for undated plays (BGG's 0000-00-00) and malformed dates"""
+    try:
+        return time.mktime(time.strptime(date, '%Y-%m-%d'))
+    except (TypeError, ValueError, OverflowError):
+        return None
+
+def sync_crawl_user_page(state, user_id, now):
+    """Fetch the next page of a user's sync, finishing the sync once it reaches plays already stored"""
+    user = state['users'][user_id]
+    page = user['next_page']
+    plays = fetch_user_plays_page(user_id, page)
+    if plays is None:
+        colored_print(f"❌ Failed to fetch page {page} for user {user_id}", Colors.RED)
+        return
+    
+    stored = load_crawl_user_plays(user_id)
+    known_ids = {fields[0] for fields in stored} | {fields[0] for fields in user['pending']}
+    # Only this user's Marvel Champions plays (BGG has been seen to ignore the userid parameter)
+    new_plays = [play for play in plays if play.objectid == 285774 and play.userid == user_id and play.id not in known_ids]
+    user['pending'].extend(play_record_fields(play) for play in new_plays)
+    
+    reached_known = any(play.id in known_ids for play in plays)
+    if len(plays) == 100 and not reached_known and len(stored) + len(user['pending']) < PLAY_LIMIT:
+        user['next_page'] = page + 1
+        colored_print(f"🔄 User {user_id}: page {page}, {len(new_plays)} new plays, continuing next round", Colors.CYAN)
+        return
+    
+    new_count = len(user['pending'])
+    stored = (user['pending'] + stored)[:PLAY_LIMIT]
+    if user['last_sync'] is None:
+        # First sync: plays per day over the dates the fetched plays span (undated plays don't count)
+        timestamps = sorted(filter(None, (play_date_timestamp(fields[1]) for fields in user['pending'])))
+        days = (timestamps[-1] - timestamps[0]) / 86400 + 1 if timestamps else 1
+        user['rate'] = new_count / days
+    else:
+        observed = new_count / max((now - user['last_sync']) / 86400, 1 / 24)
+        user['rate'] = CRAWL_RATE_SMOOTHING * observed + (1 - CRAWL_RATE_SMOOTHING) * user['rate']
+    # Finish the sync in the state before writing the plays, so a failure can't leave the plays pending to be added again
+    user.update(last_sync=now, hinted=0, next_page=1, pending=[],
+                newest_id=max((fields[0] for fields in stored if fields[0] is not None), default=0))
+    write_cache_file(crawl_user_plays_file(user_id), stored, f"synced plays of user {user_id}", force=True)
+    colored_print(f"✅ User {user_id}: synced {new_count} new plays ({user['rate']:.2f} plays/day)", Colors.GREEN)
+
+def run_crawler(hourly_budget=CRAWL_HOURLY_BUDGET, hours=0):
+    """Keep per-user play data in CACHE_DIR fresh, spending at most hourly_budget API calls per rolling hour"""
+    state = load_crawl_state()
+    deadline = time.time() + hours * 3600 if hours else None
+    colored_print(f"🕷️  Crawling with {hourly_budget} API calls per hour{f' for {hours:g} hours' if hours else ' until Ctrl-C'} ({len(state['users'])} users tracked)", Colors.BOLD)
+    
+    def wait_for_budget():
+        """Sleep until a call fits the budget; False if the deadline comes first"""
+        while True:
+            now = time.time()
+            if deadline is not None and now >= deadline:
+                return False
+            wait = crawl_budget_wait(state, hourly_budget, now)
+            if not wait:
+                return True
+            colored_print(f"⏳ Hourly budget spent, next call in {wait:.0f}s", Colors.YELLOW)
+            time.sleep(wait if deadline is None else min(wait, deadline - now))
+    
+    rounds = 0
+    try:
+        while wait_for_budget():
+            now = time.time()
+            if state['feed_synced'] is None or now - state['feed_synced'] >= CRAWL_FEED_INTERVAL:
+                calls_before = api_call_count
+                try:
+                    poll_crawl_feed(state, now)
+                except ApiBudgetExhausted:
+                    raise
+                except Exception as e:
+                    colored_print(f"❌ Feed poll failed: {e}", Colors.RED)
+                finally:
+                    record_crawl_calls(state, calls_before)
+                    save_crawl_state(state)
+            
+            round_users = schedule_crawl_round(state, time.time())
+            if not round_users:
+                time.sleep(CRAWL_IDLE_SLEEP if deadline is None else max(0, min(CRAWL_IDLE_SLEEP, deadline - time.time())))
+                continue
+            rounds += 1
+            colored_print(f"🔁 Round {rounds}: {len(round_users)} users due", Colors.CYAN)
+            for user_id in round_users:
+                if not wait_for_budget():
+                    break
+                calls_before = api_call_count
+                try:
+                    sync_crawl_user_page(state, user_id, time.time())
+                except ApiBudgetExhausted:
+                    raise
+                except Exception as e:
+                    colored_print(f"❌ Sync of user {user_id} failed: {e}", Colors.RED)
+                finally:
+                    record_crawl_calls(state, calls_before)
+                    save_crawl_state(state)
+    except (ApiBudgetExhausted, KeyboardInterrupt) as e:
+        colored_print(f"⏸️  Crawl stopped ({crawl_stop_reason(e)})", Colors.YELLOW)
+    finally:
+        save_crawl_state(state)
+    colored_print(f"🕷️  Crawl finished after {rounds} rounds, {api_call_count} API calls", Colors.GREEN)
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
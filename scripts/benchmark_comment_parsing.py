@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Benchmark for play comment parsing on adversarial inputs
+Compares the old backtracking structural regexes with the linear tokenizer
+(comment_structural_candidates) and reports the worst-case time per KB
+"""
+
+import os
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bggscrape import comment_structural_candidates, parse_heroes_from_comments, colored_print, Colors
+
+# The structural patterns parse_heroes_from_comments used before the tokenizer
+LEGACY_STRUCTURAL_PATTERNS = [
+    r'\b([a-z\-\s]+)\s+vs?\s+[a-z\-\s]+\b',
+    r'\b([a-z\-\s]+)\s*\([^)]*(?:aggression|justice|protection|leadership|pool)[^)]*\)',
+    r'\b([a-z\-\s]+)\s*[-–]\s*(?:aggression|justice|protection|leadership|pool)\b',
+    r'(?:aggression|justice|protection|leadership|pool)／([a-z\-\s]+)',
+    r'([a-z\-\s]+)／(?:aggression|justice|protection|leadership|pool)',
+    r'\b([a-z\-\s]+)\s*[&+]\s*([a-z\-\s]+)',
+    r'\b([a-z\-\s]+),\s*([a-z\-\s]+)(?:,\s*([a-z\-\s]+))?',
+    r'\b([a-z\-\s]+)\s+x\s+[a-z\-\s]+\b',
+]
+
+LEGACY_MAX_KB = 8  # The legacy patterns are quadratic, larger inputs take minutes
+
+def adversarial_inputs(size):
+    """Build comments of roughly `size` characters that stress the structural patterns"""
+    return {
+        'words_no_separator': ('lorem ' * size)[:size],
+        'single_long_word': 'a' * size,
+        'hyphen_runs': ('spider-man-' * size)[:size],
+        'open_parens': ('hulk (' * size)[:size],
+        'dangling_dashes': ('thor - ' * size)[:size],
+        'long_list_tail': ('iron man ' * size)[:size] + ', hulk',
+        'real_comment': ('Played Spider-Man (Justice) & Hulk vs Rhino, fun game. ' * size)[:size],
+    }
+
+def time_call(func, text, repeat=3):
+    """Best-of-N wall time for func(text) in seconds"""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(text)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+def legacy_candidates(text, compiled=[re.compile(p, re.IGNORECASE) for p in LEGACY_STRUCTURAL_PATTERNS]):
+    """Run every legacy structural pattern over the text"""
+    return [regex.findall(text) for regex in compiled]
+
+def main():
+    sizes_kb = [1, 2, 4, 8, 16, 32, 64]
+    worst = {'legacy': 0.0, 'tokenizer': 0.0}
+
+    colored_print("🏁 Comment parsing benchmark (ms per KB, best of 3)", Colors.BOLD)
+    colored_print(f"{'input':<22}{'KB':>5}{'legacy':>12}{'tokenizer':>12}", Colors.CYAN)
+
+    for kb in sizes_kb:
+        for name, text in adversarial_inputs(kb * 1024).items():
+            text = text.lower()
+            tokenizer_ms = time_call(comment_structural_candidates, text) * 1000 / kb
+            worst['tokenizer'] = max(worst['tokenizer'], tokenizer_ms)
+            if kb <= LEGACY_MAX_KB:
+                legacy_ms = time_call(legacy_candidates, text) * 1000 / kb
+                worst['legacy'] = max(worst['legacy'], legacy_ms)
+                legacy_text = f"{legacy_ms:>12.3f}"
+            else:
+                legacy_text = f"{'-':>12}"
+            print(f"{name:<22}{kb:>5}{legacy_text}{tokenizer_ms:>12.3f}")
+
+    # Full parse, capped at COMMENT_MAX_CHARS, on the largest adversarial input
+    text = adversarial_inputs(sizes_kb[-1] * 1024)['words_no_separator']
+    full_ms = time_call(parse_heroes_from_comments, text) * 1000
+
+    colored_print(f"\n📊 Worst case legacy regexes: {worst['legacy']:.3f} ms/KB (inputs up to {LEGACY_MAX_KB} KB)", Colors.YELLOW)
+    colored_print(f"📊 Worst case tokenizer: {worst['tokenizer']:.3f} ms/KB (inputs up to {sizes_kb[-1]} KB)", Colors.GREEN)
+    colored_print(f"📊 parse_heroes_from_comments on a {sizes_kb[-1]} KB comment: {full_ms:.2f} ms", Colors.GREEN)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Benchmark for --jobs parallel extraction in the multi-user analysis
+Extracts the same synthetic users' plays sequentially and on process pools of
+increasing size (extract_users_in_parallel) and reports the speedup per pool size
+"""
+
+import os
+import sys
+import time
+from collections import defaultdict
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import bggscrape
+from bggscrape import extract_hero_names_from_plays, extract_users_in_parallel, parse_plays_page, colored_print, Colors
+from benchmark_play_parsing import make_page
+
+USERS = 40
+PAGES = 80  # 100 plays per page, so ~200 plays per user
+
+def silenced(func, *args):
+    """Run func with stdout (including worker processes' prints) sent to /dev/null"""
+    sys.stdout.flush()
+    saved = os.dup(1)
+    devnull = os.open(os.devnull, os.O_WRONLY)
+    os.dup2(devnull, 1)
+    try:
+        return func(*args)
+    finally:
+        sys.stdout.flush()
+        os.dup2(saved, 1)
+        os.close(devnull)
+        os.close(saved)
+
+def extract_sequentially(plays_by_user):
+    """The --jobs 1 path: one extraction per user in this process"""
+    return {user_id: extract_hero_names_from_plays(plays, report=False) for user_id, plays in plays_by_user.items()}
+
+def main():
+    # Offline and side-effect free: no Google Translate requests, no cache files written
+    bggscrape.RESOLUTION_ORDER = [tier for tier in bggscrape.RESOLUTION_ORDER if tier != 'remote']
+    bggscrape.RESOLUTION_CACHE_ENABLED = False
+    bggscrape.TERMINAL_DEBUG = False
+
+    plays_by_user = defaultdict(list)
+    for page in range(1, PAGES + 1):
+        for play in parse_plays_page(make_page(page)):
+            plays_by_user[f"user{int(play.userid) % USERS}"].append(play)
+    plays = sum(len(user_plays) for user_plays in plays_by_user.values())
+
+    # Warm the in-process caches so every run starts from the same state
+    silenced(extract_sequentially, plays_by_user)
+
+    cores = os.cpu_count() or 1
+    job_counts = sorted({2 ** i for i in range(1, 8) if 2 ** i <= max(cores, 2)} | {cores} - {1})
+
+    colored_print(f"🏁 Parallel extraction benchmark ({len(plays_by_user)} users, {plays} plays, {cores} cores)", Colors.BOLD)
+    colored_print(f"{'jobs':<8}{'seconds':>10}{'plays/s':>12}{'speedup':>10}", Colors.CYAN)
+
+    start = time.perf_counter()
+    expected = silenced(extract_sequentially, plays_by_user)
+    baseline = time.perf_counter() - start
+    print(f"{1:<8}{baseline:>10.2f}{plays / baseline:>12.0f}{1:>9.2f}x")
+
+    for jobs in job_counts:
+        start = time.perf_counter()
+        extracted = silenced(extract_users_in_parallel, plays_by_user, jobs)
+        elapsed = time.perf_counter() - start
+        print(f"{jobs:<8}{elapsed:>10.2f}{plays / elapsed:>12.0f}{baseline / elapsed:>9.2f}x")
+        assert {user_id: result[0] for user_id, result in extracted.items()} == {user_id: result[0] for user_id, result in expected.items()}
+
+    colored_print(f"\n📊 Pool start-up is included; speedup grows with plays per user and levels off at the core count ({cores})", Colors.GREEN)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Benchmark for parsing BGG plays pages
+Compares ET.fromstring + findall (full ElementTree), with and without converting
+the elements into play records, against the expat record parser (parse_plays_page,
+with and without KEEP_PLAY_XML) and reports parse time and peak memory per page
+"""
+
+import os
+import random
+import sys
+import time
+import tracemalloc
+import xml.etree.ElementTree as ET
+from xml.sax.saxutils import escape, quoteattr
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import bggscrape
+from bggscrape import parse_plays_page, play_record_from_element, record_xml, colored_print, Colors
+
+PLAYS_PER_PAGE = 100  # BGG returns up to 100 plays per page
+PAGES = 20
+
+SAMPLE_COLORS = ["Spider-Man (Justice)", "Hulk - Aggression", "Captain Marvel", "Justice／She-Hulk",
+                 "Doctor Strange", "Hombre Araña", "凤凰女", "", "Team 1", "Black Widow / Leadership"]
+SAMPLE_COMMENTS = ["Spider-Man and Hulk vs Rhino on expert.", "Rise of Red Skull campaign, game 3",
+                   "Jugué con Capitán América contra Cráneo Rojo", "", "Close one! " * 20]
+
+def make_page(page, seed=1):
+    """Build a synthetic plays page shaped like the BGG XML API response"""
+    rnd = random.Random(seed * 1000 + page)
+    out = ['<?xml version="1.0" encoding="utf-8"?>',
+           f'<plays username="" userid="0" total="{PLAYS_PER_PAGE * PAGES}" page="{page}" termsofuse="https://boardgamegeek.com/xmlapi/termsofuse">']
+    for i in range(PLAYS_PER_PAGE):
+        play_id = page * PLAYS_PER_PAGE + i
+        out.append(f'\t<play id="{play_id}" date="2025-06-{1 + i % 28:02d}" quantity="1" length="0" incomplete="0" nowinstats="0" location="" userid="{rnd.randint(1, 500)}">')
+        out.append('\t\t<item name="Marvel Champions: The Card Game" objecttype="thing" objectid="285774">')
+        out.append('\t\t\t<subtypes><subtype value="boardgame" /></subtypes>')
+        out.append('\t\t</item>')
+        comment = rnd.choice(SAMPLE_COMMENTS)
+        if comment:
+            out.append(f'\t\t<comments>{escape(comment)}</comments>')
+        out.append('\t\t<players>')
+        for p in range(rnd.randint(1, 4)):
+            out.append(f'\t\t\t<player username="user{p}" userid="{p}" name="Player {p}" startposition="" '
+                       f'color={quoteattr(rnd.choice(SAMPLE_COLORS))} score="" new="0" rating="0" win="{rnd.randint(0, 1)}" />')
+        out.append('\t\t</players>')
+        out.append('\t</play>')
+    out.append('</plays>')
+    return '\n'.join(out).encode('utf-8')
+
+def parse_elementtree(source):
+    """The old path: full tree, then the play elements"""
+    return ET.fromstring(source).findall('play')
+
+def parse_elementtree_records(source):
+    """The old path plus the conversion the extractor does for Element input"""
+    return [play_record_from_element(play) for play in parse_elementtree(source)]
+
+def parse_records_keep_xml(source):
+    """The record parser as --debug runs it, keeping each play's XML for diagnostics"""
+    bggscrape.KEEP_PLAY_XML = True
+    try:
+        return parse_plays_page(source)
+    finally:
+        bggscrape.KEEP_PLAY_XML = False
+
+def measure(parse, pages, repeat=5):
+    """Best-of-N parse time per page (ms) and mean tracemalloc peak per page (KB)"""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for source in pages:
+            parse(source)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+
+    peaks = []
+    for source in pages:
+        tracemalloc.start()
+        result = parse(source)
+        peaks.append(tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+        del result
+    return best * 1000 / len(pages), sum(peaks) / len(peaks) / 1024
+
+def main():
+    pages = [make_page(page) for page in range(1, PAGES + 1)]
+    page_kb = sum(len(source) for source in pages) / len(pages) / 1024
+
+    # Sanity check: both paths see the same plays and the fast path can slice the XML back out
+    bggscrape.KEEP_PLAY_XML = True
+    records = parse_plays_page(pages[0])
+    elements = parse_elementtree(pages[0])
+    assert [str(record.id) for record in records] == [play.get('id') for play in elements]
+    assert ET.fromstring(record_xml(records[0].source, records[0].span)).get('id') == str(records[0].id)
+    bggscrape.KEEP_PLAY_XML = False  # The default; parse_records_keep_xml measures the --debug path
+
+    colored_print(f"🏁 Plays page parsing benchmark ({PAGES} pages, {PLAYS_PER_PAGE} plays, ~{page_kb:.1f} KB each)", Colors.BOLD)
+    colored_print(f"{'parser':<24}{'ms/page':>10}{'peak KB/page':>15}", Colors.CYAN)
+
+    results = {}
+    for name, parse in [('ElementTree', parse_elementtree), ('ElementTree + records', parse_elementtree_records),
+                        ('expat records', parse_plays_page), ('expat records + XML', parse_records_keep_xml)]:
+        results[name] = measure(parse, pages)
+        print(f"{name:<24}{results[name][0]:>10.3f}{results[name][1]:>15.1f}")
+
+    fast_ms, fast_kb = results['expat records']
+    print()
+    for name in ['ElementTree', 'ElementTree + records']:
+        tree_ms, tree_kb = results[name]
+        colored_print(f"📊 vs {name}: {fast_ms / tree_ms * 100:.0f}% of the parse time, {fast_kb / tree_kb * 100:.0f}% of the peak memory", Colors.GREEN)
+
+if __name__ == "__main__":
+    main()
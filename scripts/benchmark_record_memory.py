@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the memory held per play on large crawls
+Compares keeping ElementTree <play> elements with keeping PlayRecords
+(with and without their raw XML) and reports retained bytes per play
+"""
+
+import os
+import sys
+import tracemalloc
+import xml.etree.ElementTree as ET
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import bggscrape
+from bggscrape import parse_plays_page, colored_print, Colors
+from benchmark_play_parsing import make_page
+
+PAGES = 50  # 5,000 plays
+
+def reset_string_tables():
+    """Start each measurement with empty string tables so their growth is counted"""
+    for table in (bggscrape.USER_IDS, bggscrape.PLAYER_NAMES, bggscrape.HERO_NAMES):
+        table.__init__()
+
+def retained_per_play(parse, pages):
+    """Bytes still allocated per play after parsing every page and keeping all plays"""
+    reset_string_tables()
+    tracemalloc.start()
+    kept = []
+    for page in range(1, pages + 1):
+        kept.extend(parse(make_page(page)))
+    retained = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return retained / len(kept), len(kept)
+
+def parse_elements(source):
+    return ET.fromstring(source).findall('play')
+
+def parse_records(keep_xml):
+    def parse(source):
+        bggscrape.KEEP_PLAY_XML = keep_xml
+        return parse_plays_page(source)
+    return parse
+
+def main():
+    colored_print(f"🏁 Retained memory per play ({PAGES} pages kept in memory)", Colors.BOLD)
+    colored_print(f"{'model':<24}{'bytes/play':>12}{'reduction':>12}", Colors.CYAN)
+
+    baseline = None
+    for name, parse in [('ElementTree elements', parse_elements),
+                        ('PlayRecords + raw XML', parse_records(True)),
+                        ('PlayRecords', parse_records(False))]:
+        per_play, plays = retained_per_play(parse, PAGES)
+        baseline = baseline or per_play
+        print(f"{name:<24}{per_play:>12.0f}{baseline / per_play:>11.1f}x")
+
+    colored_print(f"\n📊 {plays} plays; string tables hold {len(bggscrape.USER_IDS)} userids, "
+                  f"{len(bggscrape.PLAYER_NAMES)} player names and {len(bggscrape.HERO_NAMES)} hero names", Colors.GREEN)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""
+Shared fixtures for the bggscrape tests.
+
+The tests run offline: bggscrape is imported with small official hero/villain
+lists in place of the GitHub downloads, BGG is replaced by FakeBGG, which serves
+generated plays pages, and the remote translation tier is left out.
+"""
+
+import json
+import os
+import random
+import sys
+from unittest import mock
+from xml.sax.saxutils import escape, quoteattr
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+HEROES = ["Spider-Man", "Captain Marvel", "She-Hulk", "Iron Man", "Black Panther", "Captain America", "Ms. Marvel",
+          "Thor", "Black Widow", "Doctor Strange", "Hulk", "Hawkeye", "Wolverine", "Storm", "Gambit", "Groot"]
+VILLAINS = ["Rhino", "Klaw", "Ultron", "Green Goblin", "Red Skull", "Kang"]
+
+class FakeResponse:
+    def __init__(self, content):
+        self.content = content
+        self.text = content.decode('utf-8')
+    
+    def raise_for_status(self):
+        pass
+    
+    def iter_content(self, chunk_size):
+        for start in range(0, len(self.content), chunk_size):
+            yield self.content[start:start + chunk_size]
+    
+    def close(self):
+        pass
+
+def _official_lists(url, *args, **kwargs):
+    return FakeResponse(json.dumps(VILLAINS if 'villain' in url else HEROES).encode('utf-8'))
+
+with mock.patch('requests.get', _official_lists):
+    import bggscrape
+
+USERS = ['101', '102', '103', '104', '105']
+COLORS = ["Spider-Man", "Hulk (Aggression)", "Justice／She-Hulk", "AH - Thor", "AH-Hulk", "Captain Marvel - Leadership",
+          "Dr Strange", "Hombre Araña", "Spiderman", "Team 1", "", "Rhino", "Unknown Hero", "Iron Man", "Wolvie"]
+COMMENTS = ["Spider-Man and Hulk vs Rhino on expert", "Black Panther (Justice) against Ultron", "", "",
+            "Rise of Red Skull campaign: Hawkeye + Storm"]
+
+def plays_page(page, plays=100, seed=0):
+    """A plays page shaped like the BGG XML API response, the same for the same arguments"""
+    rnd = random.Random(seed * 1000 + page)
+    out = ['<?xml version="1.0" encoding="utf-8"?>', f'<plays total="999" page="{page}">']
+    for i in range(plays):
+        userid = rnd.choice(USERS)
+        out.append(f'<play id="{page * 1000 + i}" date="2025-06-{1 + i % 28:02d}" quantity="1" userid="{userid}">')
+        out.append('<item name="Marvel Champions: The Card Game" objecttype="thing" objectid="285774"/>')
+        comment = rnd.choice(COMMENTS)
+        if comment:
+            out.append(f'<comments>{escape(comment)}</comments>')
+        if rnd.random() > 0.1:
+            out.append('<players>')
+            for _ in range(rnd.randint(1, 3)):
+                out.append(f'<player username="u" userid="{userid}" name="P" color={quoteattr(rnd.choice(COLORS))} win="{rnd.randint(0, 1)}"/>')
+            out.append('</players>')
+        out.append('</play>')
+    out.append('</plays>')
+    return '\n'.join(out).encode('utf-8')
+
+class FakeBGG:
+    """Stands in for requests.get: pages 1..pages of the recent plays feed, empty pages after"""
+    
+    def __init__(self, pages=4):
+        self.pages = pages
+        self.urls = []
+    
+    def __call__(self, url, headers=None, stream=False):
+        self.urls.append(url)
+        page = int(url.rsplit('page=', 1)[1])
+        return FakeResponse(plays_page(page) if page <= self.pages else plays_page(page, plays=0))
+
+@pytest.fixture(autouse=True)
+def offline_bggscrape(monkeypatch, tmp_path):
+    """bggscrape with a fresh cache directory and in-process caches, no delays and no remote translation"""
+    monkeypatch.setattr(bggscrape, 'CACHE_DIR', str(tmp_path / 'cache'))
+    monkeypatch.setattr(bggscrape, 'RESOLUTION_ORDER', [tier for tier in bggscrape.RESOLUTION_ORDER if tier != 'remote'])
+    monkeypatch.setattr(bggscrape, 'TERMINAL_DEBUG', False)
+    monkeypatch.setattr(bggscrape, 'KEEP_PLAY_XML', False)
+    monkeypatch.setattr(bggscrape, 'API_DELAY', 0)
+    monkeypatch.setattr(bggscrape, 'MAX_TOTAL_API_CALLS', 1000)
+    monkeypatch.setattr(bggscrape, 'api_call_count', 0)
+    for name in ['_resolution_cache', '_translation_cache', '_user_partials']:
+        monkeypatch.setattr(bggscrape, name, None)
+    for name in ['_resolution_cache_dirty', '_translation_cache_dirty', '_user_partials_dirty']:
+        monkeypatch.setattr(bggscrape, name, False)
+    monkeypatch.setattr(bggscrape, 'translation_breaker', bggscrape.CircuitBreaker(
+        'Google Translate', bggscrape.TRANSLATION_BREAKER_THRESHOLD, bggscrape.TRANSLATION_BREAKER_COOLDOWN))
+    return bggscrape
+
+@pytest.fixture
+def fake_bgg(monkeypatch):
+    fake = FakeBGG()
+    monkeypatch.setattr(bggscrape.requests, 'get', fake)
+    return fake
+
+def hero_table(hero_results):
+    """Hero results as comparable rows (user lists sorted)"""
+    return sorted((hero['hero_name'], hero['play_count'], hero.get('user_count'), sorted(hero.get('users', [])),
+                   int(hero['status']), hero.get('altered_plays', 0)) for hero in hero_results)
@@ -0,0 +1,39 @@
+"""A crawl stopped by the API call limit and continued with --resume must match one uninterrupted crawl"""
+
+import pytest
+
+import bggscrape
+from conftest import USERS, hero_table
+
+ANALYSES = {
+    'pages': bggscrape.analyze_multiple_users_hero_usage,
+    'stream': bggscrape.analyze_multiple_users_hero_usage_streaming
+}
+
+def crawl(mode, call_limit, checkpoint=None):
+    bggscrape.MAX_TOTAL_API_CALLS = call_limit
+    bggscrape.api_call_count = 0
+    user_ids = checkpoint.user_ids if checkpoint else USERS
+    return ANALYSES[mode](user_ids, max_plays_per_user=150, pages_to_fetch=6, checkpoint=checkpoint)
+
+@pytest.mark.parametrize('mode', ['pages', 'stream'])
+def test_resumed_crawl_matches_uninterrupted_crawl(fake_bgg, mode):
+    uninterrupted = crawl(mode, 1000)
+    assert bggscrape.CrawlCheckpoint.load() is None  # A complete crawl leaves no checkpoint
+
+    fake_bgg.urls.clear()
+    crawl(mode, 2)
+    checkpoint = bggscrape.CrawlCheckpoint.load()
+    assert checkpoint.mode == mode and checkpoint.next_page == 3
+
+    resumed = crawl(mode, 1000, checkpoint)
+    pages = [int(url.rsplit('page=', 1)[1]) for url in fake_bgg.urls]
+    assert pages == [1, 2, 3, 4, 5]  # Pages 1-2 aren't fetched again after the resume
+    assert hero_table(resumed[0]) == hero_table(uninterrupted[0])
+    assert dict(resumed[2]) == dict(uninterrupted[2])
+    assert bggscrape.CrawlCheckpoint.load() is None
+
+def test_stream_checkpoint_is_dropped_when_the_resolver_changes(fake_bgg, monkeypatch):
+    crawl('stream', 2)
+    monkeypatch.setattr(bggscrape, 'RESOLVER_RULE_VERSION', bggscrape.RESOLVER_RULE_VERSION + 1)
+    assert bggscrape.CrawlCheckpoint.load() is None
@@ -0,0 +1,34 @@
+"""Comment parsing: villains are found in every play, heroes only when a fallback needs them"""
+
+import bggscrape
+from conftest import COMMENTS
+
+def commented_plays(comments, color='Spider-Man'):
+    """One play per comment, each with one player of the given color"""
+    plays = ''.join(f'<play id="{i}" date="2025-06-01" userid="101"><item objectid="285774"/>'
+                    f'<comments>{comment}</comments>'
+                    f'<players><player userid="101" color="{color}" win="1"/></players></play>'
+                    for i, comment in enumerate(comments))
+    return bggscrape.parse_plays_page(f'<plays>{plays}</plays>'.encode('utf-8'))
+
+def test_villain_scan_matches_full_parse():
+    comments = COMMENTS + ["Thor x Klaw", "kang the conqueror beat us", "Green Goblin: Mutagen Formula, then Ultron"]
+    for comment in comments:
+        assert bggscrape.parse_comment_villains(comment) == bggscrape.parse_comment_entities(comment)['villains']
+
+def test_comment_heroes_are_parsed_only_for_fallbacks(monkeypatch):
+    parsed = []
+    parse_heroes = bggscrape.parse_heroes_from_comments
+
+    def counting_parse(comments, play_id=None):
+        parsed.append(play_id)
+        return parse_heroes(comments, play_id)
+    monkeypatch.setattr(bggscrape, 'parse_heroes_from_comments', counting_parse)
+
+    _, _, stats = bggscrape.extract_hero_names_from_plays(commented_plays(["Spider-Man vs Rhino", "Hulk vs Klaw"]), report=False)
+    assert parsed == []
+    assert stats['villains'] == {'Rhino': 1, 'Klaw': 1}
+
+    results, _, _ = bggscrape.extract_hero_names_from_plays(commented_plays(["Hulk vs Klaw"], color=''), report=False)
+    assert parsed == [0]
+    assert [hero['hero_name'] for hero in results] == ['Hulk']
@@ -0,0 +1,29 @@
+"""The crawl subcommand's feed poll"""
+
+from collections import Counter
+
+import pytest
+
+import bggscrape
+from conftest import plays_page
+
+def test_feed_poll_tracks_users_and_unseen_plays(fake_bgg):
+    state = bggscrape.load_crawl_state()
+    state['users']['101'] = dict(bggscrape.new_crawl_user(), newest_id=1050)
+
+    bggscrape.poll_crawl_feed(state, now=1000.0)
+
+    plays = bggscrape.parse_plays_page(plays_page(1))
+    assert set(state['users']) == {play.userid for play in plays}
+    assert state['users']['101']['hinted'] == sum(1 for play in plays if play.userid == '101' and play.id > 1050)
+    unseen = Counter(play.userid for play in plays)
+    assert all(state['users'][user]['hinted'] == count for user, count in unseen.items() if user != '101')
+    assert state['feed_synced'] == 1000.0
+    assert fake_bgg.urls == ["https://boardgamegeek.com/xmlapi2/plays?id=285774&page=1"]
+
+def test_failed_feed_poll_leaves_the_state_unsynced(monkeypatch):
+    monkeypatch.setattr(bggscrape, 'safe_api_call', lambda url: None)
+    state = bggscrape.load_crawl_state()
+    with pytest.raises(Exception, match="recent plays feed"):
+        bggscrape.poll_crawl_feed(state, now=1000.0)
+    assert state['feed_synced'] is None and state['users'] == {}
@@ -0,0 +1,28 @@
+"""Extracting users on --jobs worker processes must give the same analysis as extracting them one by one"""
+
+import multiprocessing
+
+import pytest
+
+import bggscrape
+from conftest import USERS, hero_table
+
+pytestmark = pytest.mark.skipif(multiprocessing.get_start_method() != 'fork',
+                                reason="workers inherit the official hero lists through fork")
+
+def analyze(jobs):
+    # Start cold (with the on-disk caches off), so neither run reuses the other's per-user results or resolutions
+    bggscrape._user_partials = None
+    bggscrape._resolution_cache = None
+    bggscrape.api_call_count = 0
+    return bggscrape.analyze_multiple_users_hero_usage(USERS, max_plays_per_user=120, pages_to_fetch=4, jobs=jobs)
+
+def test_jobs_match_sequential_extraction(fake_bgg, monkeypatch, capsys):
+    monkeypatch.setattr(bggscrape, 'RESOLUTION_CACHE_ENABLED', False)
+    sequential = analyze(jobs=1)
+    parallel = analyze(jobs=2)
+
+    assert f"Extracting {len(USERS)} users on 2 worker processes" in capsys.readouterr().out
+    assert hero_table(parallel[0]) == hero_table(sequential[0])
+    assert parallel[1].counts == sequential[1].counts
+    assert dict(parallel[2]) == dict(sequential[2])
@@ -0,0 +1,38 @@
+"""The on-disk color resolution cache is reused only while the resolver fingerprint is unchanged"""
+
+import json
+import os
+
+import bggscrape
+
+def write_resolution_cache(fingerprint, entries):
+    os.makedirs(bggscrape.CACHE_DIR, exist_ok=True)
+    with open(os.path.join(bggscrape.CACHE_DIR, bggscrape.RESOLUTION_CACHE_FILE), 'w', encoding='utf-8') as f:
+        json.dump({'fingerprint': fingerprint, 'entries': entries}, f)
+
+def resolve_cold(color):
+    bggscrape._resolution_cache = None
+    return bggscrape.resolve_hero_color(color)
+
+def test_resolutions_round_trip_through_the_cache():
+    resolution = bggscrape.resolve_hero_color('AH - Thor')
+    bggscrape.save_resolution_cache()
+    bggscrape._resolution_cache = None
+    assert bggscrape.load_resolution_cache() == {'AH - Thor': resolution}
+
+def test_cache_is_used_while_the_fingerprint_matches():
+    stale = dict(bggscrape.resolve_hero_color('Thor'), official_name='Hulk')
+    write_resolution_cache(bggscrape.resolver_fingerprint(), {'Thor': stale})
+    assert resolve_cold('Thor')['official_name'] == 'Hulk'
+
+def test_cache_is_ignored_when_the_resolver_rules_change(monkeypatch):
+    stale = dict(bggscrape.resolve_hero_color('Thor'), official_name='Hulk')
+    write_resolution_cache(bggscrape.resolver_fingerprint(), {'Thor': stale})
+    monkeypatch.setattr(bggscrape, 'RESOLVER_RULE_VERSION', bggscrape.RESOLVER_RULE_VERSION + 1)
+    assert resolve_cold('Thor')['official_name'] == 'Thor'
+
+def test_cache_is_ignored_when_the_hero_list_changes(monkeypatch):
+    stale = dict(bggscrape.resolve_hero_color('Thor'), official_name='Hulk')
+    write_resolution_cache(bggscrape.resolver_fingerprint(), {'Thor': stale})
+    monkeypatch.setattr(bggscrape, 'OFFICIAL_HEROES', bggscrape.OFFICIAL_HEROES + ['Nova'])
+    assert resolve_cold('Thor')['official_name'] == 'Thor'
@@ -0,0 +1,43 @@
+"""The streaming analysis (--stream) must agree with extracting all plays at once"""
+
+import pytest
+
+import bggscrape
+from conftest import USERS, hero_table
+
+def user_plays(userid, colors, first_id):
+    """One play per color for one user, as parsed records"""
+    plays = ''.join(f'<play id="{first_id + i}" date="2025-06-01" userid="{userid}"><item objectid="285774"/>'
+                    f'<players><player userid="{userid}" color="{color}" win="1"/></players></play>'
+                    for i, color in enumerate(colors))
+    return bggscrape.parse_plays_page(f'<plays>{plays}</plays>'.encode('utf-8'))
+
+def test_altered_play_in_later_batch_marks_hero_altered():
+    first_batch = user_plays('101', ['Thor', 'Thor'], 1)
+    second_batch = user_plays('101', ['AH - Thor'], 10)
+    
+    aggregator = bggscrape.HeroUsageAggregator(max_plays_per_user=100)
+    aggregator.add('101', first_batch)
+    aggregator.add('101', second_batch)
+    streamed, _, _ = aggregator.snapshot()
+    
+    extracted, _, _ = bggscrape.extract_hero_names_from_plays(first_batch + second_batch, report=False)
+    thor = next(hero for hero in extracted if hero['hero_name'] == 'Thor')
+    assert thor['is_altered'] and thor['play_count'] == 3
+    
+    streamed_thor = next(hero for hero in streamed if hero['hero_name'] == 'Thor')
+    assert streamed_thor['is_altered']
+    assert streamed_thor['altered_plays'] == 3
+    assert streamed_thor['status'] == thor['status']
+
+@pytest.mark.parametrize('max_plays_per_user', [300, 25])
+def test_streaming_matches_batch_analysis(fake_bgg, monkeypatch, max_plays_per_user):
+    monkeypatch.setattr(bggscrape, 'PIPELINE_BATCH_SIZE', 7)  # Many small per-user batches
+    batch = bggscrape.analyze_multiple_users_hero_usage(USERS, max_plays_per_user=max_plays_per_user, pages_to_fetch=6)
+    streamed = bggscrape.analyze_multiple_users_hero_usage_streaming(USERS, max_plays_per_user=max_plays_per_user, pages_to_fetch=6)
+    
+    assert batch[0]
+    assert hero_table(streamed[0]) == hero_table(batch[0])
+    for key in bggscrape.UserHeroAggregator.STAT_KEYS + ['users_with_plays', 'villains']:
+        assert streamed[2][key] == batch[2][key], key
+    assert +streamed[1].counts == +batch[1].counts
@@ -0,0 +1,103 @@
+"""Circuit breaker and batched prefetching in front of Google Translate"""
+
+import threading
+import time
+
+import bggscrape
+
+def open_breaker(cooldown):
+    breaker = bggscrape.CircuitBreaker('test', failure_threshold=2, cooldown=cooldown)
+    breaker.record_failure()
+    breaker.record_failure()
+    return breaker
+
+def concurrent_allows(breaker, callers=16):
+    """allow() from many threads released at once"""
+    barrier = threading.Barrier(callers)
+    results = []
+    lock = threading.Lock()
+
+    def call():
+        barrier.wait()
+        allowed = breaker.allow()
+        with lock:
+            results.append(allowed)
+
+    threads = [threading.Thread(target=call) for _ in range(callers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+def test_breaker_opens_after_threshold():
+    breaker = open_breaker(cooldown=60)
+    assert not breaker.allow()
+
+def test_half_open_breaker_admits_one_probe():
+    breaker = open_breaker(cooldown=0)
+    assert concurrent_allows(breaker).count(True) == 1
+    assert not breaker.allow()  # Still waiting on the probe
+
+def test_failed_probe_reopens_breaker():
+    breaker = open_breaker(cooldown=0.2)
+    time.sleep(0.2)
+    assert breaker.allow()
+    breaker.record_failure()
+    assert not breaker.allow()
+    time.sleep(0.2)
+    assert breaker.allow()
+
+def test_successful_probe_closes_breaker():
+    breaker = open_breaker(cooldown=0)
+    assert breaker.allow()
+    breaker.record_success()
+    assert concurrent_allows(breaker).count(True) == 16
+
+class SlowTranslator:
+    """Google Translate stand-in taking `seconds` per request; split=False answers a batch with one line"""
+
+    def __init__(self, seconds, split=True):
+        self.seconds = seconds
+        self.split = split
+        self.started = []
+
+    def translate(self, text, dest):
+        self.started.append(time.monotonic())
+        time.sleep(self.seconds)
+        lines = text.split('\n') if self.split else [text.replace('\n', ' ')]
+        
+        class Reply:
+            pass
+        reply = Reply()
+        reply.text = '\n'.join(f"en:{line}" for line in lines)
+        return reply
+
+NAMES = ['测试甲', '测试乙', '测试丙', '测试丁', '测试戊', '测试己']
+
+def use_translator(monkeypatch, translator, batch_size, workers, timeout):
+    monkeypatch.setattr(bggscrape, 'RESOLUTION_ORDER', bggscrape.RESOLUTION_ORDER + ['remote'])
+    monkeypatch.setattr(bggscrape, 'translator', translator)
+    monkeypatch.setattr(bggscrape, 'TRANSLATION_BATCH_SIZE', batch_size)
+    monkeypatch.setattr(bggscrape, 'TRANSLATION_WORKERS', workers)
+    monkeypatch.setattr(bggscrape, 'TRANSLATION_TIMEOUT', timeout)
+    monkeypatch.setattr(bggscrape, 'TRANSLATION_DELAY', 0)
+
+def test_prefetch_keeps_batches_that_finish_after_the_deadline(monkeypatch):
+    translator = SlowTranslator(seconds=0.3)
+    use_translator(monkeypatch, translator, batch_size=3, workers=1, timeout=0.01)
+    assert bggscrape.prefetch_translations(NAMES) == 0  # Deadline (2 rounds x 4 requests x 10ms) passes mid-request
+    time.sleep(0.5)
+    cache = bggscrape.load_translation_cache()
+    assert {name: cache.get(name) for name in NAMES[:3]} == {name: f"en:{name}" for name in NAMES[:3]}
+    assert len(translator.started) == 1  # The second batch never started, so its names aren't asked for twice
+
+def test_batch_fallback_starts_no_request_after_the_deadline(monkeypatch):
+    translator = SlowTranslator(seconds=0.05, split=False)
+    use_translator(monkeypatch, translator, batch_size=6, workers=1, timeout=0.02)
+    start = time.monotonic()
+    bggscrape.prefetch_translations(NAMES)
+    time.sleep(0.3)
+    deadline = start + (1 + 6) * 0.02
+    assert 1 < len(translator.started) < 1 + len(NAMES)
+    assert max(translator.started) <= deadline
@@ -0,0 +1,43 @@
+"""Fetching the feed on --workers processes must give the same analysis as fetching it page by page"""
+
+import multiprocessing
+import sqlite3
+
+import pytest
+
+import bggscrape
+from conftest import USERS, hero_table
+
+pytestmark = pytest.mark.skipif(multiprocessing.get_start_method() != 'fork',
+                                reason="workers inherit the fake BGG API through fork")
+
+def analyze(workers):
+    bggscrape.api_call_count = 0
+    return bggscrape.analyze_multiple_users_hero_usage(USERS, max_plays_per_user=300, pages_to_fetch=6, workers=workers)
+
+def test_workers_match_sequential_fetch(fake_bgg):
+    sequential = analyze(workers=1)
+    sequential_calls = bggscrape.api_call_count
+    parallel = analyze(workers=3)
+
+    assert hero_table(parallel[0]) == hero_table(sequential[0])
+    assert dict(parallel[2]) == dict(sequential[2])
+    # Pages 1-4 have plays and page 5 is empty; page 6 may be fetched before a worker sees that
+    assert sequential_calls == 5
+    assert 5 <= bggscrape.api_call_count <= 6
+
+def test_page_range_tasks_stop_at_the_first_empty_page(fake_bgg):
+    fetched = {}
+    bggscrape.fetch_with_workers([(1, 3), (4, 9)], 1, fetched)
+    assert {page: len(plays) for page, plays in fetched.items()} == {1: 100, 2: 100, 3: 100, 4: 100, 5: 0}
+
+def test_queue_file_from_an_older_schema_is_recreated(tmp_path):
+    path = str(tmp_path / 'queue.sqlite')
+    old = sqlite3.connect(path)
+    old.execute('CREATE TABLE tasks (id INTEGER PRIMARY KEY, kind TEXT NOT NULL, first_page INTEGER NOT NULL)')
+    old.close()
+
+    queue = bggscrape.WorkQueue(path)
+    queue.reset([(1, 2)], 10, 0)
+    assert queue.lease('me')[1:] == (1, 2)
+    queue.close()